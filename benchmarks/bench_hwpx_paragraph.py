@@ -0,0 +1,63 @@
+"""HWPX paragraph assembly benchmark.
+
+Builds synthetic <hp:p> elements with many runs / direct <t> fragments and
+times _parse_paragraph_element on them.
+
+Usage:
+    uv run python benchmarks/bench_hwpx_paragraph.py [--runs 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from xml.etree import ElementTree as ET
+
+from ureca_document_parser.hwpx.parser import (
+    HWPML_NAMESPACES,
+    _parse_paragraph_element,
+    _TagTable,
+)
+
+HP = HWPML_NAMESPACES["hp"]
+
+
+def _run_paragraph(n_runs: int) -> ET.Element:
+    """서식이 run마다 바뀌는 문단: <run><t>..<tab/>..</t></run> × n_runs."""
+    runs = "".join(
+        f'<hp:run charPrIDRef="{i % 7}"><hp:t>조각{i}<hp:tab/>끝</hp:t></hp:run>'
+        for i in range(n_runs)
+    )
+    return ET.fromstring(f'<hp:p xmlns:hp="{HP}">{runs}</hp:p>')
+
+
+def _direct_t_paragraph(n_runs: int) -> ET.Element:
+    """run 없이 직접 <t>가 나열된 변형 (중복 제거 경로)."""
+    ts = "".join(f"<hp:t>조각{i}</hp:t>" for i in range(n_runs))
+    return ET.fromstring(f'<hp:p xmlns:hp="{HP}">{ts}</hp:p>')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tags = _TagTable()
+    for label, build in (
+        ("runs", _run_paragraph),
+        ("direct <t>", _direct_t_paragraph),
+    ):
+        p_elem = build(args.runs)
+        best = min(
+            timeit.repeat(
+                lambda p_elem=p_elem: _parse_paragraph_element(p_elem, tags),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(f"{label:>12}: {args.runs:,} fragments  {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Markdown writer dispatch benchmark on a synthetic million-element Document.
+
+Most elements are short paragraphs, mixed with headings, list runs, links and
+rules, so per-element dispatch dominates rendering time.
+
+Usage:
+    uv run python benchmarks/bench_markdown_dispatch.py [--elements 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import timeit
+
+from ureca_document_parser.models import (
+    Document,
+    DocumentElement,
+    HorizontalRule,
+    Link,
+    ListItem,
+    Paragraph,
+)
+from ureca_document_parser.writers.markdown import to_markdown, write_markdown
+
+
+def _synthetic_document(n_elements: int) -> Document:
+    elements: list[DocumentElement] = []
+    for i in range(n_elements):
+        kind = i % 20
+        if kind == 0:
+            elements.append(Paragraph(text=f"제목 {i}", heading_level=2))
+        elif kind < 4:
+            elements.append(ListItem(text=f"항목 {i}", ordered=kind == 3))
+        elif kind == 4:
+            elements.append(Link(text=f"링크 {i}", url=f"https://example.com/{i}"))
+        elif kind == 5:
+            elements.append(HorizontalRule())
+        else:
+            elements.append(Paragraph(text=f"문단 {i}"))
+    return Document(elements=elements)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--elements", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    doc = _synthetic_document(args.elements)
+    for label, render in (
+        ("to_markdown", lambda: to_markdown(doc)),
+        ("write_markdown", lambda: write_markdown(doc, io.StringIO())),
+    ):
+        best = min(timeit.repeat(render, number=1, repeat=args.repeat))
+        print(f"{label:>15}: {args.elements:,} elements  {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
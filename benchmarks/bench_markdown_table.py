@@ -0,0 +1,62 @@
+"""Markdown table rendering benchmark: padded (default) vs compact.
+
+Builds a wide synthetic table where one column holds a long description, so
+padding every row to that width dominates the padded output, then reports
+output size and render time for both modes.
+
+Usage:
+    uv run python benchmarks/bench_markdown_table.py [--rows 2000 --cols 12]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from ureca_document_parser.models import (
+    Document,
+    Paragraph,
+    Table,
+    TableCell,
+    TableRow,
+)
+from ureca_document_parser.writers.markdown import to_markdown
+
+
+def _budget_table(n_rows: int, n_cols: int, long_cell: int) -> Table:
+    """예산표 형태: 숫자 열 여러 개 + 가끔 긴 비고 열."""
+    rows = []
+    for r in range(n_rows):
+        cells = [
+            TableCell(content=[Paragraph(text=f"{r * n_cols + c:,}")])
+            for c in range(n_cols - 1)
+        ]
+        note = "비고 " * (long_cell // 3) if r % 50 == 0 else f"항목 {r}"
+        cells.append(TableCell(content=[Paragraph(text=note)]))
+        rows.append(TableRow(cells=cells))
+    return Table(rows=rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2_000)
+    parser.add_argument("--cols", type=int, default=12)
+    parser.add_argument("--long-cell", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    doc = Document(elements=[_budget_table(args.rows, args.cols, args.long_cell)])
+    for label, compact in (("padded", False), ("compact", True)):
+        size = len(to_markdown(doc, compact_tables=compact).encode("utf-8"))
+        best = min(
+            timeit.repeat(
+                lambda compact=compact: to_markdown(doc, compact_tables=compact),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(f"{label:>8}: {size / 1024:10,.1f} KiB  {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
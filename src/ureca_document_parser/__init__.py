@@ -21,7 +21,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .models import ParseError
-from .registry import get_registry
+from .registry import get_registry, write_with
 
 if TYPE_CHECKING:
     from langchain_core.documents import Document as LCDocument
@@ -51,7 +51,9 @@ def convert(
         input_path: 변환할 입력 파일 경로
         output_path: 출력 파일 경로 (None이면 반환만, chunks=True면 무시됨)
         format: 출력 포맷 이름 (기본값: "markdown")
-        chunks: True면 LangChain Document 청크로 반환 (requires langchain extra)
+        chunks: True면 LangChain Document 청크로 반환 (requires langchain extra).
+            Markdown 출력이면 청크 메타데이터에 start_index, element_start,
+            element_end (Document.elements 위치), headings (제목 경로)가 붙음
         chunk_size: 청크 크기 (chunks=True일 때만 사용, 기본값: 1000)
         chunk_overlap: 청크 오버랩 (chunks=True일 때만 사용, 기본값: 200)
 
@@ -88,12 +90,19 @@ def convert(
                 "Install it with: pip install ureca_document_parser[langchain]"
             ) from None
 
-        md = registry.write(doc, format)
+        writer = registry.get_writer(format)
+        write_with_source_map = getattr(writer, "write_with_source_map", None)
+        if write_with_source_map is None:
+            md, source_map = writer.write(doc), None
+        else:
+            md, source_map = write_with_source_map(doc)
+
         splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
+            add_start_index=source_map is not None,
         )
-        return splitter.create_documents(
+        documents = splitter.create_documents(
             [md],
             metadatas=[
                 {
@@ -102,16 +111,27 @@ def convert(
                 }
             ],
         )
+
+        if source_map is not None:
+            # 청크가 담고 있는 요소 범위와 제목 경로를 메타데이터에 기록
+            for chunk in documents:
+                start = chunk.metadata["start_index"]
+                covered = source_map.overlapping(start, start + len(chunk.page_content))
+                if not covered:
+                    continue
+                chunk.metadata["element_start"] = covered[0].index
+                chunk.metadata["element_end"] = covered[-1].index
+                chunk.metadata["headings"] = " > ".join(covered[0].headings)
+        return documents
+    elif output_path:
+        # 파일에 블록 단위로 바로 저장 (전체 문자열을 만들지 않음).
+        # 알 수 없는 포맷이면 빈 파일을 만들기 전에 실패한다
+        writer = registry.get_writer(format)
+        out = Path(output_path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        with out.open("w", encoding="utf-8") as f:
+            write_with(writer, doc, f)
+        return None
     else:
-        # Markdown 문자열
-        result = registry.write(doc, format)
-
-        if output_path:
-            # 파일에 저장
-            out = Path(output_path)
-            out.parent.mkdir(parents=True, exist_ok=True)
-            out.write_text(result, encoding="utf-8")
-            return None
-        else:
-            # 문자열 반환
-            return result
+        # 문자열 반환
+        return registry.write(doc, format)
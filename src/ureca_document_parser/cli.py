@@ -13,7 +13,7 @@ import sys
 from pathlib import Path
 
 from .models import ParseError
-from .registry import get_registry
+from .registry import get_registry, write_with
 
 
 def main() -> None:
@@ -68,15 +68,20 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        result = registry.write(doc, args.format)
+        if args.output:
+            # 출력 파일에는 블록 단위로 바로 기록 (포맷 확인은 파일 생성 전에)
+            writer = registry.get_writer(args.format)
+            output_path = Path(args.output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with output_path.open("w", encoding="utf-8") as f:
+                write_with(writer, doc, f)
+        else:
+            result = registry.write(doc, args.format)
     except (ValueError, ParseError) as e:
         print(f"오류: {e}", file=sys.stderr)
         sys.exit(1)
 
     if args.output:
-        output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(result, encoding="utf-8")
         print(f"변환 완료: {output_path}")
     else:
         print(result)
@@ -1,12 +1,24 @@
 from .parser import HwpParser
 from .records import Record, RecordCursor
-from .text import CharInfo, extract_text, has_table_marker, read_bstr, scan_para_chars
+from .text import (
+    CharInfo,
+    ParaControl,
+    ParaText,
+    decode_para_text,
+    extract_text,
+    has_table_marker,
+    read_bstr,
+    scan_para_chars,
+)
 
 __all__ = [
     "CharInfo",
     "HwpParser",
+    "ParaControl",
+    "ParaText",
     "Record",
     "RecordCursor",
+    "decode_para_text",
     "extract_text",
     "has_table_marker",
     "read_bstr",
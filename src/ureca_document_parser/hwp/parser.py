@@ -5,74 +5,341 @@ Parses the OLE2-based HWP binary format according to Hancom's
 
 Pipeline:
     OLE2 file → decompress sections → parse binary records → extract elements → Document
+
+BodyText sections are streamed: decompression, record windowing and element
+extraction run as a generator pipeline, so memory stays bounded per window.
 """
 
 from __future__ import annotations
 
+import hashlib
+import io
 import struct
+import threading
 import zlib
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import Executor
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import BinaryIO
 
 import olefile
 
-from ..models import Document, Metadata, Paragraph, ParseError, Table
+from ..models import (
+    BinaryData,
+    Document,
+    DocumentElement,
+    Image,
+    Metadata,
+    Paragraph,
+    ParseError,
+    Table,
+)
 from ..styles import heading_level_from_style
 from .records import (
+    CTRL_GSO_ID,
+    CTRL_TABLE_ID,
+    HWPTAG_BIN_DATA,
+    HWPTAG_CTRL_HEADER,
+    HWPTAG_LIST_HEADER,
     HWPTAG_PARA_HEADER,
     HWPTAG_PARA_TEXT,
+    HWPTAG_SHAPE_COMPONENT_PICTURE,
     HWPTAG_STYLE,
-    RecordCursor,
-    parse_records,
+    Record,
+    RecordTable,
+    iter_decompressed,
+    iter_record_windows,
+    iter_records,
 )
-from .tables import try_parse_table
-from .text import extract_text, has_table_marker, read_bstr
-
+from .tables import build_table, read_ctrl_id
+from .text import decode_para_text, read_bstr
 
 # ---------------------------------------------------------------------------
 # FileHeader utilities
 # ---------------------------------------------------------------------------
+FILE_HEADER_VERSION_OFFSET = 32
+FILE_HEADER_FLAGS_OFFSET = 36
+FLAG_COMPRESSED = 0x01
+FLAG_ENCRYPTED = 0x02
+FLAG_DISTRIBUTION = 0x04
+
+
 def _check_compressed(ole: olefile.OleFileIO) -> bool:
     """HWP 문서 본문이 압축되어 있는지 확인한다."""
     header = ole.openstream("FileHeader").read()
-    if len(header) > 36:
-        return bool(header[36] & 0x01)
+    if len(header) > FILE_HEADER_FLAGS_OFFSET:
+        return bool(header[FILE_HEADER_FLAGS_OFFSET] & FLAG_COMPRESSED)
     return False
 
 
+def _file_header_info(ole: olefile.OleFileIO) -> dict[str, str]:
+    """FileHeader에서 HWP 버전과 문서 속성 플래그를 읽는다."""
+    header = ole.openstream("FileHeader").read()
+    if len(header) < FILE_HEADER_FLAGS_OFFSET + 4:
+        return {}
+    version = struct.unpack_from("<I", header, FILE_HEADER_VERSION_OFFSET)[0]
+    flags = struct.unpack_from("<I", header, FILE_HEADER_FLAGS_OFFSET)[0]
+    return {
+        "hwp_version": ".".join(str((version >> s) & 0xFF) for s in (24, 16, 8, 0)),
+        "compressed": str(bool(flags & FLAG_COMPRESSED)).lower(),
+        "encrypted": str(bool(flags & FLAG_ENCRYPTED)).lower(),
+        "distribution": str(bool(flags & FLAG_DISTRIBUTION)).lower(),
+    }
+
+
+# ---------------------------------------------------------------------------
+# HwpSummaryInformation / PrvText — lightweight metadata and preview
+# ---------------------------------------------------------------------------
+SUMMARY_STREAM = "\x05HwpSummaryInformation"
+
+# OLE property set type codes
+VT_I4 = 0x03
+VT_LPSTR = 0x1E
+VT_LPWSTR = 0x1F
+VT_FILETIME = 0x40
+
+# Summary property ID → Metadata.extra key (title/author는 Metadata 필드로 이동)
+SUMMARY_PROPERTY_KEYS: dict[int, str] = {
+    2: "title",
+    3: "subject",
+    4: "author",
+    5: "keywords",
+    6: "comments",
+    8: "last_author",
+    12: "created",
+    13: "modified",
+}
+
+_FILETIME_EPOCH = datetime(1601, 1, 1, tzinfo=UTC)
+
+
+def _parse_property_set(data: bytes) -> dict[int, str]:
+    """OLE property set 스트림의 첫 섹션에서 문자열/정수/날짜 속성을 읽는다.
+
+    HWP는 VT_LPWSTR 길이를 문자 수로 저장하므로 olefile.getproperties 대신
+    직접 파싱한다. 해석할 수 없는 속성은 건너뛴다.
+    """
+    props: dict[int, str] = {}
+    if len(data) < 48:
+        return props
+    section = struct.unpack_from("<I", data, 44)[0]
+    if section + 8 > len(data):
+        return props
+    n_props = struct.unpack_from("<I", data, section + 4)[0]
+    for i in range(n_props):
+        entry = section + 8 + i * 8
+        if entry + 8 > len(data):
+            break
+        pid, prop_offset = struct.unpack_from("<II", data, entry)
+        pos = section + prop_offset
+        if pos + 8 > len(data):
+            continue
+        vtype = struct.unpack_from("<I", data, pos)[0] & 0xFFFF
+        if vtype == VT_LPWSTR:
+            count = struct.unpack_from("<I", data, pos + 4)[0]
+            raw = data[pos + 8 : pos + 8 + count * 2]
+            props[pid] = raw.decode("utf-16-le", errors="ignore").rstrip("\x00")
+        elif vtype == VT_LPSTR:
+            count = struct.unpack_from("<I", data, pos + 4)[0]
+            raw = data[pos + 8 : pos + 8 + count]
+            props[pid] = raw.decode("cp949", errors="ignore").rstrip("\x00")
+        elif vtype == VT_I4:
+            props[pid] = str(struct.unpack_from("<i", data, pos + 4)[0])
+        elif vtype == VT_FILETIME and pos + 12 <= len(data):
+            ticks = struct.unpack_from("<Q", data, pos + 4)[0]
+            if ticks:
+                stamp = _FILETIME_EPOCH + timedelta(microseconds=ticks // 10)
+                props[pid] = stamp.isoformat()
+    return props
+
+
+def _read_summary_info(ole: olefile.OleFileIO) -> dict[str, str]:
+    """HwpSummaryInformation에서 제목, 작성자 등 요약 정보를 읽는다."""
+    if not ole.exists(SUMMARY_STREAM):
+        return {}
+    props = _parse_property_set(ole.openstream(SUMMARY_STREAM).read())
+    return {
+        key: props[pid]
+        for pid, key in SUMMARY_PROPERTY_KEYS.items()
+        if props.get(pid, "").strip()
+    }
+
+
+def _read_metadata(ole: olefile.OleFileIO, path: Path) -> Metadata:
+    """FileHeader와 HwpSummaryInformation으로 Metadata를 채운다."""
+    extra = _file_header_info(ole)
+    extra.update(_read_summary_info(ole))
+    title = extra.pop("title", "") or path.stem
+    author = extra.pop("author", "")
+    return Metadata(title=title, author=author, source_format="hwp", extra=extra)
+
+
+def _preview_paragraphs(ole: olefile.OleFileIO) -> list[DocumentElement]:
+    """PrvText(미리보기 텍스트) 스트림을 줄 단위 Paragraph로 변환한다."""
+    if not ole.exists("PrvText"):
+        return []
+    text = ole.openstream("PrvText").read().decode("utf-16-le", errors="ignore")
+    paragraphs: list[DocumentElement] = []
+    for line in text.split("\r\n"):
+        stripped = line.strip()
+        if stripped:
+            paragraphs.append(Paragraph(text=stripped))
+    return paragraphs
+
+
 # ---------------------------------------------------------------------------
-# DocInfo stream — style table extraction
+# DocInfo stream — style table and BinData list
 # ---------------------------------------------------------------------------
-def _parse_styles(ole: olefile.OleFileIO, is_compressed: bool) -> list[int]:
-    """DocInfo 스트림에서 스타일 테이블을 파싱하여 heading_level 매핑을 반환.
+DOCINFO_CACHE_SIZE = 64  # 캐시할 DocInfo 테이블 수 (기관 템플릿 재사용 대비)
+
+# BIN_DATA 레코드 요약: (bin id, 확장자, 속성)
+type _BinEntry = tuple[int, str, int]
+# (style_id → heading_level, BIN_DATA 항목)
+type _DocInfoTables = tuple[tuple[int, ...], tuple[_BinEntry, ...]]
+
+_docinfo_cache: OrderedDict[bytes, _DocInfoTables] = OrderedDict()
+_docinfo_cache_lock = threading.Lock()
 
-    Returns a list where index == style_id, value == heading_level (0 = normal).
+
+def _parse_docinfo(ole: olefile.OleFileIO, is_compressed: bool) -> _DocInfoTables:
+    """DocInfo 스트림에서 스타일 테이블과 BIN_DATA 항목을 읽는다.
+
+    스타일 테이블은 index == style_id, value == heading_level (0 = normal)인
+    튜플이다. 결과는 DocInfo 내용 해시를 키로 LRU 캐시되므로, 같은 템플릿을
+    쓰는 문서는 압축 해제와 레코드 파싱을 건너뛴다.
     """
     if not ole.exists("DocInfo"):
-        return []
+        return (), ()
 
     raw = ole.openstream("DocInfo").read()
+    key = hashlib.blake2b(raw, digest_size=16).digest() + bytes([is_compressed])
+    with _docinfo_cache_lock:
+        cached = _docinfo_cache.get(key)
+        if cached is not None:
+            _docinfo_cache.move_to_end(key)
+            return cached
+
+    tables = _read_docinfo_tables(raw, is_compressed)
+    with _docinfo_cache_lock:
+        _docinfo_cache[key] = tables
+        if len(_docinfo_cache) > DOCINFO_CACHE_SIZE:
+            _docinfo_cache.popitem(last=False)
+    return tables
+
+
+def _read_docinfo_tables(raw: bytes, is_compressed: bool) -> _DocInfoTables:
+    """DocInfo 원본 바이트를 한 번 훑어 스타일 테이블과 BIN_DATA 항목을 만든다."""
     if is_compressed:
         try:
             raw = zlib.decompress(raw, -15)
         except zlib.error:
-            return []
+            return (), ()
 
-    records = parse_records(raw)
+    # 글꼴·글자 모양·문단 모양 등은 페이로드를 건너뛰고 두 종류만 읽는다
     style_levels: list[int] = []
-    for rec in records:
-        if rec.tag != HWPTAG_STYLE:
+    bin_entries: list[_BinEntry] = []
+    for rec in iter_records(raw, tags={HWPTAG_STYLE, HWPTAG_BIN_DATA}):
+        data = rec.data
+        if rec.tag == HWPTAG_STYLE:
+            local_name, offset = read_bstr(data, 0)
+            english_name, _ = read_bstr(data, offset)
+            level = heading_level_from_style(local_name) or heading_level_from_style(
+                english_name
+            )
+            style_levels.append(level)
+        elif len(data) >= 4:
+            attr, bin_id = struct.unpack_from("<HH", data, 0)
+            if attr & BIN_DATA_TYPE_MASK == BIN_DATA_TYPE_EMBEDDING:
+                extension, _ = read_bstr(data, 4)
+                bin_entries.append((bin_id, extension, attr))
+
+    return tuple(style_levels), tuple(bin_entries)
+
+
+# ---------------------------------------------------------------------------
+# BinData — embedded images
+# ---------------------------------------------------------------------------
+BIN_DATA_TYPE_MASK = 0x000F
+BIN_DATA_TYPE_EMBEDDING = 1  # BinData/BINxxxx.ext 스트림에 저장된 항목
+BIN_DATA_COMPRESS_SHIFT = 4
+BIN_DATA_COMPRESS_DEFAULT = 0  # FileHeader 압축 플래그를 따름
+BIN_DATA_COMPRESS_ON = 1
+PICTURE_BIN_ID_OFFSET = 71  # SHAPE_COMPONENT_PICTURE: 테두리/좌표/자르기/여백/밝기 뒤
+GSO_DESCRIPTION_OFFSET = 44  # gso CTRL_HEADER: 개체 공통 속성 뒤의 설명문 BSTR
+
+
+def _read_bin_stream(source: str, name: str) -> bytes:
+    """BinData 스트림을 그대로 읽는다 (BinaryData loader)."""
+    with olefile.OleFileIO(source) as ole:
+        return ole.openstream(name).read()
+
+
+def _read_deflated_bin_stream(source: str, name: str) -> bytes:
+    """압축된 BinData 스트림을 읽어 푼다 (BinaryData loader)."""
+    raw = _read_bin_stream(source, name)
+    try:
+        return zlib.decompress(raw, -15)
+    except zlib.error:
+        return raw
+
+
+def _read_bin_items(
+    ole: olefile.OleFileIO,
+    source: str,
+    is_compressed: bool,
+    bin_entries: Sequence[_BinEntry],
+) -> dict[int, BinaryData]:
+    """DocInfo의 BIN_DATA 항목에서 bin id → BinaryData 매핑을 만든다.
+
+    스트림 내용은 읽지 않고 이름과 로더만 기록한다. 여러 그림이 같은 bin id를
+    참조하면 같은 BinaryData를 공유한다. BinData 저장소가 없으면 빈 dict.
+    """
+    if not bin_entries or not ole.exists("BinData"):
+        return {}
+
+    items: dict[int, BinaryData] = {}
+    for bin_id, extension, attr in bin_entries:
+        name = f"BinData/BIN{bin_id:04X}.{extension}"
+        if not ole.exists(name):
             continue
-        local_name, offset = read_bstr(rec.data, 0)
-        english_name, _ = read_bstr(rec.data, offset)
-        level = heading_level_from_style(local_name) or heading_level_from_style(
-            english_name
+        compress = (attr >> BIN_DATA_COMPRESS_SHIFT) & 0x3
+        deflated = compress == BIN_DATA_COMPRESS_ON or (
+            compress == BIN_DATA_COMPRESS_DEFAULT and is_compressed
         )
-        style_levels.append(level)
+        loader = _read_deflated_bin_stream if deflated else _read_bin_stream
+        items[bin_id] = BinaryData(source=source, name=name, loader=loader)
+    return items
 
-    return style_levels
 
+def _read_picture(
+    records: RecordTable, ctrl_index: int, binaries: Mapping[int, BinaryData]
+) -> Image | None:
+    """gso CTRL_HEADER의 개체 요소에서 그림을 찾아 Image로 만든다 (도형이면 None).
 
-def _read_para_style_id(data: bytes) -> int:
+    글상자 내용(LIST_HEADER 이후의 문단)은 찾지 않는다. 그 안의 그림은 자기
+    gso 컨트롤이 따로 있으므로, 여기서 세면 같은 그림이 두 번 나온다.
+    """
+    end = records.subtree_end(ctrl_index)
+    text_box = records.find_next(HWPTAG_LIST_HEADER, ctrl_index + 1, end)
+    pic = records.find_next(HWPTAG_SHAPE_COMPONENT_PICTURE, ctrl_index + 1, text_box)
+    if pic == text_box:
+        return None
+    data = records.data(pic)
+    if len(data) < PICTURE_BIN_ID_OFFSET + 2:
+        return None
+    binary = binaries.get(struct.unpack_from("<H", data, PICTURE_BIN_ID_OFFSET)[0])
+    if binary is None:
+        return None
+    alt_text, _ = read_bstr(records.data(ctrl_index), GSO_DESCRIPTION_OFFSET)
+    return Image(alt_text=alt_text.strip(), source=binary.name, binary=binary)
+
+
+_SCAN_TAGS = (HWPTAG_PARA_HEADER, HWPTAG_PARA_TEXT, HWPTAG_CTRL_HEADER)
+
+
+def _read_para_style_id(data: bytes | memoryview) -> int:
     """HWPTAG_PARA_HEADER 데이터에서 style_id(UINT16, offset 4)를 읽는다."""
     if len(data) >= 6:
         return struct.unpack_from("<H", data, 4)[0]
@@ -141,66 +408,143 @@ def _try_extract_section_heading(table: Table) -> Paragraph | None:
 # ---------------------------------------------------------------------------
 # Element extraction
 # ---------------------------------------------------------------------------
+def _append_table(elements: list[Paragraph | Table | Image], table: Table) -> None:
+    """최상위 표를 섹션 헤더/단일 셀 규칙에 따라 요소 목록에 추가한다."""
+    # 섹션 헤더 테이블 감지: [번호 | 빈칸 | 제목 | 빈칸] + 빈 행
+    heading = _try_extract_section_heading(table)
+    if heading:
+        elements.append(heading)
+    elif len(table.rows) == 1 and len(table.rows[0].cells) == 1:
+        cell = table.rows[0].cells[0]
+        for item in cell.content:
+            if isinstance(item, Paragraph) and item.text.strip():
+                elements.append(Paragraph(text=item.text.strip()))
+            elif isinstance(item, Table):
+                elements.append(item)
+    else:
+        elements.append(table)
+
+
 def _extract_elements(
-    records: list, style_levels: list[int] | None = None
-) -> list[Paragraph | Table]:
-    """레코드 시퀀스에서 문서 요소(Paragraph, Table)를 추출한다."""
-    elements: list[Paragraph | Table] = []
-    cursor = RecordCursor(records)
+    records: RecordTable | list[Record],
+    style_levels: Sequence[int] | None = None,
+    binaries: Mapping[int, BinaryData] | None = None,
+) -> list[Paragraph | Table | Image]:
+    """레코드 시퀀스에서 문서 요소(Paragraph, Table, Image)를 추출한다.
+
+    PARA_HEADER / PARA_TEXT / CTRL_HEADER 위치 인덱스로 그 외 레코드는 건너뛰고,
+    표는 CTRL_HEADER 서브트리 전체를 build_table로 한 번에 소비한다. 그림은
+    binaries(bin id → BinaryData)가 주어졌을 때만 Image로 만든다.
+    """
+    if not isinstance(records, RecordTable):
+        records = RecordTable.from_records(records)
+    elements: list[Paragraph | Table | Image] = []
     current_heading_level = 0
+    n_records = len(records)
+    pos = 0
 
-    while cursor.has_next():
-        rec = cursor.peek()
-        if rec is None:
+    while True:
+        pos = records.find_next_of(_SCAN_TAGS, pos)
+        if pos == n_records:
             break
+        tag = records.tags[pos]
+        data = records.data(pos)
 
-        if rec.tag == HWPTAG_PARA_HEADER:
+        if tag == HWPTAG_PARA_HEADER:
             current_heading_level = 0
             if style_levels:
-                sid = _read_para_style_id(rec.data)
+                sid = _read_para_style_id(data)
                 if 0 <= sid < len(style_levels):
                     current_heading_level = style_levels[sid]
-            cursor.advance()
-            continue
 
-        if rec.tag == HWPTAG_PARA_TEXT and has_table_marker(rec.data):
-            para_level = rec.level
-            cursor.advance()
-            table = try_parse_table(cursor, para_level)
+        elif tag == HWPTAG_PARA_TEXT:
+            para = decode_para_text(data)
+            # 표를 담은 문단의 텍스트 대신 뒤따르는 표 CTRL_HEADER를 사용
+            if not any(ctrl.kind == "table" for ctrl in para.controls):
+                stripped = para.text.strip()
+                if stripped:
+                    elements.append(
+                        Paragraph(text=stripped, heading_level=current_heading_level)
+                    )
+
+        elif (ctrl_id := read_ctrl_id(data)) == CTRL_TABLE_ID:
+            table = build_table(records, pos)
+            pos = records.subtree_end(pos)
             if table and table.rows:
-                # 섹션 헤더 테이블 감지: [번호 | 빈칸 | 제목 | 빈칸] + 빈 행
-                heading = _try_extract_section_heading(table)
-                if heading:
-                    elements.append(heading)
-                elif len(table.rows) == 1 and len(table.rows[0].cells) == 1:
-                    cell = table.rows[0].cells[0]
-                    for item in cell.content:
-                        if isinstance(item, Paragraph) and item.text.strip():
-                            elements.append(Paragraph(text=item.text.strip()))
-                        elif isinstance(item, Table):
-                            elements.append(item)
-                else:
-                    elements.append(table)
-                continue
-
-        if rec.tag == HWPTAG_PARA_TEXT:
-            text = extract_text(rec.data)
-            stripped = text.strip()
-            if stripped:
-                elements.append(
-                    Paragraph(text=stripped, heading_level=current_heading_level)
-                )
+                _append_table(elements, table)
+            continue
+
+        elif ctrl_id == CTRL_GSO_ID and binaries:
+            # 글상자 문단은 그대로 이어서 읽도록 서브트리는 건너뛰지 않는다
+            image = _read_picture(records, pos, binaries)
+            if image is not None:
+                elements.append(image)
 
-        cursor.advance()
+        pos += 1
 
     return elements
 
 
+def _iter_section_elements(
+    stream: BinaryIO,
+    is_compressed: bool,
+    style_levels: Sequence[int] | None = None,
+    binaries: Mapping[int, BinaryData] | None = None,
+) -> Iterator[Paragraph | Table | Image]:
+    """BodyText 섹션 스트림을 점진적으로 풀면서 문서 요소를 yield한다.
+
+    압축 해제 → 레코드 윈도 → 요소 추출이 파이프라인으로 이어지므로 섹션 전체의
+    압축 해제 결과나 레코드 목록을 한꺼번에 메모리에 두지 않는다.
+    """
+    chunks = iter_decompressed(stream, compressed=is_compressed)
+    for window in iter_record_windows(chunks):
+        yield from _extract_elements(window, style_levels, binaries)
+
+
+def _parse_section(
+    raw: bytes,
+    is_compressed: bool,
+    style_levels: Sequence[int] | None = None,
+    binaries: Mapping[int, BinaryData] | None = None,
+) -> list[Paragraph | Table | Image]:
+    """섹션 스트림 바이트 하나를 파싱한다 (executor 작업 단위, pickle 가능)."""
+    stream = io.BytesIO(raw)
+    return list(_iter_section_elements(stream, is_compressed, style_levels, binaries))
+
+
+def _section_stream_names(ole: olefile.OleFileIO) -> list[str]:
+    """BodyText/Section0..N 스트림 이름을 순서대로 반환한다."""
+    names: list[str] = []
+    while ole.exists(f"BodyText/Section{len(names)}"):
+        names.append(f"BodyText/Section{len(names)}")
+    return names
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
-def parse_hwp(filepath: str | Path) -> Document:
-    """HWP v5 바이너리 파일을 파싱하여 Document를 반환한다."""
+def parse_hwp(
+    filepath: str | Path,
+    *,
+    executor: Executor | None = None,
+    preview: bool = False,
+) -> Document:
+    """HWP v5 바이너리 파일을 파싱하여 Document를 반환한다.
+
+    Args:
+        filepath: HWP 파일 경로
+        preview: True면 FileHeader, HwpSummaryInformation, PrvText만 읽는
+            미리보기 모드로 동작한다. BodyText와 DocInfo는 압축 해제하지 않으며,
+            메타데이터와 첫 페이지 분량의 미리보기 텍스트만 담긴 Document를
+            반환한다 (대량 문서 분류/색인용).
+        executor: 지정하면 섹션별 압축 해제와 요소 추출을 이 executor에서 동시에
+            실행하고 결과를 섹션 순서대로 합친다. zlib은 GIL을 해제하므로
+            ThreadPoolExecutor도 효과가 있고, 순수 Python 레코드/텍스트 처리까지
+            병렬화하려면 ProcessPoolExecutor를 사용한다.
+
+    본문 최상위의 그림은 Image로 추출된다. 이미지 바이트는 파싱 중에 읽지 않고
+    ``Image.read()``/``Image.binary``로 접근할 때 BinData 스트림에서 읽는다.
+    """
     path = Path(filepath)
     if not path.exists():
         raise ParseError(f"파일을 찾을 수 없습니다: {path}")
@@ -209,32 +553,44 @@ def parse_hwp(filepath: str | Path) -> Document:
     except Exception as e:
         raise ParseError(f"유효한 HWP 파일이 아닙니다: {path}") from e
     with ole:
-        is_compressed = _check_compressed(ole)
-        style_levels = _parse_styles(ole, is_compressed)
-        doc = Document(metadata=Metadata(source_format="hwp"))
-
-        section_idx = 0
-        while True:
-            stream_name = f"BodyText/Section{section_idx}"
-            if not ole.exists(stream_name):
-                break
+        metadata = _read_metadata(ole, path)
+        if preview:
+            return Document(elements=_preview_paragraphs(ole), metadata=metadata)
 
-            raw = ole.openstream(stream_name).read()
-            if is_compressed:
-                raw = zlib.decompress(raw, -15)
-
-            records = parse_records(raw)
-            elements = _extract_elements(records, style_levels)
-            doc.elements.extend(elements)
-            section_idx += 1
+        is_compressed = _check_compressed(ole)
+        style_levels, bin_entries = _parse_docinfo(ole, is_compressed)
+        binaries = _read_bin_items(
+            ole, str(path.absolute()), is_compressed, bin_entries
+        )
+        doc = Document(metadata=metadata)
+        stream_names = _section_stream_names(ole)
+
+        if executor is None:
+            for stream_name in stream_names:
+                stream = ole.openstream(stream_name)
+                doc.elements.extend(
+                    _iter_section_elements(
+                        stream, is_compressed, style_levels, binaries
+                    )
+                )
+        else:
+            # OLE 스트림 읽기는 현재 스레드에서, 압축 해제와 요소 추출은 executor에서
+            futures = [
+                executor.submit(
+                    _parse_section,
+                    ole.openstream(stream_name).read(),
+                    is_compressed,
+                    style_levels,
+                    binaries,
+                )
+                for stream_name in stream_names
+            ]
+            for future in futures:
+                doc.elements.extend(future.result())
 
         # 폴백: BodyText에서 추출 실패 시 PrvText 사용
-        if not doc.elements and ole.exists("PrvText"):
-            text = ole.openstream("PrvText").read().decode("utf-16-le", errors="ignore")
-            for line in text.split("\r\n"):
-                stripped = line.strip()
-                if stripped:
-                    doc.elements.append(Paragraph(text=stripped))
+        if not doc.elements:
+            doc.elements.extend(_preview_paragraphs(ole))
 
         return doc
 
@@ -247,5 +603,10 @@ class HwpParser:
         return [".hwp"]
 
     @staticmethod
-    def parse(filepath: Path | str) -> Document:
-        return parse_hwp(filepath)
+    def parse(
+        filepath: Path | str,
+        *,
+        executor: Executor | None = None,
+        preview: bool = False,
+    ) -> Document:
+        return parse_hwp(filepath, executor=executor, preview=preview)
@@ -8,7 +8,12 @@ If size == 0xFFF (EXTENDED_SIZE_SENTINEL), the next 4 bytes hold the real size.
 from __future__ import annotations
 
 import struct
+import zlib
+from array import array
+from bisect import bisect_left
+from collections.abc import Container, Iterable, Iterator
 from dataclasses import dataclass
+from typing import BinaryIO
 
 # ---------------------------------------------------------------------------
 # Record header bit layout
@@ -24,35 +29,236 @@ EXTENDED_SIZE_SENTINEL = SIZE_MASK  # 0xFFF — "real size in next 4 bytes"
 # ---------------------------------------------------------------------------
 # HWP tag IDs  (HWPTAG_BEGIN = 16)
 # ---------------------------------------------------------------------------
+HWPTAG_BIN_DATA = 18  # HWPTAG_BEGIN + 2
 HWPTAG_STYLE = 26  # HWPTAG_BEGIN + 10
 HWPTAG_PARA_HEADER = 66
 HWPTAG_PARA_TEXT = 67
 HWPTAG_CTRL_HEADER = 71
 HWPTAG_LIST_HEADER = 72
 HWPTAG_TABLE = 77  # HWPTAG_BEGIN + 61
+HWPTAG_SHAPE_COMPONENT_PICTURE = 85  # HWPTAG_BEGIN + 69
 
 # ---------------------------------------------------------------------------
-# Control type ID
+# Streaming
+# ---------------------------------------------------------------------------
+STREAM_CHUNK_SIZE = 64 * 1024  # 압축 스트림을 읽는 단위 (및 한 번에 풀어내는 최대 크기)
+WINDOW_MIN_SIZE = 1024 * 1024  # 레코드 윈도를 자르는 최소 크기
+
+# ---------------------------------------------------------------------------
+# Control type IDs
 # ---------------------------------------------------------------------------
 CTRL_TABLE_ID = struct.unpack(">I", b"tbl ")[0]  # 0x74626c20
+CTRL_GSO_ID = struct.unpack(">I", b"gso ")[0]  # 그리기 개체 (그림, 도형 등)
+CTRL_EQUATION_ID = struct.unpack(">I", b"eqed")[0]
+CTRL_FOOTNOTE_ID = struct.unpack(">I", b"fn  ")[0]
+CTRL_ENDNOTE_ID = struct.unpack(">I", b"en  ")[0]
+
+
+type RecordData = bytes | memoryview
 
 
 @dataclass(slots=True)
 class Record:
-    """A single parsed HWP binary record."""
+    """A single parsed HWP binary record.
+
+    ``data`` is either a copy of the payload (``bytes``) or a zero-copy
+    ``memoryview`` into the decompressed section buffer.
+    """
 
     tag: int
     level: int
-    data: bytes
+    data: RecordData
+
+
+class RecordTable:
+    """섹션 레코드를 열(column) 단위 배열로 보관하는 컴팩트 인덱스.
+
+    레코드마다 Record 객체를 만드는 대신 tag / level / payload offset / size를
+    ``array``에 저장하고, 페이로드는 원본 버퍼의 memoryview로 필요할 때만
+    잘라낸다. 태그별 위치 인덱스를 이용해 다음 PARA_HEADER, CTRL_HEADER 등으로
+    한 번에 이동할 수 있다.
+    """
+
+    __slots__ = ("_buf", "_ends", "_positions", "levels", "offsets", "sizes", "tags")
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        self._buf = memoryview(data)
+        self.tags = array("H")
+        self.levels = array("H")
+        self.offsets = array("Q")
+        self.sizes = array("I")
+        self._positions: dict[int, array[int]] | None = None
+        self._ends: array[int] | None = None
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> RecordTable:
+        """바이너리 레코드 스트림의 헤더만 읽어 RecordTable을 만든다."""
+        table = cls(data)
+        tags, levels, offsets, sizes = (
+            table.tags,
+            table.levels,
+            table.offsets,
+            table.sizes,
+        )
+        unpack_from = struct.unpack_from
+        offset = 0
+        data_len = len(table._buf)
+
+        while offset + 4 <= data_len:
+            header = unpack_from("<I", data, offset)[0]
+            size = (header >> (TAG_BITS + LEVEL_BITS)) & SIZE_MASK
+            offset += 4
+
+            if size == EXTENDED_SIZE_SENTINEL:
+                if offset + 4 > data_len:
+                    break
+                size = unpack_from("<I", data, offset)[0]
+                offset += 4
+
+            if offset + size > data_len:
+                break
+
+            tags.append(header & TAG_MASK)
+            levels.append((header >> TAG_BITS) & LEVEL_MASK)
+            offsets.append(offset)
+            sizes.append(size)
+            offset += size
+
+        return table
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> RecordTable:
+        """Record 시퀀스를 RecordTable로 변환한다 (페이로드는 하나의 버퍼로 모음)."""
+        buf = bytearray()
+        tags, levels, offsets, sizes = array("H"), array("H"), array("Q"), array("I")
+        for rec in records:
+            tags.append(rec.tag)
+            levels.append(rec.level)
+            offsets.append(len(buf))
+            sizes.append(len(rec.data))
+            buf += rec.data
+        return cls._from_columns(buf, tags, levels, offsets, sizes)
+
+    @classmethod
+    def _from_columns(
+        cls,
+        data: bytes | bytearray | memoryview,
+        tags: array[int],
+        levels: array[int],
+        offsets: array[int],
+        sizes: array[int],
+    ) -> RecordTable:
+        table = cls(data)
+        table.tags, table.levels, table.offsets, table.sizes = (
+            tags,
+            levels,
+            offsets,
+            sizes,
+        )
+        return table
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __getitem__(self, index: int) -> Record:
+        return Record(
+            tag=self.tags[index], level=self.levels[index], data=self.data(index)
+        )
+
+    def data(self, index: int) -> memoryview:
+        """*index*번째 레코드의 페이로드를 복사 없이 반환한다."""
+        offset = self.offsets[index]
+        return self._buf[offset : offset + self.sizes[index]]
+
+    def positions(self, tag: int) -> array[int]:
+        """*tag* 레코드들의 인덱스 배열(오름차순)을 반환한다."""
+        if self._positions is None:
+            index: dict[int, array[int]] = {}
+            for i, t in enumerate(self.tags):
+                bucket = index.get(t)
+                if bucket is None:
+                    bucket = index[t] = array("I")
+                bucket.append(i)
+            self._positions = index
+        return self._positions.get(tag, _EMPTY_POSITIONS)
+
+    def subtree_end(self, index: int) -> int:
+        """*index* 레코드의 하위 레코드가 끝나는 위치를 반환한다.
+
+        index 이후 level이 index의 level 이하인 첫 레코드의 인덱스이며, 없으면
+        레코드 수다. 처음 호출할 때 단조 스택으로 모든 레코드의 값을 O(n)에
+        계산해 두므로 이후 조회는 O(1)이다.
+        """
+        if self._ends is None:
+            levels = self.levels
+            n = len(levels)
+            ends = array("I", [n]) * n
+            stack: list[int] = []
+            for i, level in enumerate(levels):
+                while stack and levels[stack[-1]] >= level:
+                    ends[stack.pop()] = i
+                stack.append(i)
+            self._ends = ends
+        return self._ends[index]
+
+    def find_next(
+        self,
+        tag: int,
+        start: int,
+        stop: int | None = None,
+        *,
+        max_level: int | None = None,
+    ) -> int:
+        """[start, stop) 구간에서 *tag* 레코드의 첫 인덱스를 찾는다.
+
+        max_level을 지정하면 level이 그 이하인 레코드만 일치로 본다.
+        찾지 못하면 *stop* (기본값: 레코드 수)을 반환한다.
+        """
+        if stop is None:
+            stop = len(self.tags)
+        positions = self.positions(tag)
+        i = bisect_left(positions, start)
+        n = len(positions)
+        levels = self.levels
+        while i < n:
+            pos = positions[i]
+            if pos >= stop:
+                break
+            if max_level is None or levels[pos] <= max_level:
+                return pos
+            i += 1
+        return stop
+
+    def find_next_of(
+        self, tags: Iterable[int], start: int, stop: int | None = None
+    ) -> int:
+        """[start, stop) 구간에서 *tags* 중 하나인 첫 레코드의 인덱스를 찾는다."""
+        if stop is None:
+            stop = len(self.tags)
+        for tag in tags:
+            stop = self.find_next(tag, start, stop)
+        return stop
+
+
+_EMPTY_POSITIONS: array[int] = array("I")
 
 
 class RecordCursor:
-    """레코드 리스트를 순회하는 커서."""
+    """RecordTable을 순회하는 커서.
+
+    list[Record]를 넘기면 RecordTable로 변환하여 사용한다.
+    """
 
-    def __init__(self, records: list[Record], start: int = 0) -> None:
-        self._records = records
+    def __init__(self, records: RecordTable | list[Record], start: int = 0) -> None:
+        if not isinstance(records, RecordTable):
+            records = RecordTable.from_records(records)
+        self._table = records
         self._pos = start
 
+    @property
+    def table(self) -> RecordTable:
+        return self._table
+
     @property
     def pos(self) -> int:
         return self._pos
@@ -62,20 +268,26 @@ class RecordCursor:
         self._pos = value
 
     def has_next(self) -> bool:
-        return self._pos < len(self._records)
+        return self._pos < len(self._table)
 
     def peek(self) -> Record | None:
-        return self._records[self._pos] if self.has_next() else None
+        return self._table[self._pos] if self.has_next() else None
 
     def advance(self) -> Record:
-        rec = self._records[self._pos]
+        rec = self._table[self._pos]
         self._pos += 1
         return rec
 
 
-def parse_records(data: bytes) -> list[Record]:
-    """바이너리 레코드 스트림을 Record 리스트로 파싱한다."""
+def parse_records(data: bytes, *, zero_copy: bool = False) -> list[Record]:
+    """바이너리 레코드 스트림을 Record 리스트로 파싱한다.
+
+    zero_copy=True이면 각 Record.data는 *data* 버퍼를 가리키는 memoryview가 되어
+    페이로드 복사가 발생하지 않는다. 이 경우 Record가 살아있는 동안 원본 버퍼도
+    함께 유지된다.
+    """
     records: list[Record] = []
+    buf: RecordData = memoryview(data) if zero_copy else data
     offset = 0
     data_len = len(data)
 
@@ -95,7 +307,122 @@ def parse_records(data: bytes) -> list[Record]:
         if offset + size > data_len:
             break
 
-        records.append(Record(tag=tag, level=level, data=data[offset : offset + size]))
+        records.append(Record(tag=tag, level=level, data=buf[offset : offset + size]))
         offset += size
 
     return records
+
+
+def iter_records(
+    data: bytes | bytearray | memoryview, *, tags: Container[int] | None = None
+) -> Iterator[Record]:
+    """레코드 헤더만 따라가며 *tags*에 해당하는 레코드만 yield한다.
+
+    요청하지 않은 태그의 레코드는 Record 객체를 만들지 않고 페이로드를 그대로
+    건너뛴다. yield되는 Record.data는 *data*를 가리키는 memoryview다.
+    tags=None이면 모든 레코드를 yield한다.
+    """
+    buf = memoryview(data)
+    unpack_from = struct.unpack_from
+    offset = 0
+    data_len = len(buf)
+
+    while offset + 4 <= data_len:
+        header = unpack_from("<I", buf, offset)[0]
+        size = (header >> (TAG_BITS + LEVEL_BITS)) & SIZE_MASK
+        offset += 4
+
+        if size == EXTENDED_SIZE_SENTINEL:
+            if offset + 4 > data_len:
+                break
+            size = unpack_from("<I", buf, offset)[0]
+            offset += 4
+
+        if offset + size > data_len:
+            break
+
+        tag = header & TAG_MASK
+        if tags is None or tag in tags:
+            level = (header >> TAG_BITS) & LEVEL_MASK
+            yield Record(tag=tag, level=level, data=buf[offset : offset + size])
+        offset += size
+
+
+def iter_decompressed(
+    stream: BinaryIO, *, compressed: bool = True, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """*stream*을 chunk_size 단위로 읽어 raw deflate를 점진적으로 푼다.
+
+    한 번에 풀어내는 크기도 chunk_size로 제한하므로 압축률이 높은 데이터도
+    메모리에 한꺼번에 펼쳐지지 않는다.
+    """
+    if not compressed:
+        while chunk := stream.read(chunk_size):
+            yield chunk
+        return
+
+    decomp = zlib.decompressobj(-15)
+    while not decomp.eof and (chunk := stream.read(chunk_size)):
+        while chunk and not decomp.eof:
+            out = decomp.decompress(chunk, chunk_size)
+            if out:
+                yield out
+            chunk = decomp.unconsumed_tail
+    out = decomp.flush()
+    if out:
+        yield out
+
+
+def iter_record_windows(
+    chunks: Iterable[bytes], *, min_size: int = WINDOW_MIN_SIZE
+) -> Iterator[RecordTable]:
+    """바이트 청크 스트림을 최상위 문단 경계에서 잘라 RecordTable로 yield한다.
+
+    각 윈도는 level 0 PARA_HEADER에서 시작하므로(첫 윈도 제외) 문단과 그 안의
+    표·컨트롤이 윈도 사이에서 쪼개지지 않는다. 윈도는 min_size 이상 쌓였을 때만
+    잘라내므로 메모리 사용량은 대략 max(min_size, 가장 큰 최상위 문단)으로 제한된다.
+    """
+    buf = bytearray()
+    tags, levels, offsets, sizes = array("H"), array("H"), array("Q"), array("I")
+    unpack_from = struct.unpack_from
+    offset = 0
+
+    for chunk in chunks:
+        buf += chunk
+        data_len = len(buf)
+
+        while offset + 4 <= data_len:
+            header = unpack_from("<I", buf, offset)[0]
+            size = (header >> (TAG_BITS + LEVEL_BITS)) & SIZE_MASK
+            payload = offset + 4
+
+            if size == EXTENDED_SIZE_SENTINEL:
+                if payload + 4 > data_len:
+                    break
+                size = unpack_from("<I", buf, payload)[0]
+                payload += 4
+
+            if payload + size > data_len:
+                break  # 레코드가 다음 청크에 걸쳐 있음
+
+            tag = header & TAG_MASK
+            level = (header >> TAG_BITS) & LEVEL_MASK
+            if tag == HWPTAG_PARA_HEADER and level == 0 and offset >= min_size:
+                yield RecordTable._from_columns(
+                    buf[:offset], tags, levels, offsets, sizes
+                )
+                del buf[:offset]
+                payload -= offset
+                data_len -= offset
+                offset = 0
+                tags, levels = array("H"), array("H")
+                offsets, sizes = array("Q"), array("I")
+
+            tags.append(tag)
+            levels.append(level)
+            offsets.append(payload)
+            sizes.append(size)
+            offset = payload + size
+
+    if tags:
+        yield RecordTable._from_columns(buf[:offset], tags, levels, offsets, sizes)
@@ -1,136 +1,177 @@
-"""HWP table parsing — 3-phase table extraction from binary records."""
+"""HWP table parsing — iterative table builder over a RecordTable.
+
+A table control is laid out as::
+
+    CTRL_HEADER(tbl)            level L
+      TABLE                     level L+1   (n_rows, n_cols)
+      LIST_HEADER (cell)        level L+1   (col, row, colspan, rowspan)
+        PARA_HEADER ...         level L+1
+          PARA_TEXT ...         level L+2
+          CTRL_HEADER(tbl) ...  level L+2   (nested table)
+      LIST_HEADER (cell) ...
+
+The table ends where the CTRL_HEADER subtree ends (RecordTable.subtree_end),
+so nested tables are handled with an explicit stack instead of recursion.
+"""
 
 from __future__ import annotations
 
 import struct
+from dataclasses import dataclass, field
 
 from ..models import Paragraph, Table, TableCell, TableRow
 from .records import (
     CTRL_TABLE_ID,
     HWPTAG_CTRL_HEADER,
     HWPTAG_LIST_HEADER,
-    HWPTAG_PARA_HEADER,
     HWPTAG_PARA_TEXT,
     HWPTAG_TABLE,
-    RecordCursor,
+    RecordTable,
 )
-from .text import extract_text, has_table_marker
+from .text import decode_para_text
+
+# ---------------------------------------------------------------------------
+# Cell LIST_HEADER layout
+# ---------------------------------------------------------------------------
+# [n_paras: UINT16][unknown: UINT16][property: UINT32]
+# [col: UINT16][row: UINT16][colspan: UINT16][rowspan: UINT16] ...
+CELL_ADDRESS_OFFSET = 8
+CELL_ADDRESS_SIZE = 8
 
+_SCAN_TAGS = (HWPTAG_LIST_HEADER, HWPTAG_PARA_TEXT, HWPTAG_CTRL_HEADER)
 
-def read_ctrl_id(data: bytes) -> int:
+type CellAddress = tuple[int, int, int, int]  # (row, col, rowspan, colspan)
+
+
+def read_ctrl_id(data: bytes | memoryview) -> int:
     """CTRL_HEADER 데이터에서 컨트롤 타입 ID(uint32 LE)를 읽는다."""
     if len(data) >= 4:
         return struct.unpack_from("<I", data, 0)[0]
     return 0
 
 
-def find_table_ctrl(cursor: RecordCursor, para_level: int) -> int | None:
-    """Phase 1: CTRL_HEADER(tbl) 레코드를 찾아 ctrl_level을 반환한다.
-
-    테이블이 아니거나 다음 문단에 도달하면 None을 반환한다.
-    """
-    while cursor.has_next():
-        rec = cursor.peek()
-        if rec is None:
-            break
-        if rec.tag == HWPTAG_CTRL_HEADER and len(rec.data) >= 4:
-            ctrl_id = read_ctrl_id(rec.data)
-            if ctrl_id == CTRL_TABLE_ID:
-                ctrl_level = rec.level
-                cursor.advance()
-                return ctrl_level
-        # 같은/상위 레벨의 다음 문단을 만나면 중단
-        if rec.tag == HWPTAG_PARA_HEADER and rec.level <= para_level:
-            return None
-        cursor.advance()
-    return None
-
-
-def read_table_dimensions(cursor: RecordCursor) -> tuple[int, int]:
-    """Phase 2: HWPTAG_TABLE 레코드에서 (n_rows, n_cols)를 읽는다."""
-    rec = cursor.peek()
-    if rec is not None and rec.tag == HWPTAG_TABLE:
-        tbl_data = rec.data
-        cursor.advance()
-        if len(tbl_data) >= 8:
-            n_rows = struct.unpack_from("<H", tbl_data, 4)[0]
-            n_cols = struct.unpack_from("<H", tbl_data, 6)[0]
-            return n_rows, n_cols
+def read_table_dimensions(data: bytes | memoryview) -> tuple[int, int]:
+    """HWPTAG_TABLE 데이터에서 (n_rows, n_cols)를 읽는다."""
+    if len(data) >= 8:
+        n_rows, n_cols = struct.unpack_from("<HH", data, 4)
+        return n_rows, n_cols
     return 0, 0
 
 
-def collect_table_cells(
-    cursor: RecordCursor, ctrl_level: int, n_rows: int, n_cols: int
-) -> Table:
-    """Phase 3: LIST_HEADER + PARA_TEXT에서 셀 내용을 수집하여 Table을 빌드한다.
+def read_cell_address(data: bytes | memoryview) -> CellAddress | None:
+    """셀 LIST_HEADER 데이터에서 (row, col, rowspan, colspan)을 읽는다."""
+    if len(data) < CELL_ADDRESS_OFFSET + CELL_ADDRESS_SIZE:
+        return None
+    col, row, colspan, rowspan = struct.unpack_from("<HHHH", data, CELL_ADDRESS_OFFSET)
+    return row, col, max(rowspan, 1), max(colspan, 1)
+
+
+@dataclass(slots=True)
+class _TableFrame:
+    """build_table의 명시적 스택에 쌓이는, 파싱 중인 표 하나의 상태."""
+
+    n_rows: int
+    n_cols: int
+    cell_level: int
+    pos: int  # 다음에 살펴볼 레코드 인덱스
+    end: int  # 표 CTRL_HEADER 서브트리의 끝 (exclusive)
+    cells: list[tuple[CellAddress | None, list[Paragraph | Table]]] = field(
+        default_factory=list
+    )
+    current: list[Paragraph | Table] | None = None
+
+
+def _open_table(records: RecordTable, ctrl_index: int) -> _TableFrame | None:
+    """표 CTRL_HEADER에서 TABLE 레코드를 읽어 새 프레임을 만든다."""
+    end = records.subtree_end(ctrl_index)
+    pos = records.find_next(HWPTAG_TABLE, ctrl_index + 1, end)
+    if pos == end:
+        return None
+    n_rows, n_cols = read_table_dimensions(records.data(pos))
+    if n_rows == 0 or n_cols == 0:
+        return None
+    return _TableFrame(
+        n_rows=n_rows,
+        n_cols=n_cols,
+        cell_level=records.levels[ctrl_index] + 1,
+        pos=pos + 1,
+        end=end,
+    )
+
+
+def _assemble(frame: _TableFrame) -> Table:
+    """수집한 셀을 주소(row, col)에 맞춰 n_rows × n_cols 격자로 배치한다.
 
-    셀 내부에 중첩 테이블 마커가 있으면 재귀적으로 파싱한다.
+    병합으로 가려진 칸은 빈 셀로 남긴다. 주소가 없거나 잘못된 셀은 남은 칸을
+    행 우선 순서로 채운다.
     """
-    cell_contents: list[list[Paragraph | Table]] = []
-    current_cell: list[Paragraph | Table] = []
-    in_cell = False
-
-    while cursor.has_next():
-        rec = cursor.peek()
-        if rec is None:
+    n_rows, n_cols = frame.n_rows, frame.n_cols
+    grid = [[TableCell() for _ in range(n_cols)] for _ in range(n_rows)]
+    taken = bytearray(n_rows * n_cols)
+    next_free = 0
+
+    for address, content in frame.cells:
+        if address is not None:
+            row, col, rowspan, colspan = address
+            if row < n_rows and col < n_cols and not taken[row * n_cols + col]:
+                grid[row][col].content = content
+                for r in range(row, min(row + rowspan, n_rows)):
+                    for c in range(col, min(col + colspan, n_cols)):
+                        taken[r * n_cols + c] = 1
+                continue
+        while next_free < len(taken) and taken[next_free]:
+            next_free += 1
+        if next_free == len(taken):
             break
+        grid[next_free // n_cols][next_free % n_cols].content = content
+        taken[next_free] = 1
 
-        # 테이블 종료: ctrl_level 이하 레벨의 PARA_HEADER를 만남
-        if rec.level <= ctrl_level and rec.tag == HWPTAG_PARA_HEADER:
-            if in_cell:
-                cell_contents.append(current_cell)
-            break
+    return Table(rows=[TableRow(cells=cells) for cells in grid])
 
-        if rec.tag == HWPTAG_LIST_HEADER and rec.level == ctrl_level + 1:
-            # 새 셀 시작
-            if in_cell:
-                cell_contents.append(current_cell)
-            current_cell = []
-            in_cell = True
-
-        elif rec.tag == HWPTAG_PARA_TEXT and in_cell:
-            # 중첩 테이블 마커 확인
-            if has_table_marker(rec.data):
-                para_level = rec.level
-                cursor.advance()  # 현재 PARA_TEXT 소비
-                nested = try_parse_table(cursor, para_level)
-                if nested and nested.rows:
-                    current_cell.append(nested)
-                continue
-            text = extract_text(rec.data).strip()
-            if text:
-                current_cell.append(Paragraph(text=text))
-
-        cursor.advance()
-    else:
-        # 레코드 끝까지 도달
-        if in_cell:
-            cell_contents.append(current_cell)
-
-    # 수집된 셀 내용으로 Table 객체 생성
-    table = Table()
-    cell_idx = 0
-    for _ in range(n_rows):
-        row = TableRow()
-        for _ in range(n_cols):
-            cell = TableCell()
-            if cell_idx < len(cell_contents):
-                cell.content = cell_contents[cell_idx]
-            row.cells.append(cell)
-            cell_idx += 1
-        table.rows.append(row)
-
-    return table
-
-
-def try_parse_table(cursor: RecordCursor, para_level: int) -> Table | None:
-    """테이블 파싱을 시도한다. 실패 시 None을 반환한다."""
-    ctrl_level = find_table_ctrl(cursor, para_level)
-    if ctrl_level is None:
-        return None
 
-    n_rows, n_cols = read_table_dimensions(cursor)
-    if n_rows == 0 or n_cols == 0:
+def build_table(records: RecordTable, ctrl_index: int) -> Table | None:
+    """표 CTRL_HEADER(tbl) 위치에서 Table을 만든다. 표가 아니면 None.
+
+    중첩 표는 재귀 대신 프레임 스택으로 처리하며, 각 표의 끝은
+    subtree_end로 바로 구하므로 전체 비용은 레코드 수에 선형이다.
+    """
+    root = _open_table(records, ctrl_index)
+    if root is None:
         return None
 
-    return collect_table_cells(cursor, ctrl_level, n_rows, n_cols)
+    stack = [root]
+    while True:
+        frame = stack[-1]
+        pos = records.find_next_of(_SCAN_TAGS, frame.pos, frame.end)
+        if pos >= frame.end:
+            table = _assemble(stack.pop())
+            if not stack:
+                return table
+            parent = stack[-1].current
+            if parent is not None and table.rows:
+                parent.append(table)
+            continue
+
+        frame.pos = pos + 1
+        tag = records.tags[pos]
+        if tag == HWPTAG_LIST_HEADER:
+            if records.levels[pos] == frame.cell_level:
+                # 새 셀 시작
+                content: list[Paragraph | Table] = []
+                frame.cells.append((read_cell_address(records.data(pos)), content))
+                frame.current = content
+        elif frame.current is None:
+            continue
+        elif tag == HWPTAG_PARA_TEXT:
+            para = decode_para_text(records.data(pos))
+            # 표를 담은 문단은 뒤따르는 CTRL_HEADER에서 표로 처리
+            if any(ctrl.kind == "table" for ctrl in para.controls):
+                continue
+            text = para.text.strip()
+            if text:
+                frame.current.append(Paragraph(text=text))
+        elif read_ctrl_id(records.data(pos)) == CTRL_TABLE_ID:
+            frame.pos = records.subtree_end(pos)
+            nested = _open_table(records, pos)
+            if nested is not None:
+                stack.append(nested)
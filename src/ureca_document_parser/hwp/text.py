@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import re
 import struct
+import sys
+from array import array
 from collections.abc import Iterator
 from dataclasses import dataclass
 
+from .records import (
+    CTRL_ENDNOTE_ID,
+    CTRL_EQUATION_ID,
+    CTRL_FOOTNOTE_ID,
+    CTRL_GSO_ID,
+    CTRL_TABLE_ID,
+)
+
 # ---------------------------------------------------------------------------
 # PARA_TEXT character codes
 # ---------------------------------------------------------------------------
@@ -19,6 +30,19 @@ CHAR_TABLE_OBJECT = 11  # GSO (table, image 등) marker
 CHAR_PARAGRAPH_END = 13
 PRINTABLE_THRESHOLD = 32
 
+EXTENDED_CTRL_UNITS = EXTENDED_CTRL_SIZE // 2  # 8 uint16
+_CTRL_CHAR_RE = re.compile(r"[\x00-\x1f]")  # code < PRINTABLE_THRESHOLD
+_UTF32_NATIVE = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+# 확장 제어문자 페이로드의 컨트롤 ID → 개체 종류
+CONTROL_KINDS: dict[int, str] = {
+    CTRL_TABLE_ID: "table",
+    CTRL_GSO_ID: "picture",
+    CTRL_EQUATION_ID: "equation",
+    CTRL_FOOTNOTE_ID: "footnote",
+    CTRL_ENDNOTE_ID: "endnote",
+}
+
 
 @dataclass(slots=True)
 class CharInfo:
@@ -29,10 +53,11 @@ class CharInfo:
     size: int  # bytes consumed by this character (2 or 16)
 
 
-def read_bstr(data: bytes, offset: int) -> tuple[str, int]:
+def read_bstr(data: bytes | memoryview, offset: int) -> tuple[str, int]:
     """Read an HWP BSTR (UINT16 length + UTF-16LE chars) from *data*.
 
-    Returns (decoded_string, new_offset).
+    *data* may be a memoryview; the characters are decoded in place without
+    copying the slice first. Returns (decoded_string, new_offset).
     """
     if offset + 2 > len(data):
         return "", offset
@@ -41,11 +66,39 @@ def read_bstr(data: bytes, offset: int) -> tuple[str, int]:
     byte_len = n_chars * 2
     if offset + byte_len > len(data):
         return "", offset
-    text = data[offset : offset + byte_len].decode("utf-16-le", errors="ignore")
+    text = str(data[offset : offset + byte_len], "utf-16-le", errors="ignore")
     return text, offset + byte_len
 
 
-def scan_para_chars(data: bytes) -> Iterator[CharInfo]:
+@dataclass(slots=True)
+class ParaControl:
+    """An extended control character found in PARA_TEXT."""
+
+    code: int  # uint16 control character code
+    offset: int  # byte offset within PARA_TEXT data
+    text_index: int  # position in the extracted text where the object sits
+    ctrl_id: int  # control type ID (e.g. CTRL_TABLE_ID), 0 if unreadable
+
+    @property
+    def kind(self) -> str:
+        """개체 종류 ("table", "picture", "equation", ...) — 알 수 없으면 ""."""
+        return CONTROL_KINDS.get(self.ctrl_id, "")
+
+
+@dataclass(slots=True)
+class ParaText:
+    """Decoded PARA_TEXT payload: visible text plus the control codes seen."""
+
+    text: str
+    control_codes: frozenset[int]
+    controls: tuple[ParaControl, ...] = ()
+
+    @property
+    def has_table_marker(self) -> bool:
+        return CHAR_TABLE_OBJECT in self.control_codes
+
+
+def scan_para_chars(data: bytes | memoryview) -> Iterator[CharInfo]:
     """HWPTAG_PARA_TEXT 바이트를 순회하며 CharInfo를 yield한다.
 
     확장 제어문자(16바이트)와 일반 문자(2바이트)를 올바르게 구분한다.
@@ -62,19 +115,79 @@ def scan_para_chars(data: bytes) -> Iterator[CharInfo]:
             offset += 2
 
 
-def extract_text(data: bytes) -> str:
+def _decode_units(data: bytes | memoryview) -> str:
+    """PARA_TEXT를 uint16 코드 단위 하나당 한 글자인 문자열로 일괄 디코딩한다.
+
+    서로게이트 쌍이 없으면 UTF-16 디코딩 한 번으로 끝난다. 쌍이 합쳐진 경우에는
+    uint16 배열을 거쳐 코드 단위마다 한 글자가 되도록 다시 디코딩한다.
+    """
+    n_units = len(data) // 2
+    raw = data[: n_units * 2]
+    text = str(raw, "utf-16-le", "surrogatepass")
+    if len(text) == n_units:
+        return text
+    units = array("H")
+    units.frombytes(raw)
+    if sys.byteorder == "big":
+        units.byteswap()
+    return str(array("I", units).tobytes(), _UTF32_NATIVE, "surrogatepass")
+
+
+def decode_para_text(data: bytes | memoryview) -> ParaText:
+    """PARA_TEXT 바이트를 한 번에 디코딩하여 텍스트와 제어문자 목록을 반환한다.
+
+    scan_para_chars와 같은 규칙(확장 제어문자 16바이트, 탭/줄바꿈 변환,
+    그 밖의 제어문자 제거)을 따르지만, 문자 단위 루프 대신 제어문자 사이의
+    구간을 문자열 슬라이스로 통째로 잘라 붙인다. 확장 제어문자(표, 그림, 수식,
+    각주 등)는 위치와 컨트롤 ID를 ParaControl로 함께 보고한다.
+    """
+    units = _decode_units(data)
+    match = _CTRL_CHAR_RE.search(units)
+    if match is None:
+        return ParaText(text=units, control_codes=frozenset())
+
+    parts: list[str] = []
+    codes: set[int] = set()
+    controls: list[ParaControl] = []
+    text_len = 0
+    pos = 0
+    while match is not None:
+        idx = match.start()
+        span = units[pos:idx]
+        parts.append(span)
+        text_len += len(span)
+        code = ord(units[idx])
+        codes.add(code)
+        if code in EXTENDED_CTRL_CHARS:
+            ctrl_id = 0
+            if idx + 3 <= len(units):
+                ctrl_id = ord(units[idx + 1]) | (ord(units[idx + 2]) << 16)
+            controls.append(
+                ParaControl(
+                    code=code, offset=idx * 2, text_index=text_len, ctrl_id=ctrl_id
+                )
+            )
+            pos = idx + EXTENDED_CTRL_UNITS
+        else:
+            if code == CHAR_TAB:
+                parts.append("\t")
+                text_len += 1
+            elif code == CHAR_LINE_BREAK:
+                parts.append("\n")
+                text_len += 1
+            pos = idx + 1
+        match = _CTRL_CHAR_RE.search(units, pos)
+    parts.append(units[pos:])
+    return ParaText(
+        text="".join(parts), control_codes=frozenset(codes), controls=tuple(controls)
+    )
+
+
+def extract_text(data: bytes | memoryview) -> str:
     """PARA_TEXT 바이트에서 사람이 읽을 수 있는 텍스트를 추출한다."""
-    chars: list[str] = []
-    for info in scan_para_chars(data):
-        if info.code == CHAR_TAB:
-            chars.append("\t")
-        elif info.code == CHAR_LINE_BREAK:
-            chars.append("\n")
-        elif info.code >= PRINTABLE_THRESHOLD:
-            chars.append(chr(info.code))
-    return "".join(chars)
-
-
-def has_table_marker(data: bytes) -> bool:
+    return decode_para_text(data).text
+
+
+def has_table_marker(data: bytes | memoryview) -> bool:
     """파라그래프에 테이블/GSO 마커(char 11)가 있는지 확인한다."""
-    return any(info.code == CHAR_TABLE_OBJECT for info in scan_para_chars(data))
+    return decode_para_text(data).has_table_marker
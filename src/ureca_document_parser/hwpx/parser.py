@@ -6,17 +6,31 @@ text, tables, and heading information from the XML sections.
 
 Pipeline:
     ZIP archive → find section XMLs → parse XML → extract elements → Document
+
+With ``streaming=True`` each section is read through ``ET.iterparse``
+straight from the ZIP member, and every top-level ``<p>``/``<tbl>`` is
+converted and detached from the tree as soon as it closes, so memory use
+does not grow with the section size.
+
+XML is parsed with lxml when it is installed (``backend="auto"``), and
+with the standard library's ElementTree otherwise. Both backends produce
+the same Document.
 """
 
 from __future__ import annotations
 
+import sys
 import zipfile
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor
 from pathlib import Path
+from typing import IO, Any, Protocol
 from xml.etree import ElementTree as ET
 
 from ..models import (
+    BinaryData,
     Document,
+    Image,
     Metadata,
     Paragraph,
     ParseError,
@@ -24,25 +38,198 @@ from ..models import (
     TableCell,
     TableRow,
 )
-from ..styles import HEADING_STYLE_PATTERNS
-
+from ..styles import heading_level_from_style
 
 # ---------------------------------------------------------------------------
 # XML namespace utilities
 # ---------------------------------------------------------------------------
+HWPML_NAMESPACES: dict[str, str] = {
+    "hp": "http://www.hancom.co.kr/hwpml/2011/paragraph",
+    "hp10": "http://www.hancom.co.kr/hwpml/2016/paragraph",
+    "hs": "http://www.hancom.co.kr/hwpml/2011/section",
+    "hc": "http://www.hancom.co.kr/hwpml/2011/core",
+    "hh": "http://www.hancom.co.kr/hwpml/2011/head",
+}
+
+_LOCAL_NAMES = (
+    "sec",
+    "p",
+    "run",
+    "t",
+    "tbl",
+    "tr",
+    "tc",
+    "subList",
+    "pPr",
+    "style",
+    "tab",
+    "lineBreak",
+    "pic",
+    "img",
+    "shapeComment",
+)
+
+
 def _strip_ns(tag: str) -> str:
     """'{namespace}localname' → 'localname'."""
     return tag.rsplit("}", 1)[-1] if "}" in tag else tag
 
 
-def _children(parent: ET.Element, local_name: str) -> Iterator[ET.Element]:
+def _qualified_tags() -> dict[str, str]:
+    """알려진 HWPML 네임스페이스의 '{uri}local' 태그를 로컬 이름에 미리 대응시킨다."""
+    table = {name: name for name in _LOCAL_NAMES}
+    for uri in HWPML_NAMESPACES.values():
+        for name in _LOCAL_NAMES:
+            table[f"{{{uri}}}{name}"] = name
+    return table
+
+
+_QUALIFIED_TAGS = _qualified_tags()
+
+
+class _TagTable(dict[str, str]):
+    """원시 태그 → 로컬 이름 사전. 문서마다 하나씩 만든다.
+
+    알려진 태그는 미리 채워져 있고, 처음 보는 태그만 한 번 분해해서 캐시하므로
+    트리를 훑는 동안에는 문자열 가공 없이 사전 조회만 한다.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__(_QUALIFIED_TAGS)
+
+    def __missing__(self, tag: str) -> str:
+        if not isinstance(tag, str):
+            # lxml의 주석/처리 명령 노드는 tag가 함수다
+            return ""
+        local = sys.intern(_strip_ns(tag))
+        self[tag] = local
+        return local
+
+
+def _children(
+    parent: ET.Element, local_name: str, tags: _TagTable
+) -> Iterator[ET.Element]:
     """네임스페이스 무관하게 직계 자식 중 local_name과 일치하는 요소를 yield한다."""
-    return (ch for ch in parent if _strip_ns(ch.tag) == local_name)
+    return (ch for ch in parent if tags[ch.tag] == local_name)
+
 
+# ---------------------------------------------------------------------------
+# XML backends
+# ---------------------------------------------------------------------------
+HWPX_BACKENDS = ("auto", "lxml", "etree")
+
+
+_BLOCK_TAGS = frozenset({"p", "tbl"})
+
+
+class _XmlBackend(Protocol):
+    def fromstring(self, data: bytes) -> Any: ...
+
+    def iter_blocks(self, source: IO[bytes], tags: _TagTable) -> Iterator[Any]: ...
+
+
+class _EtreeBackend:
+    """표준 라이브러리 xml.etree.ElementTree 백엔드."""
 
-def _find_children(parent: ET.Element, local_name: str) -> list[ET.Element]:
-    """직계 자식 중 local_name과 일치하는 요소를 리스트로 반환한다."""
-    return [ch for ch in parent if _strip_ns(ch.tag) == local_name]
+    @staticmethod
+    def fromstring(data: bytes) -> ET.Element:
+        return ET.fromstring(data)
+
+    @staticmethod
+    def iter_blocks(source: IO[bytes], tags: _TagTable) -> Iterator[ET.Element]:
+        """최상위 <p>/<tbl>이 닫힐 때마다 yield하고, 처리가 끝나면 트리에서 떼어낸다."""
+        open_elems: list[ET.Element] = []
+        block_depth = 0
+
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                open_elems.append(elem)
+                if tags[elem.tag] in _BLOCK_TAGS:
+                    block_depth += 1
+                continue
+
+            open_elems.pop()
+            if tags[elem.tag] not in _BLOCK_TAGS:
+                continue
+            block_depth -= 1
+            if block_depth:
+                continue
+
+            yield elem
+            # 부모에 남은 자식은 모두 이미 처리된 형제들이다
+            if open_elems:
+                del open_elems[-1][:]
+
+
+class _LxmlBackend:
+    """lxml.etree 백엔드.
+
+    주석과 처리 명령을 버리도록 파서를 설정해서 ElementTree와 같은 트리가 나오게 한다.
+    파서 객체는 스레드 간에 공유하면 안 되므로 호출마다 새로 만든다.
+    """
+
+    _BLOCK_PATTERNS = tuple(f"{{*}}{name}" for name in sorted(_BLOCK_TAGS))
+
+    def __init__(self, etree: Any) -> None:
+        self._etree = etree
+
+    def fromstring(self, data: bytes) -> Any:
+        parser = self._etree.XMLParser(remove_comments=True, remove_pis=True)
+        return self._etree.fromstring(data, parser)
+
+    def iter_blocks(self, source: IO[bytes], tags: _TagTable) -> Iterator[Any]:
+        """ElementTree 백엔드와 같되, <p>/<tbl> 이외의 이벤트는 C 레벨에서 걸러낸다."""
+        events = self._etree.iterparse(
+            source,
+            events=("start", "end"),
+            tag=self._BLOCK_PATTERNS,
+            remove_comments=True,
+            remove_pis=True,
+        )
+        block_depth = 0
+        for event, elem in events:
+            if event == "start":
+                block_depth += 1
+                continue
+            block_depth -= 1
+            if block_depth:
+                continue
+
+            yield elem
+            # 파싱 중인 부모에서 자식을 한꺼번에 지우면 이후 요소가 트리에서
+            # 떨어져 나가므로, 블록은 비워 두고 앞선 형제만 지운다
+            elem.clear(keep_tail=False)
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+
+_ETREE_BACKEND = _EtreeBackend()
+
+
+def _resolve_backend(backend: str) -> _XmlBackend:
+    """백엔드 이름을 XML 파서로 바꾼다. 'auto'는 lxml이 있으면 lxml을 쓴다."""
+    if backend not in HWPX_BACKENDS:
+        raise ValueError(
+            f"지원하지 않는 XML 백엔드입니다: {backend!r} "
+            f"(사용 가능: {', '.join(HWPX_BACKENDS)})"
+        )
+    if backend == "etree":
+        return _ETREE_BACKEND
+
+    try:
+        from lxml import etree  # type: ignore[import-untyped]
+    except ImportError:
+        if backend == "lxml":
+            raise ParseError(
+                "lxml backend requires lxml. "
+                "Install with: pip install ureca_document_parser[lxml]"
+            ) from None
+        return _ETREE_BACKEND
+    return _LxmlBackend(etree)
 
 
 # ---------------------------------------------------------------------------
@@ -89,66 +276,349 @@ def _parse_manifest(data: bytes) -> list[str]:
     return sections
 
 
+# ---------------------------------------------------------------------------
+# BinData — embedded images
+# ---------------------------------------------------------------------------
+def _read_zip_member(source: str, name: str) -> bytes:
+    """아카이브 멤버 하나를 읽는다 (BinaryData loader)."""
+    with zipfile.ZipFile(source, "r") as zf:
+        return zf.read(name)
+
+
+def _parse_bin_items(data: bytes) -> dict[str, str]:
+    """content.hpf 매니페스트에서 BinData 항목의 id → href 매핑을 읽는다."""
+    root = ET.fromstring(data)
+    items: dict[str, str] = {}
+    for elem in root.iter():
+        item_id = elem.get("id", "")
+        href = elem.get("href", "")
+        if item_id and href.startswith("BinData/"):
+            items[item_id] = href
+    return items
+
+
+def _read_bin_items(zf: zipfile.ZipFile, source: str) -> dict[str, BinaryData]:
+    """매니페스트의 BinData 항목을 binaryItemIDRef → BinaryData로 매핑한다.
+
+    멤버 내용은 읽지 않고 이름과 로더만 기록한다.
+    """
+    names = set(zf.namelist())
+    for manifest in ("Contents/content.hpf", "contents/content.hpf"):
+        if manifest not in names:
+            continue
+        try:
+            items = _parse_bin_items(zf.read(manifest))
+        except Exception:
+            return {}
+        return {
+            item_id: BinaryData(source=source, name=href, loader=_read_zip_member)
+            for item_id, href in items.items()
+            if href in names
+        }
+    return {}
+
+
+# ---------------------------------------------------------------------------
+# Style table (Contents/header.xml)
+# ---------------------------------------------------------------------------
+MAX_STYLE_ID = 0xFFFF  # 스타일 ID 상한 (UINT16). 이보다 큰 id는 무시한다
+
+
+def _find_header_file(zf: zipfile.ZipFile) -> str | None:
+    """HWPX 아카이브에서 header.xml 경로를 찾는다."""
+    for name in zf.namelist():
+        if name.lower() == "contents/header.xml":
+            return name
+    return None
+
+
+def _read_style_levels(zf: zipfile.ZipFile, backend: _XmlBackend) -> tuple[int, ...]:
+    """header.xml의 스타일 정의를 파싱하여 style_id → heading_level 테이블을 반환.
+
+    Returns a tuple where index == style_id, value == heading_level (0 = normal).
+    id는 신뢰할 수 없는 입력이므로 음수나 MAX_STYLE_ID를 넘는 값은 건너뛰고,
+    테이블은 제목 스타일 중 가장 큰 id까지만 만든다 (그 뒤는 모두 0).
+    """
+    header_file = _find_header_file(zf)
+    if header_file is None:
+        return ()
+    try:
+        root = backend.fromstring(zf.read(header_file))
+    except Exception:
+        return ()
+
+    tags = _TagTable()
+    levels: dict[int, int] = {}
+    for elem in root.iter():
+        if tags[elem.tag] != "style":
+            continue
+        try:
+            style_id = int(elem.get("id", ""))
+        except ValueError:
+            continue
+        if not 0 <= style_id <= MAX_STYLE_ID:
+            continue
+        level = heading_level_from_style(
+            elem.get("name", "")
+        ) or heading_level_from_style(elem.get("engName", ""))
+        if level:
+            levels[style_id] = level
+
+    style_levels = [0] * (max(levels) + 1 if levels else 0)
+    for style_id, level in levels.items():
+        style_levels[style_id] = level
+    return tuple(style_levels)
+
+
 # ---------------------------------------------------------------------------
 # XML element processing
 # ---------------------------------------------------------------------------
-def _process_element(element: ET.Element, elements: list[Paragraph | Table]) -> None:
-    """XML 요소를 재귀적으로 처리하여 Paragraph와 Table을 추출한다."""
-    tag = _strip_ns(element.tag)
+type _Handler = Callable[[ET.Element, list[Paragraph | Table | Image]], None]
+
+
+class _DispatchTable(dict[str, "_Handler"]):
+    """원시 태그 → 처리 함수 사전. 처음 보는 태그만 로컬 이름으로 풀어 등록한다."""
+
+    __slots__ = ("_default", "_handlers", "_tags")
+
+    def __init__(
+        self, tags: _TagTable, handlers: dict[str, _Handler], default: _Handler
+    ) -> None:
+        super().__init__()
+        self._tags = tags
+        self._handlers = handlers
+        self._default = default
+
+    def __missing__(self, tag: str) -> _Handler:
+        handler = self._handlers.get(self._tags[tag], self._default)
+        self[tag] = handler
+        return handler
+
+
+class _SectionWalker:
+    """섹션 XML 트리를 훑어 Paragraph와 Table을 만든다.
+
+    태그 해석 결과는 문서 단위로 캐시되므로, 같은 문서의 섹션들은 하나의
+    walker를 공유한다. style_levels는 header.xml에서 읽은 스타일 ID → 제목
+    레벨 테이블, binaries는 매니페스트의 BinData id → BinaryData 매핑이다.
+    """
+
+    __slots__ = ("_dispatch", "binaries", "style_levels", "tags")
+
+    def __init__(
+        self,
+        style_levels: Sequence[int] = (),
+        binaries: Mapping[str, BinaryData] | None = None,
+    ) -> None:
+        self.tags = _TagTable()
+        self.style_levels = style_levels
+        self.binaries = binaries or {}
+        self._dispatch = _DispatchTable(
+            self.tags,
+            {"p": self._visit_paragraph, "tbl": self._visit_table},
+            self._visit_container,
+        )
+
+    def process(
+        self, element: ET.Element, elements: list[Paragraph | Table | Image]
+    ) -> None:
+        """XML 요소를 처리하여 Paragraph와 Table을 elements에 추가한다."""
+        self._dispatch[element.tag](element, elements)
+
+    def _visit_container(
+        self, element: ET.Element, elements: list[Paragraph | Table | Image]
+    ) -> None:
+        # 기타 컨테이너 요소는 재귀 탐색
+        dispatch = self._dispatch
+        for child in element:
+            dispatch[child.tag](child, elements)
 
-    if tag == "tbl":
-        table = _parse_table_element(element)
-        if table and table.rows:
+    def _visit_table(
+        self, element: ET.Element, elements: list[Paragraph | Table | Image]
+    ) -> None:
+        table = self.table(element)
+        if table.rows:
             elements.append(table)
-        return
 
-    if tag == "p":
-        para = _parse_paragraph_element(element)
+    def _visit_paragraph(
+        self, element: ET.Element, elements: list[Paragraph | Table | Image]
+    ) -> None:
+        para = _parse_paragraph_element(element, self.tags, self.style_levels)
         if para and para.text.strip():
             elements.append(para)
+        if self.binaries:
+            self._append_pictures(element, elements)
         # 문단 내부의 서브 테이블도 처리
+        tags = self.tags
         for child in element:
-            if _strip_ns(child.tag) in ("tbl", "subList"):
-                _process_element(child, elements)
-        return
-
-    # 기타 컨테이너 요소는 재귀 탐색
-    for child in element:
-        _process_element(child, elements)
+            if tags[child.tag] in ("tbl", "subList"):
+                self._dispatch[child.tag](child, elements)
+
+    # -- pictures -----------------------------------------------------------
+    def _append_pictures(
+        self, p_elem: ET.Element, elements: list[Paragraph | Table | Image]
+    ) -> None:
+        """문단의 <run>/<pic>을 Image로 추가한다 (바이트는 읽지 않는다)."""
+        tags = self.tags
+        for run in p_elem:
+            if tags[run.tag] != "run":
+                continue
+            for obj in run:
+                if tags[obj.tag] == "pic":
+                    image = self._picture(obj)
+                    if image is not None:
+                        elements.append(image)
+
+    def _picture(self, pic_elem: ET.Element) -> Image | None:
+        tags = self.tags
+        binary: BinaryData | None = None
+        alt_text = ""
+        for child in pic_elem:
+            kind = tags[child.tag]
+            if kind == "img":
+                binary = self.binaries.get(child.get("binaryItemIDRef", ""))
+            elif kind == "shapeComment":
+                alt_text = (child.text or "").strip()
+        if binary is None:
+            return None
+        return Image(alt_text=alt_text, source=binary.name, binary=binary)
+
+    # -- tables -------------------------------------------------------------
+    def table(self, tbl_elem: ET.Element) -> Table:
+        """<tbl> 요소를 Table로 파싱한다."""
+        tags = self.tags
+        table = Table()
+
+        for tr in tbl_elem:
+            if tags[tr.tag] != "tr":
+                continue
+            row = TableRow()
+            for tc in tr:
+                if tags[tc.tag] == "tc":
+                    row.cells.append(self.cell(tc))
+            if row.cells:
+                table.rows.append(row)
+
+        return table
+
+    def cell(self, tc_elem: ET.Element) -> TableCell:
+        """<tc> 요소를 TableCell로 파싱한다. 중첩 테이블도 지원."""
+        tags = self.tags
+        cell = TableCell()
+
+        for child in tc_elem:
+            tag = tags[child.tag]
+            if tag == "p":
+                para = _parse_paragraph_element(child, tags, self.style_levels)
+                if para:
+                    cell.content.append(para)
+                # 문단 내부 중첩 테이블
+                for p_child in child:
+                    if tags[p_child.tag] == "tbl":
+                        self._append_nested(cell, p_child)
+            elif tag == "tbl":
+                self._append_nested(cell, child)
+            elif tag == "subList":
+                for sub_child in child:
+                    sub_tag = tags[sub_child.tag]
+                    if sub_tag == "p":
+                        para = _parse_paragraph_element(
+                            sub_child, tags, self.style_levels
+                        )
+                        if para:
+                            cell.content.append(para)
+                    elif sub_tag == "tbl":
+                        self._append_nested(cell, sub_child)
+
+        return cell
+
+    def _append_nested(self, cell: TableCell, tbl_elem: ET.Element) -> None:
+        nested = self.table(tbl_elem)
+        if nested.rows:
+            cell.content.append(nested)
 
 
 # ---------------------------------------------------------------------------
 # Paragraph parsing
 # ---------------------------------------------------------------------------
-def _parse_paragraph_element(p_elem: ET.Element) -> Paragraph | None:
-    """<p> 요소를 Paragraph로 파싱한다."""
-    texts: list[str] = []
-
-    # <run>/<t> 요소에서 텍스트 추출
-    for run in _find_children(p_elem, "run"):
-        for t in _find_children(run, "t"):
-            if t.text:
-                texts.append(t.text)
-            if t.tail:
-                texts.append(t.tail)
-
-    # 일부 HWPX 변형에서 직접 <t> 요소가 존재
-    for t in _find_children(p_elem, "t"):
-        if t.text and t.text not in texts:
-            texts.append(t.text)
-
-    text = "".join(texts)
+_INLINE_TEXT = {"tab": "\t", "lineBreak": "\n"}
+
+
+def _t_text(t: ET.Element, tags: _TagTable) -> str:
+    """<t> 요소의 텍스트를 인라인 제어(<tab/>, <lineBreak/>)와 함께 잇는다."""
+    parts = [t.text or ""]
+    for child in t:
+        parts.append(_INLINE_TEXT.get(tags[child.tag], ""))
+        if child.tail:
+            parts.append(child.tail)
+    return "".join(parts)
+
+
+def _parse_paragraph_element(
+    p_elem: ET.Element,
+    tags: _TagTable | None = None,
+    style_levels: Sequence[int] = (),
+) -> Paragraph | None:
+    """<p> 요소를 Paragraph로 파싱한다.
+
+    <run>/<t>와 직접 <t>를 문서 순서대로 한 번만 훑는다. 직접 <t>는 일부 HWPX
+    변형에서 run의 텍스트를 중복해서 담고 있으므로 이미 나온 조각이면 건너뛴다.
+    """
+    if tags is None:
+        tags = _TagTable()
+    parts: list[str] = []
+    # 직접 <t>가 처음 나올 때 만든다 (run만 있는 문단은 해싱 비용이 없다)
+    seen: set[str] | None = None
+    pprs: list[ET.Element] = []
+
+    for child in p_elem:
+        kind = tags[child.tag]
+        if kind == "run":
+            for t in child:
+                if tags[t.tag] != "t":
+                    continue
+                fragment = _t_text(t, tags) if len(t) else t.text
+                if fragment:
+                    parts.append(fragment)
+                    if seen is not None:
+                        seen.add(fragment)
+                if t.tail:
+                    parts.append(t.tail)
+        elif kind == "t":
+            if seen is None:
+                seen = set(parts)
+            fragment = _t_text(child, tags) if len(child) else child.text
+            if fragment and fragment not in seen:
+                parts.append(fragment)
+                seen.add(fragment)
+        elif kind == "pPr":
+            pprs.append(child)
+
+    text = "".join(parts)
     if not text.strip():
         return None
 
-    heading_level = _detect_heading_level(p_elem)
+    heading_level = _heading_level(p_elem, pprs, style_levels)
     return Paragraph(text=text.strip(), heading_level=heading_level)
 
 
-def _detect_heading_level(p_elem: ET.Element) -> int:
+def _detect_heading_level(
+    p_elem: ET.Element,
+    tags: _TagTable | None = None,
+    style_levels: Sequence[int] = (),
+) -> int:
     """문단 속성에서 제목 레벨을 감지한다."""
+    if tags is None:
+        tags = _TagTable()
+    pprs = list(_children(p_elem, "pPr", tags))
+    return _heading_level(p_elem, pprs, style_levels)
+
+
+def _heading_level(
+    p_elem: ET.Element, pprs: list[ET.Element], style_levels: Sequence[int]
+) -> int:
     # pPr (paragraph properties)의 outlineLevel 확인
-    for ppr in _find_children(p_elem, "pPr"):
+    for ppr in pprs:
         outline = ppr.get("outlineLevel")
         if outline is not None:
             try:
@@ -158,93 +628,122 @@ def _detect_heading_level(p_elem: ET.Element) -> int:
             except ValueError:
                 pass
 
-    # 스타일 ID 패턴 확인
     style_id = p_elem.get("styleIDRef", "")
     if not style_id:
-        for ppr in _find_children(p_elem, "pPr"):
+        for ppr in pprs:
             style_id = ppr.get("styleIDRef", "")
 
-    style_lower = style_id.lower()
-    for pattern, level in HEADING_STYLE_PATTERNS.items():
-        if pattern in style_lower:
-            return level
+    # 숫자 ID는 header.xml 스타일 테이블에서 바로 찾는다
+    if style_levels and style_id.isdecimal():
+        index = int(style_id)
+        return style_levels[index] if index < len(style_levels) else 0
 
-    return 0
-
-
-# ---------------------------------------------------------------------------
-# Table parsing
-# ---------------------------------------------------------------------------
-def _parse_table_element(tbl_elem: ET.Element) -> Table:
-    """<tbl> 요소를 Table로 파싱한다."""
-    table = Table()
-
-    for tr in _children(tbl_elem, "tr"):
-        row = TableRow()
-        for tc in _children(tr, "tc"):
-            cell = _parse_table_cell(tc)
-            row.cells.append(cell)
-        if row.cells:
-            table.rows.append(row)
-
-    return table
-
-
-def _parse_table_cell(tc_elem: ET.Element) -> TableCell:
-    """<tc> 요소를 TableCell로 파싱한다. 중첩 테이블도 지원."""
-    cell = TableCell()
-
-    for child in tc_elem:
-        tag = _strip_ns(child)
-        if tag == "p":
-            para = _parse_paragraph_element(child)
-            if para:
-                cell.content.append(para)
-            # 문단 내부 중첩 테이블
-            for p_child in child:
-                if _strip_ns(p_child) == "tbl":
-                    nested = _parse_table_element(p_child)
-                    if nested and nested.rows:
-                        cell.content.append(nested)
-        elif tag == "tbl":
-            nested = _parse_table_element(child)
-            if nested and nested.rows:
-                cell.content.append(nested)
-        elif tag == "subList":
-            for sub_child in child:
-                sub_tag = _strip_ns(sub_child)
-                if sub_tag == "p":
-                    para = _parse_paragraph_element(sub_child)
-                    if para:
-                        cell.content.append(para)
-                elif sub_tag == "tbl":
-                    nested = _parse_table_element(sub_child)
-                    if nested and nested.rows:
-                        cell.content.append(nested)
-
-    return cell
+    # 스타일 ID 패턴 확인 (이름으로 참조하는 변형)
+    return heading_level_from_style(style_id)
 
 
 # ---------------------------------------------------------------------------
 # Section XML parsing
 # ---------------------------------------------------------------------------
-def _parse_section_xml(xml_data: bytes) -> list[Paragraph | Table]:
+def _parse_section_xml(
+    xml_data: bytes,
+    walker: _SectionWalker | None = None,
+    backend: _XmlBackend = _ETREE_BACKEND,
+) -> list[Paragraph | Table | Image]:
     """섹션 XML을 파싱하여 문서 요소 리스트를 반환한다."""
-    elements: list[Paragraph | Table] = []
-    root = ET.fromstring(xml_data)
-    _process_element(root, elements)
+    if walker is None:
+        walker = _SectionWalker()
+    elements: list[Paragraph | Table | Image] = []
+    root = backend.fromstring(xml_data)
+    walker.process(root, elements)
     return elements
 
 
+def _iter_section_stream(
+    source: IO[bytes],
+    walker: _SectionWalker | None = None,
+    backend: _XmlBackend = _ETREE_BACKEND,
+) -> Iterator[Paragraph | Table | Image]:
+    """섹션 XML을 iterparse로 읽으며 최상위 <p>/<tbl>이 닫힐 때마다 요소를 yield한다.
+
+    처리가 끝난 하위 트리는 부모에서 떼어내므로, 섹션이 아무리 커도
+    메모리에는 현재 읽고 있는 블록 하나만 남는다.
+    """
+    if walker is None:
+        walker = _SectionWalker()
+    for block in backend.iter_blocks(source, walker.tags):
+        elements: list[Paragraph | Table | Image] = []
+        walker.process(block, elements)
+        yield from elements
+
+
+def _read_section(
+    zf: zipfile.ZipFile,
+    section_file: str,
+    walker: _SectionWalker,
+    backend: _XmlBackend,
+    streaming: bool,
+) -> list[Paragraph | Table | Image]:
+    """아카이브에서 섹션 하나를 읽어 요소 리스트를 반환한다."""
+    if streaming:
+        with zf.open(section_file) as fp:
+            return list(_iter_section_stream(fp, walker, backend))
+    return _parse_section_xml(zf.read(section_file), walker, backend)
+
+
+def _parse_section_file(
+    path: str,
+    section_file: str,
+    streaming: bool,
+    backend: str,
+    style_levels: Sequence[int] = (),
+    binaries: Mapping[str, BinaryData] | None = None,
+) -> list[Paragraph | Table | Image]:
+    """섹션 하나를 파싱한다 (executor 작업 단위, pickle 가능).
+
+    ZipFile 객체는 pickle할 수 없고 공유하면 읽기가 한 파일 핸들에 묶이므로,
+    작업마다 아카이브를 새로 열어 압축 해제까지 작업자 안에서 처리한다.
+    """
+    with zipfile.ZipFile(path, "r") as zf:
+        return _read_section(
+            zf,
+            section_file,
+            _SectionWalker(style_levels, binaries),
+            _resolve_backend(backend),
+            streaming,
+        )
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
-def parse_hwpx(filepath: str | Path) -> Document:
-    """HWPX 파일을 파싱하여 Document를 반환한다."""
+def parse_hwpx(
+    filepath: str | Path,
+    *,
+    streaming: bool = False,
+    backend: str = "auto",
+    executor: Executor | None = None,
+) -> Document:
+    """HWPX 파일을 파싱하여 Document를 반환한다.
+
+    Args:
+        filepath: HWPX 파일 경로
+        streaming: True면 섹션 XML을 통째로 읽지 않고 iterparse로 흘려 읽는다.
+            수십 MB 이상의 섹션에서도 메모리 사용량이 일정하게 유지된다.
+        backend: XML 파서. "auto"는 lxml이 설치되어 있으면 lxml을, 아니면
+            표준 라이브러리 ElementTree를 쓴다. "lxml"/"etree"로 고정할 수 있다.
+        executor: 지정하면 섹션별 압축 해제와 XML 파싱을 이 executor에서 동시에
+            실행하고 결과를 매니페스트 순서대로 합친다. XML 트리 순회는 순수
+            Python이므로 여러 코어를 쓰려면 ProcessPoolExecutor를 사용한다.
+
+    문단 안의 그림(<hp:pic>)은 Image로 추출된다. 이미지 바이트는 파싱 중에 읽지
+    않고 ``Image.read()``/``Image.binary``로 접근할 때 BinData 멤버에서 읽는다.
+    """
     path = Path(filepath)
     if not path.exists():
         raise ParseError(f"파일을 찾을 수 없습니다: {path}")
 
+    xml_backend = _resolve_backend(backend)
     doc = Document(metadata=Metadata(source_format="hwpx"))
 
     try:
@@ -253,10 +752,30 @@ def parse_hwpx(filepath: str | Path) -> Document:
         raise ParseError(f"유효한 HWPX 파일이 아닙니다: {path}") from e
     with zf:
         section_files = _find_section_files(zf)
-        for section_file in section_files:
-            xml_data = zf.read(section_file)
-            elements = _parse_section_xml(xml_data)
-            doc.elements.extend(elements)
+        style_levels = _read_style_levels(zf, xml_backend)
+        binaries = _read_bin_items(zf, str(path.absolute()))
+        if executor is None:
+            walker = _SectionWalker(style_levels, binaries)
+            for section_file in section_files:
+                doc.elements.extend(
+                    _read_section(zf, section_file, walker, xml_backend, streaming)
+                )
+            return doc
+
+    futures = [
+        executor.submit(
+            _parse_section_file,
+            str(path),
+            name,
+            streaming,
+            backend,
+            style_levels,
+            binaries,
+        )
+        for name in section_files
+    ]
+    for future in futures:
+        doc.elements.extend(future.result())
 
     return doc
 
@@ -269,5 +788,13 @@ class HwpxParser:
         return [".hwpx"]
 
     @staticmethod
-    def parse(filepath: Path | str) -> Document:
-        return parse_hwpx(filepath)
+    def parse(
+        filepath: Path | str,
+        *,
+        streaming: bool = False,
+        backend: str = "auto",
+        executor: Executor | None = None,
+    ) -> Document:
+        return parse_hwpx(
+            filepath, streaming=streaming, backend=backend, executor=executor
+        )
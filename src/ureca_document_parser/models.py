@@ -6,6 +6,8 @@ Writers consume this model to generate output in various formats.
 
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 
@@ -30,12 +32,45 @@ class Table:
     rows: list[TableRow] = field(default_factory=list)
 
 
+@dataclass
+class BinaryData:
+    """Embedded binary payload (HWP BinData stream, HWPX BinData member).
+
+    Only the container path and member name are kept. Bytes are read through
+    ``loader(source, name)`` on each :meth:`read`, so large payloads stay out of
+    memory unless the caller keeps them. ``loader`` must be a module-level
+    function so that documents remain picklable.
+    """
+
+    source: str
+    name: str
+    loader: Callable[[str, str], bytes] = field(repr=False)
+    _digest: str = field(default="", init=False, repr=False, compare=False)
+
+    def read(self) -> bytes:
+        return self.loader(self.source, self.name)
+
+    @property
+    def digest(self) -> str:
+        """Content hash (BLAKE2b, hex). Computed on first access."""
+        if not self._digest:
+            self._digest = hashlib.blake2b(self.read(), digest_size=16).hexdigest()
+        return self._digest
+
+
 @dataclass
 class Image:
     alt_text: str = ""
     source: str = ""
     data: bytes = b""
     ocr_text: str = ""
+    binary: BinaryData | None = None  # lazy payload; see read()
+
+    def read(self) -> bytes:
+        """Return image bytes, loading them from ``binary`` if not held inline."""
+        if self.data or self.binary is None:
+            return self.data
+        return self.binary.read()
 
 
 @dataclass
@@ -75,3 +110,27 @@ class ParseError(Exception):
 class Document:
     elements: list[DocumentElement] = field(default_factory=list)
     metadata: Metadata = field(default_factory=Metadata)
+
+    def images(self) -> list[Image]:
+        return [e for e in self.elements if isinstance(e, Image)]
+
+    def unique_images(self) -> list[Image]:
+        """Images deduplicated by content hash, in document order.
+
+        Payloads are hashed one at a time and not kept, so memory stays bounded
+        by the largest single image. Images without bytes are always kept.
+        """
+        seen: set[str] = set()
+        unique: list[Image] = []
+        for image in self.images():
+            if image.binary is not None and not image.data:
+                key = image.binary.digest
+            elif image.data:
+                key = hashlib.blake2b(image.data, digest_size=16).hexdigest()
+            else:
+                unique.append(image)
+                continue
+            if key not in seen:
+                seen.add(key)
+                unique.append(image)
+        return unique
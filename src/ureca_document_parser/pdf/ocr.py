@@ -0,0 +1,215 @@
+"""OCR for image-only PDF pages using pillow + pytesseract.
+
+Pages without a text layer are rasterized with pymupdf and passed to
+tesseract. Rendered pages and recognized text are cached by a hash of the
+page content, so the same scanned page is never OCR'd twice.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import BytesIO
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..models import ParseError
+
+if TYPE_CHECKING:
+    from os import PathLike
+    from types import ModuleType
+
+DEFAULT_OCR_DPI = 300
+DEFAULT_OCR_LANG = "kor+eng"
+
+
+def _import_ocr() -> tuple[ModuleType, ModuleType]:
+    """Import pillow and pytesseract, raising ParseError with a hint if missing."""
+    try:
+        import pytesseract
+        from PIL import Image as PILImage
+    except ImportError:
+        raise ParseError(
+            "PDF OCR requires pillow and pytesseract. "
+            "Install with: pip install ureca_document_parser[ocr]"
+        ) from None
+    return PILImage, pytesseract
+
+
+def page_content_hash(doc: Any, page_no: int) -> str:
+    """Hash what a page looks like: geometry, content streams and image data.
+
+    The image streams are hashed raw (still compressed), since two scanned
+    pages usually share an identical ``/Im0 Do`` content stream.
+    """
+    page = doc[page_no]
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{tuple(page.rect)}:{page.rotation}".encode())
+    h.update(page.read_contents())
+    for xref, *_ in page.get_images(full=True):
+        h.update(doc.xref_stream_raw(xref) or b"")
+    return h.hexdigest()
+
+
+class OcrCache:
+    """Directory of rendered pages (``.png``) and OCR results (``.txt``)."""
+
+    def __init__(self, directory: str | PathLike[str]) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def image_name(key: str, dpi: int) -> str:
+        return f"{key}-{dpi}.png"
+
+    @staticmethod
+    def text_name(key: str, dpi: int, lang: str) -> str:
+        return f"{key}-{dpi}-{lang}.txt"
+
+    def load(self, name: str) -> bytes | None:
+        try:
+            return (self.directory / name).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def store(self, name: str, data: bytes) -> None:
+        """Write atomically, so concurrent workers never see a partial file."""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.directory / name)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def _render_page(doc: Any, page_no: int, dpi: int) -> bytes:
+    return doc[page_no].get_pixmap(dpi=dpi).tobytes("png")
+
+
+def _recognize(
+    render: Callable[[], bytes],
+    key: str,
+    dpi: int,
+    lang: str,
+    cache: OcrCache | None,
+    pil_image: ModuleType,
+    pytesseract: ModuleType,
+) -> str:
+    """OCR one page, reusing a cached render and storing both results.
+
+    ``render`` is only called when the rendered page is not cached.
+    """
+    png = cache.load(OcrCache.image_name(key, dpi)) if cache is not None else None
+    if png is None:
+        png = render()
+        if cache is not None:
+            cache.store(OcrCache.image_name(key, dpi), png)
+
+    with pil_image.open(BytesIO(png)) as image:
+        text: str = pytesseract.image_to_string(image, lang=lang)
+
+    if cache is not None:
+        cache.store(OcrCache.text_name(key, dpi, lang), text.encode("utf-8"))
+    return text
+
+
+def _render_from_path(path: str, page_no: int, dpi: int) -> bytes:
+    """Open the PDF in a pool worker and render one page."""
+    from .parser import _import_fitz
+
+    fitz = _import_fitz()
+    with fitz.open(path) as doc:
+        return _render_page(doc, page_no, dpi)
+
+
+def _ocr_page(
+    path: str, page_no: int, key: str, dpi: int, lang: str, cache_dir: str | None
+) -> str:
+    """Rasterize and OCR one page — process pool task (picklable)."""
+    pil_image, pytesseract = _import_ocr()
+    cache = OcrCache(cache_dir) if cache_dir is not None else None
+    render = partial(_render_from_path, path, page_no, dpi)
+    return _recognize(render, key, dpi, lang, cache, pil_image, pytesseract)
+
+
+def ocr_pages(
+    path: str,
+    doc: Any,
+    page_numbers: list[int],
+    *,
+    dpi: int = DEFAULT_OCR_DPI,
+    lang: str = DEFAULT_OCR_LANG,
+    workers: int = 1,
+    cache_dir: str | PathLike[str] | None = None,
+) -> dict[int, str]:
+    """OCR the given pages of ``doc`` (opened from ``path``).
+
+    Returns {page number: recognized text}.
+
+    Pages without images are skipped (nothing to recognize). Pages with the
+    same content hash are OCR'd once, and cached results are reused without
+    importing tesseract at all.
+    """
+    cache = OcrCache(cache_dir) if cache_dir is not None else None
+
+    keys: dict[int, str] = {}
+    for page_no in page_numbers:
+        if doc[page_no].get_images():
+            keys[page_no] = page_content_hash(doc, page_no)
+
+    texts: dict[str, str] = {}
+    if cache is not None:
+        for key in set(keys.values()):
+            cached = cache.load(OcrCache.text_name(key, dpi, lang))
+            if cached is not None:
+                texts[key] = cached.decode("utf-8")
+
+    # One job per distinct uncached page content
+    jobs: dict[str, int] = {}
+    for page_no, key in keys.items():
+        if key not in texts:
+            jobs.setdefault(key, page_no)
+
+    if jobs:
+        pil_image, pytesseract = _import_ocr()
+        job_keys = list(jobs)
+        job_pages = list(jobs.values())
+
+        if workers > 1 and len(jobs) > 1:
+            cache_arg = str(cache.directory) if cache is not None else None
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+                results = list(
+                    pool.map(
+                        _ocr_page,
+                        repeat(path),
+                        job_pages,
+                        job_keys,
+                        repeat(dpi),
+                        repeat(lang),
+                        repeat(cache_arg),
+                    )
+                )
+        else:
+            # Serial path: render from the already open document
+            results = [
+                _recognize(
+                    partial(_render_page, doc, page_no, dpi),
+                    key,
+                    dpi,
+                    lang,
+                    cache,
+                    pil_image,
+                    pytesseract,
+                )
+                for page_no, key in zip(job_pages, job_keys, strict=True)
+            ]
+        texts.update(zip(job_keys, results, strict=True))
+
+    return {page_no: texts[key] for page_no, key in keys.items()}
@@ -2,13 +2,249 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import repeat
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from ..models import Document, Metadata, Paragraph, ParseError
+from ..models import Document, DocumentElement, Metadata, Paragraph, ParseError
+from .ocr import DEFAULT_OCR_DPI, DEFAULT_OCR_LANG, ocr_pages
 
 if TYPE_CHECKING:
     from os import PathLike
+    from types import ModuleType
+
+DEFAULT_CHUNK_SIZE = 16  # pages per worker task
+
+PDF_MODES = ("text", "dict")
+
+MAX_HEADING_LEVEL = 6
+HEADING_SIZE_RATIO = 1.1  # a heading's font is at least 10% larger than body
+HEADING_MAX_CHARS = 200  # longer blocks are body text regardless of size
+
+# (block text, dominant font size rounded to 0.5pt)
+type _Block = tuple[str, float]
+
+
+def _import_fitz() -> ModuleType:
+    """Import pymupdf, raising ParseError with an install hint if missing."""
+    try:
+        import fitz  # pymupdf
+    except ImportError:
+        raise ParseError(
+            "PDF support requires pymupdf. "
+            "Install with: pip install ureca_document_parser[pdf]"
+        ) from None
+    return fitz
+
+
+def _read_metadata(doc: Any, path: Path) -> Metadata:
+    return Metadata(
+        title=doc.metadata.get("title") or path.stem,
+        author=doc.metadata.get("author") or "",
+        source_format="pdf",
+        extra={
+            "pages": doc.page_count,
+            "producer": doc.metadata.get("producer", ""),
+            "creator": doc.metadata.get("creator", ""),
+        },
+    )
+
+
+def _page_paragraphs(page: Any) -> list[Paragraph]:
+    """Extract paragraphs from a single page."""
+    return _split_paragraphs(page.get_text())
+
+
+def _split_paragraphs(text: str) -> list[Paragraph]:
+    paragraphs = []
+    # Split by paragraphs (double newline)
+    for para_text in text.split("\n\n"):
+        # Clean up whitespace
+        cleaned = " ".join(para_text.split())
+
+        if cleaned:  # Skip empty paragraphs
+            paragraphs.append(Paragraph(text=cleaned, heading_level=0))
+
+    return paragraphs
+
+
+def _page_blocks(page: Any, flags: int, histogram: Counter[float]) -> list[_Block]:
+    """Build one block per PyMuPDF text block, updating the font-size histogram.
+
+    Spans are joined as-is within a line and lines are joined with a single
+    space, so no per-page split/rejoin of the full text is needed.
+    """
+    blocks: list[_Block] = []
+    for block in page.get_text("dict", flags=flags)["blocks"]:
+        if block["type"] != 0:  # image block
+            continue
+
+        lines = []
+        size_chars: dict[float, int] = {}
+        for line in block["lines"]:
+            parts = []
+            for span in line["spans"]:
+                text = span["text"]
+                parts.append(text)
+                size = round(span["size"] * 2) / 2
+                size_chars[size] = size_chars.get(size, 0) + len(text)
+            line_text = "".join(parts).strip()
+            if line_text:
+                lines.append(line_text)
+
+        if not lines:
+            continue
+
+        text = " ".join(lines)
+        size = max(size_chars, key=size_chars.__getitem__)
+        histogram[size] += len(text)
+        blocks.append((text, size))
+
+    return blocks
+
+
+def _heading_sizes(histogram: Counter[float]) -> dict[float, int]:
+    """Map font sizes larger than the body size to heading levels.
+
+    The body size is the size covering the most characters in the document;
+    larger sizes rank from level 1 (largest) down to MAX_HEADING_LEVEL.
+    """
+    if not histogram:
+        return {}
+
+    body_size = histogram.most_common(1)[0][0]
+    threshold = body_size * HEADING_SIZE_RATIO
+    larger = sorted((size for size in histogram if size >= threshold), reverse=True)
+    return {size: min(rank, MAX_HEADING_LEVEL) for rank, size in enumerate(larger, 1)}
+
+
+def _blocks_to_paragraphs(
+    blocks: list[_Block], histogram: Counter[float]
+) -> list[Paragraph]:
+    levels = _heading_sizes(histogram)
+    return [
+        Paragraph(
+            text=text,
+            heading_level=levels.get(size, 0) if len(text) <= HEADING_MAX_CHARS else 0,
+        )
+        for text, size in blocks
+    ]
+
+
+# Extractor result: one list per page (paragraphs or blocks) and the
+# font-size histogram of those pages (empty in text mode).
+type _PageResults = tuple[list[list[Any]], Counter[float]]
+
+
+def _text_pages(doc: Any, page_numbers: list[int]) -> _PageResults:
+    return [_page_paragraphs(doc[page_no]) for page_no in page_numbers], Counter()
+
+
+def _dict_pages(doc: Any, page_numbers: list[int]) -> _PageResults:
+    fitz = _import_fitz()
+    flags = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+    histogram: Counter[float] = Counter()
+    pages = [_page_blocks(doc[page_no], flags, histogram) for page_no in page_numbers]
+    return pages, histogram
+
+
+_MODE_EXTRACTORS: dict[str, Callable[[Any, list[int]], _PageResults]] = {
+    "text": _text_pages,
+    "dict": _dict_pages,
+}
+
+
+def _merge_results(results: Iterable[_PageResults]) -> _PageResults:
+    """Combine per-chunk extractor results, in page order."""
+    pages: list[list[Any]] = []
+    histogram: Counter[float] = Counter()
+    for chunk_pages, chunk_histogram in results:
+        pages.extend(chunk_pages)
+        histogram.update(chunk_histogram)
+    return pages, histogram
+
+
+def _fill_ocr_pages(
+    mode: str,
+    page_numbers: list[int],
+    pages: list[list[Any]],
+    ocr_texts: dict[int, str],
+) -> None:
+    """Replace the empty results of OCR'd pages with their recognized text."""
+    for index, page_no in enumerate(page_numbers):
+        text = ocr_texts.get(page_no)
+        if not text:
+            continue
+        paragraphs = _split_paragraphs(text)
+        if mode == "text":
+            pages[index] = paragraphs
+        else:
+            # OCR has no font sizes: never a heading, not in the histogram.
+            pages[index] = [(para.text, 0.0) for para in paragraphs]
+
+
+def _to_paragraphs(
+    mode: str, pages: list[list[Any]], histogram: Counter[float]
+) -> list[Paragraph]:
+    if mode == "text":
+        return [para for page in pages for para in page]
+
+    # The heading levels depend on the whole document's font sizes, so they
+    # are only assigned once every chunk's histogram has been merged.
+    return _blocks_to_paragraphs([block for page in pages for block in page], histogram)
+
+
+def _check_max_pages(max_pages: int | None) -> None:
+    if max_pages is not None and max_pages < 0:
+        raise ValueError("max_pages must be non-negative")
+
+
+def _select_pages(
+    page_count: int, pages: Iterable[int] | None, max_pages: int | None
+) -> list[int]:
+    """Resolve the 0-based page numbers to extract, in extraction order."""
+    if pages is None:
+        selected = list(range(page_count))
+    else:
+        selected = list(pages)
+        for page_no in selected:
+            if not 0 <= page_no < page_count:
+                raise ValueError(
+                    f"Page {page_no} out of range (document has {page_count} pages)"
+                )
+
+    if max_pages is not None:
+        del selected[max_pages:]
+    return selected
+
+
+def _extract_pages(path: str, page_numbers: list[int], mode: str) -> _PageResults:
+    """Extract the given pages — process pool task (picklable).
+
+    Each worker opens the file itself; pymupdf documents cannot be shared
+    between processes.
+    """
+    fitz = _import_fitz()
+    with fitz.open(path) as doc:
+        return _MODE_EXTRACTORS[mode](doc, page_numbers)
+
+
+def _extract_parallel(
+    path: str, page_numbers: list[int], mode: str, workers: int, chunk_size: int
+) -> list[_PageResults]:
+    """Shard pages into chunk_size runs across a process pool, in page order."""
+    chunks = [
+        page_numbers[start : start + chunk_size]
+        for start in range(0, len(page_numbers), chunk_size)
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_extract_pages, repeat(path), chunks, repeat(mode)))
 
 
 class PdfParser:
@@ -23,67 +259,162 @@ class PdfParser:
         return [".pdf"]
 
     @staticmethod
-    def parse(file_path: str | PathLike[str]) -> Document:
+    def parse(
+        file_path: str | PathLike[str],
+        *,
+        pages: Iterable[int] | None = None,
+        max_pages: int | None = None,
+        mode: str = "text",
+        workers: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ocr: bool = False,
+        ocr_dpi: int = DEFAULT_OCR_DPI,
+        ocr_lang: str = DEFAULT_OCR_LANG,
+        ocr_cache: str | PathLike[str] | None = None,
+    ) -> Document:
         """Parse PDF file and return Document.
 
         Args:
             file_path: Path to PDF file
+            pages: 0-based page numbers to extract, in order. ``None`` means
+                every page.
+            max_pages: Stop after this many pages of the selection.
+            mode: ``"text"`` splits each page's plain text on blank lines.
+                ``"dict"`` builds one paragraph per PyMuPDF text block and
+                assigns heading levels from a document-wide font-size
+                histogram (the most common size is body text).
+            workers: Number of worker processes. With more than one worker,
+                pages are split into ranges of ``chunk_size`` and extracted in
+                a process pool; each worker opens the file itself. Elements
+                are merged back in page order.
+            chunk_size: Pages per worker task. Smaller chunks balance uneven
+                pages better; larger chunks amortize the per-task file open.
+            ocr: Run tesseract on pages that have images but no text layer
+                (requires the ``ocr`` extra). Recognized text replaces the
+                page's empty output. OCR runs one page per task across
+                ``workers`` processes.
+            ocr_dpi: Resolution used to rasterize pages for OCR.
+            ocr_lang: Tesseract language(s), e.g. ``"kor+eng"``.
+            ocr_cache: Directory caching rendered pages and OCR results by
+                page content hash, so a page is never OCR'd twice across runs.
 
         Returns:
             Document with extracted content
 
         Raises:
             ParseError: If file cannot be parsed
+            ValueError: If a page number is out of range or an option is invalid
         """
-        try:
-            import fitz  # pymupdf
-        except ImportError:
-            raise ParseError(
-                "PDF support requires pymupdf. "
-                "Install with: pip install ureca_document_parser[pdf]"
-            ) from None
+        if workers < 1 or chunk_size < 1:
+            raise ValueError("workers and chunk_size must be at least 1")
+        _check_max_pages(max_pages)
+        if mode not in PDF_MODES:
+            raise ValueError(f"Unsupported PDF mode: {mode!r}")
+        if ocr_dpi < 1:
+            raise ValueError("ocr_dpi must be at least 1")
 
+        fitz = _import_fitz()
         path = Path(file_path)
 
         try:
-            # Open PDF
-            doc = fitz.open(path)
+            with fitz.open(path) as doc:
+                metadata = _read_metadata(doc, path)
+                page_numbers = _select_pages(doc.page_count, pages, max_pages)
+                parallel = workers > 1 and len(page_numbers) > chunk_size
 
-            # Extract metadata
-            metadata = Metadata(
-                title=doc.metadata.get("title") or path.stem,
-                author=doc.metadata.get("author") or "",
-                source_format="pdf",
-                extra={
-                    "pages": doc.page_count,
-                    "producer": doc.metadata.get("producer", ""),
-                    "creator": doc.metadata.get("creator", ""),
-                },
-            )
-
-            # Extract text from each page
-            elements = []
-            for page in doc:
-                text = page.get_text()
-
-                # Split by paragraphs (double newline)
-                paragraphs = text.split("\n\n")
-
-                for para_text in paragraphs:
-                    # Clean up whitespace
-                    cleaned = " ".join(para_text.split())
-
-                    if cleaned:  # Skip empty paragraphs
-                        elements.append(
-                            Paragraph(
-                                text=cleaned,
-                                heading_level=0,
-                            )
-                        )
-
-            doc.close()
+                if parallel:
+                    results = _extract_parallel(
+                        str(path), page_numbers, mode, workers, chunk_size
+                    )
+                else:
+                    results = [_MODE_EXTRACTORS[mode](doc, page_numbers)]
+                pages_out, histogram = _merge_results(results)
 
+                if ocr:
+                    blank = [
+                        page_no
+                        for page_no, found in zip(page_numbers, pages_out, strict=True)
+                        if not found
+                    ]
+                    ocr_texts = ocr_pages(
+                        str(path),
+                        doc,
+                        blank,
+                        dpi=ocr_dpi,
+                        lang=ocr_lang,
+                        workers=workers,
+                        cache_dir=ocr_cache,
+                    )
+                    _fill_ocr_pages(mode, page_numbers, pages_out, ocr_texts)
+                    metadata.extra["ocr_pages"] = str(len(ocr_texts))
+
+            elements: list[DocumentElement] = []
+            elements.extend(_to_paragraphs(mode, pages_out, histogram))
             return Document(elements=elements, metadata=metadata)
 
+        except (ParseError, ValueError):
+            raise
+        except Exception as e:
+            raise ParseError(f"Failed to parse PDF: {e}") from e
+
+    @staticmethod
+    def iter_pages(
+        file_path: str | PathLike[str],
+        *,
+        pages: Iterable[int] | None = None,
+        max_pages: int | None = None,
+    ) -> Iterator[Document]:
+        """Yield one Document fragment per page as it is extracted.
+
+        Pages are read lazily, so a caller can show the first page
+        immediately or stop early without touching the rest of the file.
+        Each fragment shares the document metadata, with the 0-based page
+        number added under ``extra["page"]`` (as a string).
+
+        Args:
+            file_path: Path to PDF file
+            pages: 0-based page numbers to extract, in order. ``None`` means
+                every page.
+            max_pages: Stop after this many pages of the selection.
+
+        Yields:
+            Document holding the paragraphs of a single page
+
+        Raises:
+            ParseError: If file cannot be parsed
+            ValueError: If a page number is out of range or max_pages < 0
+        """
+        _check_max_pages(max_pages)
+        fitz = _import_fitz()
+        path = Path(file_path)
+
+        try:
+            doc = fitz.open(path)
         except Exception as e:
             raise ParseError(f"Failed to parse PDF: {e}") from e
+
+        with doc:
+            metadata = _read_metadata(doc, path)
+            for page_no in _select_pages(doc.page_count, pages, max_pages):
+                try:
+                    paragraphs = _page_paragraphs(doc[page_no])
+                except Exception as e:
+                    raise ParseError(f"Failed to parse PDF page {page_no}: {e}") from e
+
+                page_metadata = replace(
+                    metadata, extra={**metadata.extra, "page": str(page_no)}
+                )
+                yield Document(elements=list(paragraphs), metadata=page_metadata)
+
+    @staticmethod
+    def iter_elements(
+        file_path: str | PathLike[str],
+        *,
+        pages: Iterable[int] | None = None,
+        max_pages: int | None = None,
+    ) -> Iterator[DocumentElement]:
+        """Yield elements page by page; see :meth:`iter_pages`."""
+        for fragment in PdfParser.iter_pages(
+            file_path, pages=pages, max_pages=max_pages
+        ):
+            yield from fragment.elements
@@ -7,7 +7,7 @@ No inheritance required; just match the method signatures.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Protocol
+from typing import Protocol, TextIO
 
 from .models import Document
 
@@ -43,3 +43,16 @@ class Writer(Protocol):
     def write(doc: Document) -> str:
         """Convert a Document to the output format string."""
         ...
+
+
+class StreamingWriter(Writer, Protocol):
+    """Writer that can also emit output incrementally to a text stream.
+
+    ``write_to`` is optional: FormatRegistry.write_to uses it when present and
+    falls back to writing the result of ``write`` otherwise.
+    """
+
+    @staticmethod
+    def write_to(doc: Document, stream: TextIO) -> None:
+        """Write a Document to ``stream`` without building the whole string."""
+        ...
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import threading
 from pathlib import Path
+from typing import TextIO
 
 from .models import Document
 from .protocols import Parser, Writer
@@ -41,15 +42,27 @@ class FormatRegistry:
             )
         return parser_cls.parse(path)
 
-    def write(self, doc: Document, format_name: str) -> str:
-        """Write a document using the specified output format."""
+    def get_writer(self, format_name: str) -> type[Writer]:
+        """Look up the writer class for an output format."""
         writer_cls = self._writers.get(format_name.lower())
         if writer_cls is None:
             supported = ", ".join(sorted(self._writers.keys()))
             raise ValueError(
                 f"지원하지 않는 출력 형식입니다: {format_name} (지원: {supported})"
             )
-        return writer_cls.write(doc)
+        return writer_cls
+
+    def write(self, doc: Document, format_name: str) -> str:
+        """Write a document using the specified output format."""
+        return self.get_writer(format_name).write(doc)
+
+    def write_to(self, doc: Document, format_name: str, stream: TextIO) -> None:
+        """Write a document to a text stream using the specified output format.
+
+        Uses the writer's optional ``write_to`` (see StreamingWriter) so output
+        is emitted incrementally; otherwise writes the full ``write`` result.
+        """
+        write_with(self.get_writer(format_name), doc, stream)
 
     @property
     def supported_extensions(self) -> list[str]:
@@ -62,6 +75,19 @@ class FormatRegistry:
         return sorted(self._writers.keys())
 
 
+def write_with(writer_cls: type[Writer], doc: Document, stream: TextIO) -> None:
+    """Write a document to a text stream with an already resolved writer.
+
+    Streams through the writer's optional ``write_to`` when it has one,
+    otherwise writes the full ``write`` result.
+    """
+    write_to = getattr(writer_cls, "write_to", None)
+    if write_to is not None:
+        write_to(doc, stream)
+    else:
+        stream.write(writer_cls.write(doc))
+
+
 _registry: FormatRegistry | None = None
 _registry_lock = threading.Lock()
 
@@ -90,11 +116,12 @@ def _auto_register(registry: FormatRegistry) -> None:
     """Auto-discover and register all built-in parsers and writers."""
     from .hwp import HwpParser
     from .hwpx import HwpxParser
-    from .writers.markdown import MarkdownWriter
+    from .writers.markdown import CompactMarkdownWriter, MarkdownWriter
 
     registry.register_parser(HwpParser)
     registry.register_parser(HwpxParser)
     registry.register_writer(MarkdownWriter)
+    registry.register_writer(CompactMarkdownWriter)
 
     # Optional parsers (require extra dependencies)
     try:
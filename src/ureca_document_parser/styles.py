@@ -5,10 +5,14 @@ Maps style names (Korean / English) to heading levels.
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
 # ---------------------------------------------------------------------------
 # Heading style patterns
 # ---------------------------------------------------------------------------
 # Keys are lowercased for case-insensitive matching.
+# Earlier entries win when several patterns occur in the same style name.
 HEADING_STYLE_PATTERNS: dict[str, int] = {
     "outline1": 1,
     "outline2": 2,
@@ -28,11 +32,22 @@ HEADING_STYLE_PATTERNS: dict[str, int] = {
     "title": 1,
 }
 
+# 모든 패턴을 하나의 정규식으로 컴파일한다. lookahead로 감싸서 서로 겹치는
+# 위치의 일치(예: "subtitle" 안의 "title")도 빠짐없이 찾는다.
+_HEADING_PATTERN_RE = re.compile(
+    "(?=(" + "|".join(re.escape(p) for p in HEADING_STYLE_PATTERNS) + "))"
+)
+_PATTERN_PRIORITY: dict[str, int] = {
+    pattern: priority for priority, pattern in enumerate(HEADING_STYLE_PATTERNS)
+}
+
 
+@lru_cache(maxsize=1024)
 def heading_level_from_style(style_name: str) -> int:
     """Return heading level (1-6) for *style_name*, or 0 for normal text."""
-    lower = style_name.lower()
-    for pattern, level in HEADING_STYLE_PATTERNS.items():
-        if pattern in lower:
-            return level
-    return 0
+    best: str | None = None
+    for match in _HEADING_PATTERN_RE.finditer(style_name.lower()):
+        pattern = match.group(1)
+        if best is None or _PATTERN_PRIORITY[pattern] < _PATTERN_PRIORITY[best]:
+            best = pattern
+    return HEADING_STYLE_PATTERNS[best] if best is not None else 0
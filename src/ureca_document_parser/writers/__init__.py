@@ -1,3 +1,11 @@
-from .markdown import MarkdownWriter
+from .dispatch import RendererTable
+from .markdown import CompactMarkdownWriter, MarkdownWriter
+from .sourcemap import SourceMap, SourceMapEntry
 
-__all__ = ["MarkdownWriter"]
+__all__ = [
+    "CompactMarkdownWriter",
+    "MarkdownWriter",
+    "RendererTable",
+    "SourceMap",
+    "SourceMapEntry",
+]
@@ -0,0 +1,24 @@
+"""Type → renderer dispatch table shared by writers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+
+class RendererTable[R](dict[type, Callable[[Any], R] | None]):
+    """요소 타입 → 렌더러 매핑.
+
+    isinstance 체인 대신 ``table[type(element)]`` 한 번으로 렌더러를 찾는다.
+    등록되지 않은 타입은 MRO를 따라 상위 타입의 렌더러로 해석하고 결과를
+    캐시한다. 어디에도 없으면 None (렌더링하지 않음).
+    """
+
+    def __missing__(self, cls: type) -> Callable[[Any], R] | None:
+        render = None
+        for base in cls.__mro__[1:]:
+            if base in self:
+                render = dict.__getitem__(self, base)
+                break
+        self[cls] = render
+        return render
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from typing import TextIO, cast
+
 from ..models import (
     Document,
     HorizontalRule,
@@ -12,53 +15,134 @@ from ..models import (
     Table,
     TableCell,
 )
+from .dispatch import RendererTable
+from .sourcemap import SourceMap, SourceMapEntry
 
+_BLOCK_SEPARATOR = "\n\n"  # 블록 사이
+_LIST_SEPARATOR = "\n"  # 같은 리스트의 항목 사이
 
-def to_markdown(doc: Document) -> str:
-    """Document를 Markdown 문자열로 변환한다."""
-    blocks: list[str] = []
-    i = 0
-    elements = doc.elements
-
-    while i < len(elements):
-        element = elements[i]
 
-        if isinstance(element, ListItem):
-            # 연속 ListItem을 하나의 블록으로 그룹핑
-            list_lines: list[str] = []
-            ordered_counter = 0
-            while i < len(elements) and isinstance(elements[i], ListItem):
-                item = elements[i]
-                if item.ordered:
-                    ordered_counter += 1
-                else:
-                    ordered_counter = 0
-                list_lines.append(_render_list_item(item, ordered_counter))
-                i += 1
-            blocks.append("\n".join(list_lines))
-        elif isinstance(element, Paragraph):
-            blocks.append(_render_paragraph(element))
-            i += 1
-        elif isinstance(element, Table):
-            rendered = _render_table(element)
-            if rendered:
-                blocks.append(rendered)
-            i += 1
-        elif isinstance(element, Image):
-            blocks.append(_render_image(element))
-            i += 1
-        elif isinstance(element, Link):
-            blocks.append(_render_link(element))
-            i += 1
-        elif isinstance(element, HorizontalRule):
-            blocks.append("---")
-            i += 1
-        else:
-            i += 1
+def to_markdown(doc: Document, *, compact_tables: bool = False) -> str:
+    """Document를 Markdown 문자열로 변환한다.
 
+    compact_tables=True면 표 셀을 열 너비에 맞춰 채우지 않는다.
+    """
+    blocks = iter_markdown_blocks(doc, compact_tables=compact_tables)
     return "\n\n".join(blocks) + "\n"
 
 
+def write_markdown(
+    doc: Document, stream: TextIO, *, compact_tables: bool = False
+) -> None:
+    """Document를 Markdown으로 변환하며 블록 단위로 stream에 바로 쓴다.
+
+    출력은 to_markdown()과 같지만, 전체 문자열을 만들지 않으므로 메모리가
+    출력 크기에 비례해서 늘지 않는다.
+    """
+    separator = ""
+    for block in iter_markdown_blocks(doc, compact_tables=compact_tables):
+        stream.write(separator)
+        stream.write(block)
+        separator = "\n\n"
+    stream.write("\n")
+
+
+def to_markdown_with_source_map(
+    doc: Document, *, compact_tables: bool = False
+) -> tuple[str, SourceMap]:
+    """to_markdown()과 같은 문자열과 함께 요소별 위치 색인을 돌려준다.
+
+    각 요소의 [start, end) 문자 위치와 제목 경로를 기록하므로, 청크나 인용
+    위치를 SourceMap.lookup()으로 원래 구조에 되짚을 수 있다. 묶인 리스트는
+    항목마다 따로 기록된다.
+    """
+    parts: list[str] = []
+    entries: list[SourceMapEntry] = []
+    offset = 0
+    heading_stack: list[tuple[int, str]] = []
+    headings: tuple[str, ...] = ()
+
+    for index, kind, text, separator in _iter_rendered(doc, compact_tables):
+        element = doc.elements[index]
+        if isinstance(element, Paragraph) and element.heading_level > 0:
+            level = element.heading_level
+            while heading_stack and heading_stack[-1][0] >= level:
+                heading_stack.pop()
+            heading_stack.append((level, element.text))
+            headings = tuple(title for _, title in heading_stack)
+
+        if entries:
+            parts.append(separator)
+            offset += len(separator)
+        parts.append(text)
+        entries.append(
+            SourceMapEntry(
+                start=offset,
+                end=offset + len(text),
+                index=index,
+                kind=kind,
+                headings=headings,
+            )
+        )
+        offset += len(text)
+
+    parts.append("\n")
+    return "".join(parts), SourceMap(entries)
+
+
+def iter_markdown_blocks(
+    doc: Document, *, compact_tables: bool = False
+) -> Iterator[str]:
+    """Document 요소를 Markdown 블록 단위로 렌더링해서 하나씩 내보낸다."""
+    block: list[str] = []
+    for _, _, text, separator in _iter_rendered(doc, compact_tables):
+        if block and separator == _BLOCK_SEPARATOR:
+            yield "\n".join(block)
+            block = []
+        block.append(text)
+
+    if block:
+        yield "\n".join(block)
+
+
+def _iter_rendered(
+    doc: Document, compact_tables: bool
+) -> Iterator[tuple[int, str, str, str]]:
+    """출력되는 요소마다 (위치, 타입 이름, 텍스트, 앞 구분자)를 내보낸다.
+
+    연속 ListItem은 앞 항목과 "\n"으로, 그 밖의 요소는 "\n\n"으로 이어진다.
+    첫 요소의 구분자는 쓰이지 않는다. 리스트 그룹핑과 번호 매기기는 여기서만
+    처리하므로 블록 출력과 소스 맵이 항상 같은 문자열을 만든다.
+    """
+    renderers = _COMPACT_BLOCK_RENDERERS if compact_tables else _BLOCK_RENDERERS
+    in_list = False
+    ordered_counter = 0
+
+    for index, element in enumerate(doc.elements):
+        render = renderers[type(element)]
+
+        if render is _group_list_item:
+            # 연속 ListItem을 하나의 블록으로 그룹핑
+            item = cast(ListItem, element)
+            ordered_counter = ordered_counter + 1 if item.ordered else 0
+            separator = _LIST_SEPARATOR if in_list else _BLOCK_SEPARATOR
+            in_list = True
+            yield (
+                index,
+                type(element).__name__,
+                _render_list_item(item, ordered_counter),
+                separator,
+            )
+            continue
+
+        in_list = False
+        ordered_counter = 0
+        if render is not None:
+            block = render(element)
+            if block is not None:
+                yield index, type(element).__name__, block, _BLOCK_SEPARATOR
+
+
 def _render_paragraph(para: Paragraph) -> str:
     """Paragraph를 Markdown으로 렌더링한다."""
     text = para.text
@@ -72,10 +156,9 @@ def _render_cell_content(cell: TableCell) -> str:
     """셀 내용을 문자열로 렌더링한다. 중첩 표는 HTML table로 변환."""
     parts: list[str] = []
     for item in cell.content:
-        if isinstance(item, Paragraph) and item.text:
-            parts.append(item.text)
-        elif isinstance(item, Table):
-            parts.append(_render_nested_table_html(item))
+        render = _CELL_RENDERERS[type(item)]
+        if render is not None and (part := render(item)):
+            parts.append(part)
     text = "<br>".join(parts)
     text = text.replace("\n", "<br>")
     text = text.replace("|", "\\|")
@@ -95,31 +178,25 @@ def _render_nested_table_html(table: Table) -> str:
     return "".join(lines)
 
 
-def _render_table(table: Table) -> str:
-    """Table을 Markdown 파이프 테이블로 렌더링한다."""
+def _render_table(table: Table) -> str | None:
+    """Table을 Markdown 파이프 테이블로 렌더링한다. 빈 표는 None."""
     if not table.rows:
-        return ""
+        return None
 
     n_cols = max(len(row.cells) for row in table.rows)
     if n_cols == 0:
-        return ""
+        return None
 
-    # 셀 텍스트 매트릭스 생성
+    # 셀 텍스트 매트릭스 생성 (열 너비도 함께 계산)
     matrix: list[list[str]] = []
-    for row in table.rows:
-        row_texts: list[str] = []
-        for i in range(n_cols):
-            if i < len(row.cells):
-                row_texts.append(_render_cell_content(row.cells[i]))
-            else:
-                row_texts.append("")
-        matrix.append(row_texts)
-
-    # 열 너비 계산
     col_widths = [3] * n_cols
-    for row_texts in matrix:
+    for row in table.rows:
+        row_texts = [_render_cell_content(cell) for cell in row.cells]
+        row_texts.extend([""] * (n_cols - len(row_texts)))
         for i, text in enumerate(row_texts):
-            col_widths[i] = max(col_widths[i], len(text))
+            if len(text) > col_widths[i]:
+                col_widths[i] = len(text)
+        matrix.append(row_texts)
 
     # 헤더 행 (첫 행)
     lines: list[str] = []
@@ -142,6 +219,31 @@ def _render_table(table: Table) -> str:
     return "\n".join(lines)
 
 
+def _render_table_compact(table: Table) -> str | None:
+    """Table을 패딩 없는 파이프 테이블로 렌더링한다 (열 너비 계산 없음).
+
+    `| a | b |` 형태로 셀을 그대로 쓰고 구분자 행은 `| --- |`로 고정한다.
+    긴 셀 하나 때문에 모든 행이 공백으로 부풀지 않는다.
+    """
+    if not table.rows:
+        return None
+
+    n_cols = max(len(row.cells) for row in table.rows)
+    if n_cols == 0:
+        return None
+
+    lines: list[str] = []
+    for row in table.rows:
+        row_texts = [_render_cell_content(cell) for cell in row.cells]
+        row_texts.extend([""] * (n_cols - len(row_texts)))
+        lines.append("| " + " | ".join(row_texts) + " |")
+        if len(lines) == 1:
+            # 헤더 행 (첫 행) 다음 구분자 행
+            lines.append("|" + " --- |" * n_cols)
+
+    return "\n".join(lines)
+
+
 def _render_image(image: Image) -> str:
     """Image를 Markdown으로 렌더링한다."""
     alt = image.alt_text or "image"
@@ -162,9 +264,52 @@ def _render_link(link: Link) -> str:
     return f"[{link.text}]({link.url})"
 
 
+def _render_horizontal_rule(_rule: HorizontalRule) -> str:
+    return "---"
+
+
+def _group_list_item(_item: ListItem) -> None:
+    """표식 — 연속 ListItem은 한 블록으로 묶어야 하므로 _iter_rendered가
+    이 렌더러를 호출하지 않고 직접 처리한다."""
+
+
+def _cell_paragraph_text(para: Paragraph) -> str:
+    return para.text
+
+
+# ---------------------------------------------------------------------------
+# 타입별 렌더러 테이블
+# ---------------------------------------------------------------------------
+
+# 블록 요소: None을 돌려주면 출력하지 않는다 (빈 표).
+_BLOCK_RENDERERS: RendererTable[str | None] = RendererTable(
+    {
+        Paragraph: _render_paragraph,
+        Table: _render_table,
+        Image: _render_image,
+        Link: _render_link,
+        HorizontalRule: _render_horizontal_rule,
+        ListItem: _group_list_item,
+    }
+)
+_COMPACT_BLOCK_RENDERERS: RendererTable[str | None] = RendererTable(
+    {**_BLOCK_RENDERERS, Table: _render_table_compact}
+)
+
+# 표 셀 내용: 빈 문자열은 건너뛴다.
+_CELL_RENDERERS: RendererTable[str] = RendererTable(
+    {
+        Paragraph: _cell_paragraph_text,
+        Table: _render_nested_table_html,
+    }
+)
+
+
 class MarkdownWriter:
     """Markdown writer — Writer protocol implementation."""
 
+    compact_tables = False
+
     @staticmethod
     def format_name() -> str:
         return "markdown"
@@ -173,6 +318,24 @@ class MarkdownWriter:
     def file_extension() -> str:
         return ".md"
 
+    @classmethod
+    def write(cls, doc: Document) -> str:
+        return to_markdown(doc, compact_tables=cls.compact_tables)
+
+    @classmethod
+    def write_to(cls, doc: Document, stream: TextIO) -> None:
+        write_markdown(doc, stream, compact_tables=cls.compact_tables)
+
+    @classmethod
+    def write_with_source_map(cls, doc: Document) -> tuple[str, SourceMap]:
+        return to_markdown_with_source_map(doc, compact_tables=cls.compact_tables)
+
+
+class CompactMarkdownWriter(MarkdownWriter):
+    """표를 패딩 없이 렌더링하는 Markdown writer (`-f markdown-compact`)."""
+
+    compact_tables = True
+
     @staticmethod
-    def write(doc: Document) -> str:
-        return to_markdown(doc)
+    def format_name() -> str:
+        return "markdown-compact"
@@ -0,0 +1,45 @@
+"""Source map — character offsets of each Document element in writer output."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class SourceMapEntry:
+    """출력 문자열에서 요소 하나가 차지하는 구간 [start, end).
+
+    index는 Document.elements에서의 위치, headings는 요소가 속한 제목 경로
+    (바깥 제목부터; 제목 요소는 자기 자신을 포함).
+    """
+
+    start: int
+    end: int
+    index: int
+    kind: str
+    headings: tuple[str, ...] = ()
+
+
+@dataclass
+class SourceMap:
+    """출력 위치 → 요소 조회. entries는 start 오름차순이고 서로 겹치지 않는다."""
+
+    entries: list[SourceMapEntry] = field(default_factory=list)
+    _starts: list[int] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._starts = [entry.start for entry in self.entries]
+
+    def lookup(self, offset: int) -> SourceMapEntry | None:
+        """offset을 포함하는 요소, 블록 사이 구분자면 바로 앞 요소를 돌려준다."""
+        i = bisect_right(self._starts, offset) - 1
+        if i < 0:
+            return None
+        return self.entries[i]
+
+    def overlapping(self, start: int, end: int) -> list[SourceMapEntry]:
+        """[start, end) 구간과 겹치는 요소들 (예: 청크 하나에 담긴 요소)."""
+        first = max(bisect_right(self._starts, start) - 1, 0)
+        last = bisect_left(self._starts, end)
+        return [entry for entry in self.entries[first:last] if entry.end > start]
@@ -48,3 +48,19 @@ class TestCli:
         assert result.returncode == 0
         assert output.exists()
         assert output.read_text(encoding="utf-8").strip() != ""
+
+    @pytest.mark.skipif(not SAMPLE_HWP.exists(), reason="sample HWP file not available")
+    def test_file_matches_stdout(self, tmp_path):
+        output = tmp_path / "output.md"
+        _run_cli(str(SAMPLE_HWP), "-o", str(output))
+        stdout = _run_cli(str(SAMPLE_HWP)).stdout
+        # print()가 끝에 줄바꿈을 하나 더 붙인다
+        assert output.read_text(encoding="utf-8") + "\n" == stdout
+
+    @pytest.mark.skipif(not SAMPLE_HWP.exists(), reason="sample HWP file not available")
+    def test_unknown_format_creates_no_file(self, tmp_path):
+        output = tmp_path / "output.md"
+        result = _run_cli(str(SAMPLE_HWP), "-f", "nonexistent", "-o", str(output))
+        assert result.returncode == 1
+        assert "지원하지 않는 출력 형식" in result.stderr
+        assert not output.exists()
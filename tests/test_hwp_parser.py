@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import io
 import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -11,16 +14,35 @@ from ureca_document_parser.hwp import (
     CharInfo,
     Record,
     RecordCursor,
+    decode_para_text,
     extract_text,
     has_table_marker,
     read_bstr,
     scan_para_chars,
 )
+from ureca_document_parser.hwp.parser import _read_para_style_id
+from ureca_document_parser.hwp.records import (
+    RecordTable,
+    iter_decompressed,
+    iter_record_windows,
+    iter_records,
+    parse_records,
+)
+from ureca_document_parser.hwp.tables import read_ctrl_id
 from ureca_document_parser.models import ParseError
 
 SAMPLE_HWP = Path(__file__).parents[1] / "document.hwp"
 
 
+def _record(tag: int, level: int, payload: bytes) -> bytes:
+    """HWP 레코드 헤더 + 페이로드 바이트를 생성한다."""
+    if len(payload) >= 0xFFF:
+        header = tag | (level << 10) | (0xFFF << 20)
+        return struct.pack("<II", header, len(payload)) + payload
+    header = tag | (level << 10) | (len(payload) << 20)
+    return struct.pack("<I", header) + payload
+
+
 class TestReadBstr:
     def test_simple_string(self):
         text = "ABC"
@@ -74,6 +96,85 @@ class TestExtractText:
         assert "\n" in text
 
 
+class TestDecodeParaText:
+    @staticmethod
+    def _reference_text(data: bytes) -> str:
+        chars = []
+        for info in scan_para_chars(data):
+            if info.code == 9:
+                chars.append("\t")
+            elif info.code == 10:
+                chars.append("\n")
+            elif info.code >= 32:
+                chars.append(chr(info.code))
+        return "".join(chars)
+
+    def test_plain_text_has_no_controls(self):
+        result = decode_para_text("가나다 abc".encode("utf-16-le"))
+        assert result.text == "가나다 abc"
+        assert result.control_codes == frozenset()
+
+    def test_reports_control_codes(self):
+        data = (
+            struct.pack("<H", 11)
+            + b" lbt"
+            + b"\x00" * 10
+            + "A".encode("utf-16-le")
+            + struct.pack("<HH", 10, 13)
+        )
+        result = decode_para_text(data)
+        assert result.text == "A\n"
+        assert result.control_codes == {11, 10, 13}
+        assert result.has_table_marker is True
+
+    def test_control_positions_and_kinds(self):
+        data = (
+            "ab".encode("utf-16-le")
+            + struct.pack("<H", 11)
+            + b" lbt"
+            + b"\x00" * 10
+            + "c".encode("utf-16-le")
+            + struct.pack("<H", 11)
+            + b" osg"
+            + b"\x00" * 10
+            + struct.pack("<H", 17)
+            + b"  nf"
+            + b"\x00" * 10
+        )
+        result = decode_para_text(data)
+        assert result.text == "abc"
+        assert [c.kind for c in result.controls] == ["table", "picture", "footnote"]
+        assert [c.offset for c in result.controls] == [4, 22, 38]
+        assert [c.text_index for c in result.controls] == [2, 3, 3]
+
+    def test_inline_controls_not_reported_as_objects(self):
+        data = struct.pack("<HH", 10, 13) + "A".encode("utf-16-le")
+        assert decode_para_text(data).controls == ()
+
+    def test_extended_payload_skipped(self):
+        # 확장 제어문자 페이로드 안의 char 11은 마커가 아님
+        data = struct.pack("<8H", 2, 11, 11, 11, 0, 0, 0, 0) + "Z".encode("utf-16-le")
+        result = decode_para_text(data)
+        assert result.text == "Z"
+        assert result.has_table_marker is False
+
+    def test_surrogate_pair_matches_char_scan(self):
+        data = "A😀B".encode("utf-16-le") + struct.pack("<H", 9) + b"\x00" * 14
+        assert decode_para_text(data).text == self._reference_text(data)
+
+    def test_odd_trailing_byte_ignored(self):
+        data = "AB".encode("utf-16-le") + b"\x41"
+        assert decode_para_text(data).text == "AB"
+
+    def test_matches_char_scan(self):
+        codes = [0, 2, 9, 10, 11, 13, 24, 31, 32, 65, 0xAC00, 0xD800, 0xDC00]
+        for i in range(len(codes)):
+            for j in range(len(codes)):
+                units = [codes[i], 65, codes[j]] + [66] * 9 + [codes[(i + j) % 13]]
+                data = struct.pack(f"<{len(units)}H", *units)
+                assert decode_para_text(data).text == self._reference_text(data)
+
+
 class TestHasTableMarker:
     def test_with_marker(self):
         # code 11 = table/GSO marker (확장 제어문자)
@@ -85,6 +186,266 @@ class TestHasTableMarker:
         assert has_table_marker(data) is False
 
 
+class TestParseRecords:
+    def test_basic_records(self):
+        data = _record(66, 0, b"\x00" * 8) + _record(67, 1, "AB".encode("utf-16-le"))
+        records = parse_records(data)
+        assert [(r.tag, r.level) for r in records] == [(66, 0), (67, 1)]
+        assert records[1].data == "AB".encode("utf-16-le")
+        assert isinstance(records[1].data, bytes)
+
+    def test_extended_size(self):
+        payload = b"\x01" * 5000
+        records = parse_records(_record(67, 0, payload))
+        assert len(records) == 1
+        assert records[0].data == payload
+
+    def test_truncated_record_dropped(self):
+        data = _record(66, 0, b"\x00" * 8)[:-2]
+        assert parse_records(data) == []
+
+    def test_zero_copy_views(self):
+        data = _record(67, 0, "Hi".encode("utf-16-le"))
+        records = parse_records(data, zero_copy=True)
+        assert isinstance(records[0].data, memoryview)
+        assert records[0].data.obj is data
+        assert bytes(records[0].data) == "Hi".encode("utf-16-le")
+
+    def test_helpers_accept_memoryview(self):
+        bstr = struct.pack("<H", 3) + "ABC".encode("utf-16-le")
+        ctrl = b" lbt" + b"\x00" * 4
+        para_header = struct.pack("<IH", 0, 7)
+        text = struct.pack("<H", 11) + b"\x00" * 14 + "X".encode("utf-16-le")
+        data = (
+            _record(26, 0, bstr)
+            + _record(71, 1, ctrl)
+            + _record(66, 0, para_header)
+            + _record(67, 1, text)
+        )
+        style, ctrl_rec, header, para = parse_records(data, zero_copy=True)
+        assert read_bstr(style.data, 0) == ("ABC", 8)
+        assert read_ctrl_id(ctrl_rec.data) == struct.unpack(">I", b"tbl ")[0]
+        assert _read_para_style_id(header.data) == 7
+        assert extract_text(para.data) == "X"
+        assert has_table_marker(para.data) is True
+
+
+class TestIterRecords:
+    def test_all_records_without_filter(self):
+        data = (
+            _record(26, 0, b"ab") + _record(27, 0, b"c" * 5000) + _record(26, 1, b"d")
+        )
+        assert [(r.tag, bytes(r.data)) for r in iter_records(data)] == [
+            (r.tag, r.data) for r in parse_records(data)
+        ]
+
+    def test_tag_filter_skips_other_payloads(self):
+        data = (
+            _record(26, 0, b"ab") + _record(27, 0, b"c" * 5000) + _record(26, 1, b"d")
+        )
+        records = list(iter_records(data, tags={26}))
+        assert [(r.tag, r.level, bytes(r.data)) for r in records] == [
+            (26, 0, b"ab"),
+            (26, 1, b"d"),
+        ]
+        assert all(isinstance(r.data, memoryview) for r in records)
+
+    def test_truncated_stops(self):
+        data = _record(26, 0, b"ab") + _record(26, 0, b"cdef")[:-1]
+        assert len(list(iter_records(data, tags={26}))) == 1
+
+
+class TestRecordTable:
+    def _sample(self) -> bytes:
+        return (
+            _record(66, 0, b"\x00" * 8)
+            + _record(67, 1, "A".encode("utf-16-le"))
+            + _record(71, 1, b"abcd")
+            + _record(66, 2, b"\x00" * 8)
+            + _record(66, 0, b"\x00" * 8)
+        )
+
+    def test_columns_match_parse_records(self):
+        data = self._sample()
+        table = RecordTable.from_bytes(data)
+        records = parse_records(data)
+        assert len(table) == len(records)
+        for i, rec in enumerate(records):
+            assert table.tags[i] == rec.tag
+            assert table.levels[i] == rec.level
+            assert bytes(table.data(i)) == rec.data
+
+    def test_find_next(self):
+        table = RecordTable.from_bytes(self._sample())
+        assert table.find_next(66, 1) == 3
+        assert table.find_next(66, 1, max_level=0) == 4
+        assert table.find_next(71, 3) == len(table)
+        assert table.find_next(71, 0, 2) == 2
+        assert table.find_next(99, 0) == len(table)
+
+    def test_find_next_of(self):
+        table = RecordTable.from_bytes(self._sample())
+        assert table.find_next_of((71, 67), 0) == 1
+        assert table.find_next_of((71, 67), 2) == 2
+
+    def test_from_records(self):
+        table = RecordTable.from_records(
+            [Record(tag=1, level=0, data=b"ab"), Record(tag=2, level=1, data=b"c")]
+        )
+        assert table[1] == Record(tag=2, level=1, data=memoryview(b"c"))
+        assert bytes(table.data(0)) == b"ab"
+
+
+class TestStreaming:
+    def _section(self) -> bytes:
+        data = b""
+        for i in range(20):
+            data += _record(66, 0, b"\x00" * 8)
+            data += _record(67, 1, f"para {i}".encode("utf-16-le"))
+            data += _record(66, 2, b"\x00" * 8)
+        return data
+
+    def test_iter_decompressed(self):
+        raw = self._section() * 50
+        comp = zlib.compressobj(9, zlib.DEFLATED, -15)
+        compressed = comp.compress(raw) + comp.flush() + b"trailing"
+        chunks = list(iter_decompressed(io.BytesIO(compressed), chunk_size=64))
+        assert b"".join(chunks) == raw
+        assert max(len(c) for c in chunks) <= 64
+
+    def test_iter_uncompressed(self):
+        raw = self._section()
+        chunks = iter_decompressed(io.BytesIO(raw), compressed=False, chunk_size=7)
+        assert b"".join(chunks) == raw
+
+    def test_windows_cover_all_records(self):
+        data = self._section()
+        chunks = (data[i : i + 5] for i in range(0, len(data), 5))
+        windows = list(iter_record_windows(chunks, min_size=100))
+        assert len(windows) > 1
+        full = parse_records(data)
+        streamed = [rec for w in windows for rec in (w[i] for i in range(len(w)))]
+        assert [(r.tag, r.level, bytes(r.data)) for r in streamed] == [
+            (r.tag, r.level, r.data) for r in full
+        ]
+
+    def test_windows_start_at_top_level_paragraph(self):
+        data = self._section()
+        for window in iter_record_windows([data], min_size=1):
+            assert (window.tags[0], window.levels[0]) == (66, 0)
+
+    def test_truncated_tail_dropped(self):
+        data = self._section()
+        windows = list(iter_record_windows([data[:-3]], min_size=10**9))
+        assert len(windows[0]) == len(parse_records(data)) - 1
+
+
+def _table_marker() -> bytes:
+    return struct.pack("<H", 11) + b" lbt" + b"\x00" * 10
+
+
+def _cell(level: int, row: int, col: int, body: bytes, rowspan=1, colspan=1) -> bytes:
+    header = struct.pack("<HHIHHHH", 1, 0, 0, col, row, colspan, rowspan)
+    return _record(72, level, header) + _record(66, level, b"\x00" * 8) + body
+
+
+def _text_cell(level: int, row: int, col: int, text: str, **span) -> bytes:
+    body = _record(67, level + 1, text.encode("utf-16-le"))
+    return _cell(level, row, col, body, **span)
+
+
+def _table(level: int, n_rows: int, n_cols: int, cells: bytes) -> bytes:
+    dims = struct.pack("<IHH", 0, n_rows, n_cols)
+    return _record(71, level, b" lbt") + _record(77, level + 1, dims) + cells
+
+
+def _cell_texts(table) -> list[list[str]]:
+    return [
+        [
+            " ".join(p.text for p in cell.content if hasattr(p, "text"))
+            for cell in row.cells
+        ]
+        for row in table.rows
+    ]
+
+
+class TestBuildTable:
+    def test_subtree_end(self):
+        table = RecordTable.from_bytes(
+            _record(66, 0, b"")
+            + _record(67, 1, b"")
+            + _record(71, 1, b"")
+            + _record(72, 2, b"")
+            + _record(66, 2, b"")
+            + _record(66, 0, b"")
+        )
+        assert [table.subtree_end(i) for i in range(len(table))] == [5, 2, 5, 4, 5, 6]
+
+    def test_cells_placed_by_address_with_spans(self):
+        from ureca_document_parser.hwp.tables import build_table
+
+        cells = (
+            _text_cell(2, 0, 0, "A", rowspan=2)
+            + _text_cell(2, 0, 1, "B")
+            + _text_cell(2, 1, 1, "C")
+        )
+        records = RecordTable.from_bytes(_table(1, 2, 2, cells))
+        assert _cell_texts(build_table(records, 0)) == [["A", "B"], ["", "C"]]
+
+    def test_cells_without_address_fill_in_order(self):
+        from ureca_document_parser.hwp.tables import build_table
+
+        short_list_header = b"\x01\x00\x00\x00\x00\x00\x00\x00"
+        cells = b"".join(
+            _record(72, 2, short_list_header)
+            + _record(66, 2, b"")
+            + _record(67, 3, t.encode("utf-16-le"))
+            for t in "abc"
+        )
+        records = RecordTable.from_bytes(_table(1, 2, 2, cells))
+        assert _cell_texts(build_table(records, 0)) == [["a", "b"], ["c", ""]]
+
+    def test_not_a_table(self):
+        from ureca_document_parser.hwp.tables import build_table
+
+        records = RecordTable.from_bytes(_record(71, 1, b" osg"))
+        assert build_table(records, 0) is None
+
+    def test_deeply_nested_tables(self):
+        from ureca_document_parser.hwp.tables import build_table
+
+        depth = 400
+        data = _text_cell(2 * depth, 0, 0, "core")
+        for d in range(depth - 1, 0, -1):
+            inner = _table(2 * d + 1, 1, 1, data)
+            body = _record(67, 2 * d + 1, _table_marker()) + inner
+            data = _cell(2 * d, 0, 0, body)
+        records = RecordTable.from_bytes(_table(1, 1, 1, data) + _record(66, 0, b""))
+
+        table = build_table(records, 0)
+        for _ in range(depth - 1):
+            table = table.rows[0].cells[0].content[0]
+        assert table.rows[0].cells[0].content[0].text == "core"
+
+    def test_extract_elements_uses_tables(self):
+        from ureca_document_parser.hwp.parser import _extract_elements
+
+        cells = _text_cell(2, 0, 0, "x") + _text_cell(2, 0, 1, "y")
+        data = (
+            _record(66, 0, b"")
+            + _record(67, 1, "앞".encode("utf-16-le"))
+            + _record(66, 0, b"")
+            + _record(67, 1, _table_marker())
+            + _table(1, 1, 2, cells)
+            + _record(66, 0, b"")
+            + _record(67, 1, "뒤".encode("utf-16-le"))
+        )
+        elements = _extract_elements(RecordTable.from_bytes(data))
+        assert elements[0].text == "앞"
+        assert _cell_texts(elements[1]) == [["x", "y"]]
+        assert elements[2].text == "뒤"
+
+
 class TestRecordCursor:
     def test_basic_traversal(self):
         records = [Record(tag=1, level=0, data=b""), Record(tag=2, level=0, data=b"")]
@@ -112,6 +473,177 @@ class TestParseHwp:
         assert doc.metadata.source_format == "hwp"
         assert len(doc.elements) > 0
 
+    @pytest.mark.skipif(not SAMPLE_HWP.exists(), reason="sample HWP file not available")
+    @pytest.mark.parametrize("pool_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+    def test_parse_with_executor_matches_serial(self, pool_cls):
+        from ureca_document_parser.hwp import HwpParser
+
+        serial = HwpParser.parse(SAMPLE_HWP)
+        with pool_cls(max_workers=2) as pool:
+            parallel = HwpParser.parse(SAMPLE_HWP, executor=pool)
+        assert parallel.elements == serial.elements
+
+    def test_parse_section_bytes(self):
+        from ureca_document_parser.hwp.parser import _parse_section
+
+        raw = _record(66, 0, b"\x00" * 8) + _record(67, 1, "본문".encode("utf-16-le"))
+        comp = zlib.compressobj(9, zlib.DEFLATED, -15)
+        compressed = comp.compress(raw) + comp.flush()
+        assert _parse_section(compressed, True) == _parse_section(raw, False)
+        assert _parse_section(raw, False)[0].text == "본문"
+
+    def test_picture_becomes_lazy_image(self):
+        from ureca_document_parser.hwp.parser import _extract_elements
+        from ureca_document_parser.models import BinaryData, Image
+
+        def load(source, name):
+            raise AssertionError("payload read during parsing")
+
+        description = "로고".encode("utf-16-le")
+        gso = b" osg" + b"\x00" * 40 + struct.pack("<H", 2) + description
+        picture = b"\x00" * 71 + struct.pack("<H", 3)
+        raw = (
+            _record(66, 0, b"\x00" * 8)
+            + _record(67, 1, "그림 문단".encode("utf-16-le"))
+            + _record(71, 1, gso)
+            + _record(76, 2, b"")
+            + _record(85, 3, picture)
+        )
+        binary = BinaryData("doc.hwp", "BinData/BIN0003.png", load)
+
+        elements = _extract_elements(RecordTable.from_bytes(raw), None, {3: binary})
+
+        assert elements[0].text == "그림 문단"
+        assert elements[1] == Image(
+            alt_text="로고", source="BinData/BIN0003.png", binary=binary
+        )
+        assert len(_extract_elements(RecordTable.from_bytes(raw))) == 1
+
+    def test_picture_in_text_box_emitted_once(self):
+        from ureca_document_parser.hwp.parser import _extract_elements
+        from ureca_document_parser.models import BinaryData, Image, Paragraph
+
+        def load(source, name):
+            raise AssertionError("payload read during parsing")
+
+        gso = b" osg" + b"\x00" * 40 + struct.pack("<H", 0)
+        picture = b"\x00" * 71 + struct.pack("<H", 3)
+        raw = (
+            # 글상자: gso → SHAPE_COMPONENT → LIST_HEADER → 문단 → 안쪽 그림 gso
+            _record(66, 0, b"\x00" * 8)
+            + _record(71, 1, gso)
+            + _record(76, 2, b"")
+            + _record(72, 2, b"")
+            + _record(66, 2, b"\x00" * 8)
+            + _record(67, 3, "상자 글".encode("utf-16-le"))
+            + _record(71, 3, gso)
+            + _record(76, 4, b"")
+            + _record(85, 5, picture)
+        )
+        binary = BinaryData("doc.hwp", "BinData/BIN0003.png", load)
+
+        elements = _extract_elements(RecordTable.from_bytes(raw), None, {3: binary})
+
+        assert [type(e) for e in elements] == [Paragraph, Image]
+        assert elements[0].text == "상자 글"
+        assert elements[1].binary is binary
+
+    @pytest.mark.skipif(not SAMPLE_HWP.exists(), reason="sample HWP file not available")
+    def test_read_bin_items(self):
+        import olefile
+
+        from ureca_document_parser.hwp.parser import _parse_docinfo, _read_bin_items
+
+        with olefile.OleFileIO(str(SAMPLE_HWP)) as ole:
+            _, bin_entries = _parse_docinfo(ole, True)
+            items = _read_bin_items(ole, str(SAMPLE_HWP), True, bin_entries)
+        assert items[1].name == "BinData/BIN0001.bmp"
+        assert items[1].read().startswith(b"BM")
+
+    def test_read_bin_items_without_bindata_storage(self):
+        from ureca_document_parser.hwp.parser import _read_bin_items
+
+        class NoBinData:
+            def exists(self, name):
+                assert name == "BinData", "stream names must not be probed"
+                return False
+
+        assert _read_bin_items(NoBinData(), "doc.hwp", True, [(1, "png", 1)]) == {}
+
+    @pytest.mark.skipif(not SAMPLE_HWP.exists(), reason="sample HWP file not available")
+    def test_docinfo_tables_cached_by_docinfo_hash(self, monkeypatch):
+        from ureca_document_parser.hwp import HwpParser, parser
+
+        monkeypatch.setattr(parser, "_docinfo_cache", parser.OrderedDict())
+        first = HwpParser.parse(SAMPLE_HWP)
+        assert len(parser._docinfo_cache) == 1
+
+        def fail(*args):
+            raise AssertionError("DocInfo should not be decompressed again")
+
+        # 스타일 테이블과 BIN_DATA 항목 모두 캐시에서 와야 한다
+        monkeypatch.setattr(parser, "_read_docinfo_tables", fail)
+        monkeypatch.setattr(parser.zlib, "decompress", fail)
+        second = HwpParser.parse(SAMPLE_HWP)
+        assert second.elements == first.elements
+
+    @pytest.mark.skipif(not SAMPLE_HWP.exists(), reason="sample HWP file not available")
+    def test_metadata_from_summary_info(self):
+        from ureca_document_parser.hwp import HwpParser
+
+        doc = HwpParser.parse(SAMPLE_HWP)
+        assert doc.metadata.author == "kised"
+        assert doc.metadata.title == SAMPLE_HWP.stem
+        assert doc.metadata.extra["hwp_version"].startswith("5.")
+        assert doc.metadata.extra["compressed"] == "true"
+
+    @pytest.mark.skipif(not SAMPLE_HWP.exists(), reason="sample HWP file not available")
+    def test_preview_skips_body(self, monkeypatch):
+        from ureca_document_parser.hwp import HwpParser, parser
+
+        def fail(*args, **kwargs):
+            raise AssertionError("preview must not touch DocInfo/BodyText")
+
+        monkeypatch.setattr(parser, "_parse_docinfo", fail)
+        monkeypatch.setattr(parser, "_iter_section_elements", fail)
+        doc = HwpParser.parse(SAMPLE_HWP, preview=True)
+        assert doc.metadata.source_format == "hwp"
+        assert doc.metadata.author == "kised"
+        assert doc.elements[0].text.startswith("중소벤처기업부 공고")
+
+    def test_parse_property_set(self):
+        from ureca_document_parser.hwp.parser import _parse_property_set
+
+        title = "제목\x00".encode("utf-16-le")
+        props = [
+            (2, struct.pack("<II", 0x1F, 3) + title),
+            (4, struct.pack("<II", 0x1E, 4) + b"abc\x00"),
+            (14, struct.pack("<Ii", 0x03, 7)),
+            (12, struct.pack("<IQ", 0x40, 116444736000000000)),
+        ]
+        body = b""
+        table = b""
+        offset = 8 + 8 * len(props)
+        for pid, value in props:
+            table += struct.pack("<II", pid, offset + len(body))
+            body += value
+        section = (
+            struct.pack("<II", 8 + len(table) + len(body), len(props)) + table + body
+        )
+        data = b"\x00" * 44 + struct.pack("<I", 48) + section
+
+        assert _parse_property_set(data) == {
+            2: "제목",
+            4: "abc",
+            14: "7",
+            12: "1970-01-01T00:00:00+00:00",
+        }
+
+    def test_parse_property_set_truncated(self):
+        from ureca_document_parser.hwp.parser import _parse_property_set
+
+        assert _parse_property_set(b"\x00" * 10) == {}
+
     def test_parse_nonexistent_file(self):
         from ureca_document_parser.hwp import HwpParser
 
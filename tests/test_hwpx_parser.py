@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -13,7 +14,60 @@ from ureca_document_parser.hwpx.parser import (
     _strip_ns,
     parse_hwpx,
 )
-from ureca_document_parser.models import ParseError
+from ureca_document_parser.models import ParseError, Table
+
+HP_NS = "http://www.hancom.co.kr/hwpml/2011/paragraph"
+HS_NS = "http://www.hancom.co.kr/hwpml/2011/section"
+
+SECTION_XML = f"""<?xml version="1.0" encoding="UTF-8"?>
+<hs:sec xmlns:hs="{HS_NS}" xmlns:hp="{HP_NS}">
+  <hp:p styleIDRef="0"><hp:run><hp:t>첫 문단</hp:t></hp:run></hp:p>
+  <hp:p><hp:pPr outlineLevel="2"/><hp:run><hp:t>제목</hp:t></hp:run></hp:p>
+  <hp:p>
+    <hp:run><hp:t>표 앞</hp:t></hp:run>
+    <hp:tbl>
+      <hp:tr>
+        <hp:tc>
+          <hp:subList><hp:p><hp:run><hp:t>A</hp:t></hp:run></hp:p></hp:subList>
+        </hp:tc>
+        <hp:tc>
+          <hp:subList>
+            <hp:p><hp:run><hp:t>B</hp:t></hp:run></hp:p>
+            <hp:tbl><hp:tr><hp:tc>
+              <hp:p><hp:run><hp:t>중첩</hp:t></hp:run></hp:p>
+            </hp:tc></hp:tr></hp:tbl>
+          </hp:subList>
+        </hp:tc>
+      </hp:tr>
+    </hp:tbl>
+  </hp:p>
+  <hp:tbl>
+    <hp:tr><hp:tc><hp:p><hp:run><hp:t>단독 표</hp:t></hp:run></hp:p></hp:tc></hp:tr>
+  </hp:tbl>
+  <hp:p><hp:run><hp:t>끝</hp:t></hp:run></hp:p>
+</hs:sec>"""
+
+
+HEADER_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<hh:head xmlns:hh="http://www.hancom.co.kr/hwpml/2011/head">
+  <hh:refList>
+    <hh:styles itemCnt="4">
+      <hh:style id="0" type="PARA" name="바탕글" engName="Normal"/>
+      <hh:style id="1" type="PARA" name="본문" engName="Body"/>
+      <hh:style id="2" type="PARA" name="개요 1" engName="Outline 1"/>
+      <hh:style id="4" type="PARA" name="사용자 스타일" engName="Subtitle"/>
+    </hh:styles>
+  </hh:refList>
+</hh:head>"""
+
+
+def _write_hwpx(path: Path, sections: list[str], header: str | None = None) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        if header is not None:
+            zf.writestr("Contents/header.xml", header)
+        for i, xml in enumerate(sections):
+            zf.writestr(f"Contents/section{i}.xml", xml)
+    return path
 
 
 class TestStripNs:
@@ -27,6 +81,254 @@ class TestStripNs:
         assert _strip_ns("{ns1}{ns2}tag") == "tag"
 
 
+class TestTagTable:
+    def test_known_namespace_is_preseeded(self):
+        from ureca_document_parser.hwpx.parser import _TagTable
+
+        tags = _TagTable()
+        assert f"{{{HP_NS}}}tbl" in tags
+        assert tags[f"{{{HP_NS}}}tbl"] == "tbl"
+
+    def test_unknown_namespace_resolved_once(self):
+        from ureca_document_parser.hwpx.parser import _TagTable
+
+        tags = _TagTable()
+        tag = "{urn:custom}run"
+        assert tag not in tags
+        assert tags[tag] == "run"
+        assert tag in tags
+
+
+class TestSectionWalker:
+    def test_namespaced_table_cells_have_content(self):
+        from ureca_document_parser.hwpx.parser import _parse_section_xml
+
+        elements = _parse_section_xml(SECTION_XML.encode())
+        table = next(e for e in elements if isinstance(e, Table))
+        first, second = table.rows[0].cells
+        assert first.content[0].text == "A"
+        assert second.content[0].text == "B"
+        nested = second.content[1]
+        assert nested.rows[0].cells[0].content[0].text == "중첩"
+
+    def test_outline_level_heading(self):
+        from ureca_document_parser.hwpx.parser import _parse_section_xml
+
+        elements = _parse_section_xml(SECTION_XML.encode())
+        assert elements[1].text == "제목"
+        assert elements[1].heading_level == 2
+
+
+class TestXmlBackend:
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_lxml_matches_etree(self, tmp_path, streaming):
+        pytest.importorskip("lxml")
+        xml = SECTION_XML.replace(
+            "<hp:t>첫 문단</hp:t>", "<hp:t>첫 <!-- 주석 -->문단<?pi x?></hp:t>"
+        )
+        path = _write_hwpx(tmp_path / "test.hwpx", [xml, SECTION_XML])
+
+        expected = parse_hwpx(path, backend="etree", streaming=streaming)
+        actual = parse_hwpx(path, backend="lxml", streaming=streaming)
+
+        assert actual.elements == expected.elements
+        assert actual.elements[0].text == "첫 문단"
+
+    def test_lxml_streaming_detaches_blocks(self):
+        pytest.importorskip("lxml")
+        import io
+
+        from ureca_document_parser.hwpx.parser import _resolve_backend, _TagTable
+
+        body = "".join(f"<p><run><t>{i}</t></run></p>" for i in range(100))
+        source = io.BytesIO(f"<sec><ctrl/>{body}</sec>".encode())
+        blocks = _resolve_backend("lxml").iter_blocks(source, _TagTable())
+
+        texts = []
+        for block in blocks:
+            texts.append(block.findtext(".//t"))
+            # 앞에는 직전 블록(비워진 상태)만 남는다
+            preceding = list(block.itersiblings(preceding=True))
+            assert len(preceding) <= 1
+            assert all(len(sib) == 0 for sib in preceding)
+        assert texts == [str(i) for i in range(100)]
+
+    def test_missing_lxml(self, tmp_path, monkeypatch):
+        import sys
+
+        monkeypatch.setitem(sys.modules, "lxml", None)
+        path = _write_hwpx(tmp_path / "test.hwpx", [SECTION_XML])
+
+        with pytest.raises(ParseError, match="lxml"):
+            parse_hwpx(path, backend="lxml")
+        assert parse_hwpx(path).elements == parse_hwpx(path, backend="etree").elements
+
+    def test_unknown_backend(self, tmp_path):
+        path = _write_hwpx(tmp_path / "test.hwpx", [SECTION_XML])
+        with pytest.raises(ValueError, match="지원하지 않는 XML 백엔드"):
+            parse_hwpx(path, backend="sax")
+
+
+def _paragraph(inner: str):
+    from xml.etree import ElementTree as ET
+
+    from ureca_document_parser.hwpx.parser import _parse_paragraph_element
+
+    p_elem = ET.fromstring(f'<hp:p xmlns:hp="{HP_NS}">{inner}</hp:p>')
+    return _parse_paragraph_element(p_elem)
+
+
+class TestParagraphAssembly:
+    def test_runs_in_order(self):
+        para = _paragraph(
+            "<hp:run><hp:t>가</hp:t></hp:run><hp:run><hp:t>나</hp:t></hp:run>"
+        )
+        assert para.text == "가나"
+
+    def test_inline_tab_and_line_break(self):
+        para = _paragraph(
+            "<hp:run><hp:t>이름<hp:tab/>홍길동<hp:lineBreak/>주소</hp:t></hp:run>"
+        )
+        assert para.text == "이름\t홍길동\n주소"
+
+    def test_unknown_inline_keeps_tail(self):
+        para = _paragraph("<hp:run><hp:t>앞<hp:markpenBegin/>뒤</hp:t></hp:run>")
+        assert para.text == "앞뒤"
+
+    def test_direct_t_duplicates_skipped(self):
+        para = _paragraph(
+            "<hp:run><hp:t>본문</hp:t></hp:run><hp:t>본문</hp:t><hp:t>추가</hp:t>"
+            "<hp:t>추가</hp:t>"
+        )
+        assert para.text == "본문추가"
+
+    def test_many_direct_fragments(self):
+        inner = "".join(f"<hp:t>{i},</hp:t>" for i in range(10_000))
+        para = _paragraph(inner)
+        assert para.text.startswith("0,1,2,")
+        assert para.text.endswith("9999,")
+
+
+class TestImages:
+    MANIFEST = """<?xml version="1.0" encoding="UTF-8"?>
+    <opf:package xmlns:opf="http://www.idpf.org/2007/opf/">
+      <opf:manifest>
+        <opf:item id="section0" href="Contents/section0.xml"/>
+        <opf:item id="image1" href="BinData/image1.png" media-type="image/png"/>
+        <opf:item id="image2" href="BinData/image2.png" media-type="image/png"/>
+      </opf:manifest>
+      <opf:spine><opf:itemref idref="section0"/></opf:spine>
+    </opf:package>"""
+
+    @staticmethod
+    def _section(*refs: str) -> str:
+        pics = "".join(
+            f'<hp:run><hp:pic><hc:img binaryItemIDRef="{ref}"/>'
+            f"<hp:shapeComment>{ref} 설명</hp:shapeComment></hp:pic></hp:run>"
+            for ref in refs
+        )
+        return (
+            f'<hs:sec xmlns:hs="{HS_NS}" xmlns:hp="{HP_NS}" '
+            f'xmlns:hc="http://www.hancom.co.kr/hwpml/2011/core">'
+            f"<hp:p><hp:run><hp:t>그림</hp:t></hp:run>{pics}</hp:p></hs:sec>"
+        )
+
+    def _write(self, tmp_path, *refs: str) -> Path:
+        path = tmp_path / "pics.hwpx"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("Contents/content.hpf", self.MANIFEST)
+            zf.writestr("Contents/section0.xml", self._section(*refs))
+            zf.writestr("BinData/image1.png", b"\x89PNG same")
+            zf.writestr("BinData/image2.png", b"\x89PNG same")
+        return path
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_pictures_are_lazy_images(self, tmp_path, streaming):
+        from ureca_document_parser.models import Image
+
+        path = self._write(tmp_path, "image1", "missing", "image1")
+        doc = parse_hwpx(path, streaming=streaming)
+
+        assert doc.elements[0].text == "그림"
+        images = doc.images()
+        assert [type(e) for e in doc.elements[1:]] == [Image, Image]
+        assert images[0].source == "BinData/image1.png"
+        assert images[0].alt_text == "image1 설명"
+        assert images[0].data == b""
+        assert images[0].binary is images[1].binary
+        assert images[0].read() == b"\x89PNG same"
+
+    def test_unique_images_by_content(self, tmp_path):
+        doc = parse_hwpx(self._write(tmp_path, "image1", "image2"))
+        assert len(doc.images()) == 2
+        assert doc.unique_images() == doc.images()[:1]
+
+    def test_images_with_executor(self, tmp_path):
+        path = self._write(tmp_path, "image1", "image2")
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            doc = parse_hwpx(path, executor=pool)
+        assert doc.elements == parse_hwpx(path).elements
+        assert doc.images()[1].read() == b"\x89PNG same"
+
+
+class TestStyleTable:
+    def test_read_style_levels(self, tmp_path):
+        from ureca_document_parser.hwpx.parser import (
+            _ETREE_BACKEND,
+            _read_style_levels,
+        )
+
+        path = _write_hwpx(tmp_path / "test.hwpx", [], header=HEADER_XML)
+        with zipfile.ZipFile(path) as zf:
+            assert _read_style_levels(zf, _ETREE_BACKEND) == (0, 0, 1, 0, 2)
+
+    def test_out_of_range_ids_ignored(self, tmp_path):
+        from ureca_document_parser.hwpx.parser import (
+            _ETREE_BACKEND,
+            _read_style_levels,
+        )
+
+        header = HEADER_XML.replace(
+            "</hh:styles>",
+            '<hh:style id="-1" type="PARA" name="개요 3"/>'
+            '<hh:style id="999999999" type="PARA" name="개요 4"/>'
+            "</hh:styles>",
+        )
+        path = _write_hwpx(tmp_path / "test.hwpx", [], header=header)
+        with zipfile.ZipFile(path) as zf:
+            assert _read_style_levels(zf, _ETREE_BACKEND) == (0, 0, 1, 0, 2)
+
+    def test_missing_header(self, tmp_path):
+        from ureca_document_parser.hwpx.parser import (
+            _ETREE_BACKEND,
+            _read_style_levels,
+        )
+
+        path = _write_hwpx(tmp_path / "test.hwpx", [])
+        with zipfile.ZipFile(path) as zf:
+            assert _read_style_levels(zf, _ETREE_BACKEND) == ()
+
+    def test_numeric_style_ref_uses_header(self, tmp_path):
+        section = f"""<hs:sec xmlns:hs="{HS_NS}" xmlns:hp="{HP_NS}">
+          <hp:p styleIDRef="2"><hp:run><hp:t>개요</hp:t></hp:run></hp:p>
+          <hp:p styleIDRef="4"><hp:run><hp:t>부제</hp:t></hp:run></hp:p>
+          <hp:p styleIDRef="1"><hp:run><hp:t>본문</hp:t></hp:run></hp:p>
+          <hp:p styleIDRef="99"><hp:run><hp:t>범위 밖</hp:t></hp:run></hp:p>
+          <hp:p styleIDRef="Heading 2 제목"><hp:run><hp:t>이름</hp:t></hp:run></hp:p>
+        </hs:sec>"""
+        path = _write_hwpx(tmp_path / "test.hwpx", [section], header=HEADER_XML)
+
+        doc = parse_hwpx(path)
+        assert [e.heading_level for e in doc.elements] == [1, 2, 0, 0, 1]
+
+    def test_detect_heading_level_with_table(self):
+        import xml.etree.ElementTree as ET
+
+        p_elem = ET.fromstring('<p styleIDRef="2"/>')
+        assert _detect_heading_level(p_elem) == 0
+        assert _detect_heading_level(p_elem, style_levels=(0, 0, 3)) == 3
+
+
 class TestFindSectionFiles:
     def test_finds_sections_by_pattern(self, tmp_path):
         zf_path = tmp_path / "test.hwpx"
@@ -70,6 +372,54 @@ class TestParseHwpx:
         assert len(doc.elements) > 0
         assert doc.elements[0].text == "테스트 텍스트"
 
+    def test_streaming_matches_tree_parse(self, tmp_path):
+        path = _write_hwpx(tmp_path / "test.hwpx", [SECTION_XML, SECTION_XML])
+
+        expected = parse_hwpx(path)
+        streamed = parse_hwpx(path, streaming=True)
+
+        assert streamed.elements == expected.elements
+        assert [type(e) for e in streamed.elements].count(Table) == 4
+
+    def test_streaming_detaches_processed_blocks(self, monkeypatch):
+        import io
+
+        from ureca_document_parser.hwpx import parser as hwpx_parser
+
+        roots = []
+        iterparse = hwpx_parser.ET.iterparse
+
+        def recording_iterparse(source, events):
+            for event, elem in iterparse(source, events):
+                if not roots:
+                    roots.append(elem)
+                yield event, elem
+
+        monkeypatch.setattr(hwpx_parser.ET, "iterparse", recording_iterparse)
+
+        body = "".join(f"<p><run><t>문단 {i}</t></run></p>" for i in range(1000))
+        source = io.BytesIO(f"<sec>{body}</sec>".encode())
+        elements = list(hwpx_parser._iter_section_stream(source))
+
+        assert [e.text for e in elements[:2]] == ["문단 0", "문단 1"]
+        assert len(elements) == 1000
+        assert len(roots[0]) == 0
+
+    @pytest.mark.parametrize("pool_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_parse_with_executor_matches_serial(self, tmp_path, pool_cls, streaming):
+        sections = [SECTION_XML.replace("첫 문단", f"섹션 {i}") for i in range(4)]
+        path = _write_hwpx(tmp_path / "book.hwpx", sections)
+
+        serial = parse_hwpx(path)
+        with pool_cls(max_workers=2) as pool:
+            parallel = parse_hwpx(path, executor=pool, streaming=streaming)
+
+        assert parallel.elements == serial.elements
+        texts = [getattr(e, "text", "") for e in parallel.elements]
+        heads = [t for t in texts if t.startswith("섹션")]
+        assert heads == ["섹션 0", "섹션 1", "섹션 2", "섹션 3"]
+
     def test_extensions(self):
         from ureca_document_parser.hwpx import HwpxParser
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+
 from ureca_document_parser.models import (
     Document,
     HorizontalRule,
@@ -14,7 +16,15 @@ from ureca_document_parser.models import (
     TableCell,
     TableRow,
 )
-from ureca_document_parser.writers.markdown import to_markdown
+from ureca_document_parser.writers.dispatch import RendererTable
+from ureca_document_parser.writers.markdown import (
+    CompactMarkdownWriter,
+    MarkdownWriter,
+    to_markdown,
+    to_markdown_with_source_map,
+    write_markdown,
+)
+from ureca_document_parser.writers.sourcemap import SourceMap, SourceMapEntry
 
 
 class TestRenderParagraph:
@@ -52,6 +62,50 @@ class TestRenderTable:
         assert "a\\|b" in md
 
 
+def _table(*rows: list[str]) -> Table:
+    return Table(
+        rows=[
+            TableRow(cells=[TableCell(content=[Paragraph(text=t)]) for t in row])
+            for row in rows
+        ]
+    )
+
+
+class TestCompactTable:
+    def test_no_padding(self):
+        doc = Document(
+            elements=[_table(["이름", "설명"], ["a", "아주 긴 설명 텍스트"])]
+        )
+        assert to_markdown(doc, compact_tables=True) == (
+            "| 이름 | 설명 |\n| --- | --- |\n| a | 아주 긴 설명 텍스트 |\n"
+        )
+
+    def test_short_rows_filled(self):
+        doc = Document(elements=[_table(["a", "b", "c"], ["d"])])
+        md = to_markdown(doc, compact_tables=True)
+        assert md.splitlines()[-1] == "| d |  |  |"
+
+    def test_padded_default_unchanged(self):
+        doc = Document(elements=[_table(["a", "b"], ["long cell", "c"])])
+        assert to_markdown(doc) == (
+            "| a         | b   |\n| --------- | --- |\n| long cell | c   |\n"
+        )
+
+    def test_writer(self, doc_with_table):
+        assert CompactMarkdownWriter.format_name() == "markdown-compact"
+        assert CompactMarkdownWriter.write(doc_with_table) == to_markdown(
+            doc_with_table, compact_tables=True
+        )
+        stream = io.StringIO()
+        CompactMarkdownWriter.write_to(doc_with_table, stream)
+        assert stream.getvalue() == CompactMarkdownWriter.write(doc_with_table)
+        assert MarkdownWriter.write(doc_with_table) == to_markdown(doc_with_table)
+
+    def test_empty_table_skipped(self):
+        doc = Document(elements=[Table(rows=[TableRow()])])
+        assert to_markdown(doc, compact_tables=True) == "\n"
+
+
 class TestRenderListItem:
     def test_unordered_list(self):
         doc = Document(elements=[
@@ -130,3 +184,159 @@ class TestFullDocument:
         assert "![사진](img.png)" in md
         assert "[링크](https://example.com)" in md
         assert "---" in md
+
+
+class TestWriteTo:
+    def test_matches_to_markdown(self, doc_with_all_elements):
+        stream = io.StringIO()
+        write_markdown(doc_with_all_elements, stream)
+        assert stream.getvalue() == to_markdown(doc_with_all_elements)
+
+    def test_empty_document(self):
+        stream = io.StringIO()
+        MarkdownWriter.write_to(Document(), stream)
+        assert stream.getvalue() == to_markdown(Document()) == "\n"
+
+    def test_writes_incrementally(self):
+        class Recorder(io.StringIO):
+            def __init__(self):
+                super().__init__()
+                self.writes = 0
+
+            def write(self, s):
+                self.writes += 1
+                return super().write(s)
+
+        doc = Document(elements=[Paragraph(text=f"p{i}") for i in range(10)])
+        stream = Recorder()
+        MarkdownWriter.write_to(doc, stream)
+        assert stream.writes > 10
+        assert stream.getvalue() == to_markdown(doc)
+
+
+class TestRendererTable:
+    def test_exact_type(self):
+        table = RendererTable({Paragraph: lambda p: p.text})
+        assert table[Paragraph](Paragraph(text="a")) == "a"
+
+    def test_subclass_resolved_and_cached(self):
+        class Note(Paragraph):
+            pass
+
+        table = RendererTable({Paragraph: lambda p: p.text})
+        assert table[Note] is table[Paragraph]
+        assert Note in table
+
+    def test_unknown_type(self):
+        table = RendererTable({Paragraph: lambda p: p.text})
+        assert table[HorizontalRule] is None
+
+    def test_subclass_elements_rendered(self):
+        class Note(Paragraph):
+            pass
+
+        class Bullet(ListItem):
+            pass
+
+        doc = Document(
+            elements=[
+                Note(text="note", heading_level=1),
+                Bullet(text="a"),
+                Bullet(text="b"),
+            ]
+        )
+        assert to_markdown(doc) == "# note\n\n- a\n- b\n"
+
+    def test_unknown_element_breaks_list(self):
+        doc = Document(
+            elements=[
+                ListItem(text="a", ordered=True),
+                object(),
+                ListItem(text="b", ordered=True),
+            ]
+        )
+        assert to_markdown(doc) == "1. a\n\n1. b\n"
+
+
+class TestSourceMap:
+    @staticmethod
+    def _outline() -> Document:
+        return Document(
+            elements=[
+                Paragraph(text="개요", heading_level=1),
+                Paragraph(text="본문 1"),
+                Paragraph(text="배경", heading_level=2),
+                ListItem(text="하나", ordered=True),
+                ListItem(text="둘", ordered=True),
+                _table(["a", "b"], ["c", "d"]),
+                Paragraph(text="결론", heading_level=1),
+                Table(rows=[]),
+                Paragraph(text="끝"),
+            ]
+        )
+
+    def test_text_matches_to_markdown(self, doc_with_all_elements):
+        for doc in (doc_with_all_elements, self._outline(), Document()):
+            md, _ = to_markdown_with_source_map(doc)
+            assert md == to_markdown(doc)
+
+    def test_text_matches_with_list_boundaries(self):
+        doc = Document(
+            elements=[
+                ListItem(text="a", ordered=True),
+                Table(rows=[]),
+                ListItem(text="b", ordered=True),
+                ListItem(text="c", level=1, ordered=False),
+                ListItem(text="d", ordered=True),
+                Paragraph(text="제목", heading_level=2),
+                ListItem(text="e", ordered=False),
+                Table(rows=[TableRow()]),
+                _table(["x"]),
+                ListItem(text="f", ordered=True),
+            ]
+        )
+        for compact in (False, True):
+            md, source_map = to_markdown_with_source_map(doc, compact_tables=compact)
+            assert md == to_markdown(doc, compact_tables=compact)
+            spans = [md[e.start : e.end] for e in source_map.entries]
+            assert spans[:4] == ["1. a", "1. b", "  - c", "1. d"]
+
+    def test_offsets_cover_rendered_elements(self):
+        doc = self._outline()
+        md, source_map = to_markdown_with_source_map(doc)
+        spans = {e.index: md[e.start : e.end] for e in source_map.entries}
+        assert spans[0] == "# 개요"
+        assert spans[3] == "1. 하나"
+        assert spans[4] == "2. 둘"
+        assert spans[5].startswith("| a") and spans[5].endswith("|")
+        assert 7 not in spans  # 빈 표는 출력되지 않음
+        assert source_map.entries[-1].kind == "Paragraph"
+
+    def test_heading_ancestry(self):
+        _, source_map = to_markdown_with_source_map(self._outline())
+        headings = {e.index: e.headings for e in source_map.entries}
+        assert headings[0] == ("개요",)
+        assert headings[1] == ("개요",)
+        assert headings[4] == ("개요", "배경")
+        assert headings[5] == ("개요", "배경")
+        assert headings[8] == ("결론",)
+
+    def test_lookup(self):
+        md, source_map = to_markdown_with_source_map(self._outline())
+        table_start = md.index("| a")
+        assert source_map.lookup(table_start + 3).index == 5
+        # 블록 사이 구분자는 앞 요소로
+        assert source_map.lookup(md.index("\n\n")).index == 0
+        assert source_map.lookup(-1) is None
+
+    def test_overlapping(self):
+        md, source_map = to_markdown_with_source_map(self._outline())
+        start = md.index("본문")
+        end = md.index("1. 하나")
+        assert [e.index for e in source_map.overlapping(start, end)] == [1, 2]
+
+    def test_writer(self, doc_with_table):
+        md, source_map = CompactMarkdownWriter.write_with_source_map(doc_with_table)
+        assert md == CompactMarkdownWriter.write(doc_with_table)
+        assert isinstance(source_map, SourceMap)
+        assert isinstance(source_map.entries[0], SourceMapEntry)
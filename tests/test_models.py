@@ -1,6 +1,7 @@
 """Tests for ureca_document_parser.models."""
 
 from ureca_document_parser.models import (
+    BinaryData,
     Document,
     HorizontalRule,
     Image,
@@ -27,6 +28,53 @@ class TestDocument:
         assert simple_doc.metadata.source_format == "test"
 
 
+_PAYLOADS = {"a.png": b"AAAA", "b.png": b"BBBB", "a-copy.png": b"AAAA"}
+_reads: list[str] = []
+
+
+def _load(source: str, name: str) -> bytes:
+    _reads.append(name)
+    return _PAYLOADS[name]
+
+
+class TestBinaryData:
+    def setup_method(self):
+        _reads.clear()
+
+    def test_read_is_lazy(self):
+        image = Image(source="a.png", binary=BinaryData("doc", "a.png", _load))
+        assert _reads == []
+        assert image.read() == b"AAAA"
+        assert _reads == ["a.png"]
+
+    def test_inline_data_wins(self):
+        image = Image(data=b"inline", binary=BinaryData("doc", "a.png", _load))
+        assert image.read() == b"inline"
+        assert _reads == []
+
+    def test_digest_cached(self):
+        binary = BinaryData("doc", "a.png", _load)
+        assert binary.digest == binary.digest
+        assert _reads == ["a.png"]
+
+    def test_equality_ignores_digest(self):
+        first = BinaryData("doc", "a.png", _load)
+        _ = first.digest
+        assert first == BinaryData("doc", "a.png", _load)
+
+    def test_unique_images(self):
+        images = [
+            Image(binary=BinaryData("doc", name, _load))
+            for name in ("a.png", "b.png", "a-copy.png")
+        ]
+        images.append(Image(data=b"BBBB"))
+        images.append(Image(source="link.png"))
+        doc = Document(elements=[Paragraph(text="x"), *images])
+
+        assert doc.images() == images
+        assert doc.unique_images() == [images[0], images[1], images[4]]
+
+
 class TestParagraph:
     def test_normal_paragraph(self):
         p = Paragraph(text="hello")
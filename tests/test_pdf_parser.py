@@ -0,0 +1,288 @@
+"""Tests for ureca_document_parser.pdf.parser."""
+
+from __future__ import annotations
+
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from ureca_document_parser.models import ParseError
+
+fitz = pytest.importorskip("fitz")
+
+from ureca_document_parser.pdf import PdfParser  # noqa: E402
+from ureca_document_parser.pdf import ocr as pdf_ocr  # noqa: E402
+
+
+def _make_pdf(path: Path, n_pages: int) -> Path:
+    doc = fitz.open()
+    for i in range(n_pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i} first paragraph")
+        page.insert_text((72, 144), f"Page {i} second paragraph")
+    doc.set_metadata({"title": "Sample", "author": "Tester"})
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _make_structured_pdf(path: Path, n_pages: int) -> Path:
+    doc = fitz.open()
+    for i in range(n_pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Chapter {i}", fontsize=24)
+        page.insert_text((72, 120), f"Section {i}", fontsize=16)
+        for line in range(4):
+            page.insert_text(
+                (72, 180 + 60 * line), f"Body text {i}.{line} goes here", fontsize=11
+            )
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _make_scanned_pdf(path: Path, shades: list[int | None]) -> Path:
+    """One page per shade: an image-only page, or a text page for None."""
+    doc = fitz.open()
+    for i, shade in enumerate(shades):
+        page = doc.new_page()
+        if shade is None:
+            page.insert_text((72, 72), f"Text page {i}")
+            continue
+        pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 16, 16), False)
+        pix.clear_with(shade)
+        page.insert_image(fitz.Rect(72, 72, 272, 272), pixmap=pix)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def scanned_pdf(tmp_path) -> Path:
+    # pages 0 and 3 have the same scan
+    return _make_scanned_pdf(tmp_path / "scanned.pdf", [10, None, 200, 10, None])
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch):
+    """Replace rendering and tesseract with a recorder returning the page number."""
+    calls = []
+
+    def render_page(doc, page_no, dpi):
+        return f"{page_no}:{dpi}".encode()
+
+    def image_to_string(image, lang):
+        page_no, dpi = image.split(":")
+        calls.append((int(page_no), int(dpi), lang))
+        return f"Scanned {page_no}\n\nsecond block"
+
+    pil_image = SimpleNamespace(open=lambda f: nullcontext(f.read().decode()))
+    pytesseract = SimpleNamespace(image_to_string=image_to_string)
+    monkeypatch.setattr(pdf_ocr, "_import_ocr", lambda: (pil_image, pytesseract))
+    monkeypatch.setattr(pdf_ocr, "_render_page", render_page)
+    return calls
+
+
+@pytest.fixture
+def structured_pdf(tmp_path) -> Path:
+    return _make_structured_pdf(tmp_path / "structured.pdf", 5)
+
+
+@pytest.fixture
+def sample_pdf(tmp_path) -> Path:
+    return _make_pdf(tmp_path / "sample.pdf", 7)
+
+
+class TestParse:
+    def test_metadata(self, sample_pdf):
+        doc = PdfParser.parse(sample_pdf)
+        assert doc.metadata.title == "Sample"
+        assert doc.metadata.author == "Tester"
+        assert doc.metadata.extra["pages"] == 7
+
+    def test_pages_in_order(self, sample_pdf):
+        doc = PdfParser.parse(sample_pdf)
+        text = " ".join(e.text for e in doc.elements)
+        positions = [text.index(f"Page {i} first paragraph") for i in range(7)]
+        assert positions == sorted(positions)
+
+    def test_invalid_file(self, tmp_path):
+        bad = tmp_path / "bad.pdf"
+        bad.write_text("not a pdf")
+        with pytest.raises(ParseError):
+            PdfParser.parse(bad)
+
+
+class TestParallel:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 16])
+    def test_matches_serial(self, sample_pdf, chunk_size):
+        serial = PdfParser.parse(sample_pdf)
+        parallel = PdfParser.parse(sample_pdf, workers=2, chunk_size=chunk_size)
+        assert parallel.elements == serial.elements
+        assert parallel.metadata == serial.metadata
+
+    def test_invalid_options(self, sample_pdf):
+        with pytest.raises(ValueError):
+            PdfParser.parse(sample_pdf, workers=0)
+        with pytest.raises(ValueError):
+            PdfParser.parse(sample_pdf, chunk_size=0)
+
+
+class TestPageSelection:
+    def test_pages(self, sample_pdf):
+        doc = PdfParser.parse(sample_pdf, pages=[4, 1])
+        text = " ".join(e.text for e in doc.elements)
+        assert text.index("Page 4") < text.index("Page 1")
+        assert "Page 0" not in text
+
+    def test_max_pages(self, sample_pdf):
+        doc = PdfParser.parse(sample_pdf, max_pages=2)
+        text = " ".join(e.text for e in doc.elements)
+        assert "Page 1" in text
+        assert "Page 2" not in text
+
+    def test_parallel_selection_matches_serial(self, sample_pdf):
+        serial = PdfParser.parse(sample_pdf, pages=range(1, 7), max_pages=5)
+        parallel = PdfParser.parse(
+            sample_pdf, pages=range(1, 7), max_pages=5, workers=2, chunk_size=2
+        )
+        assert parallel.elements == serial.elements
+
+    def test_out_of_range(self, sample_pdf):
+        with pytest.raises(ValueError):
+            PdfParser.parse(sample_pdf, pages=[7])
+        with pytest.raises(ValueError):
+            PdfParser.parse(sample_pdf, max_pages=-1)
+
+
+class TestIterPages:
+    def test_fragments_match_parse(self, sample_pdf):
+        fragments = list(PdfParser.iter_pages(sample_pdf))
+        assert [f.metadata.extra["page"] for f in fragments] == [
+            str(i) for i in range(7)
+        ]
+        merged = [e for f in fragments for e in f.elements]
+        assert merged == PdfParser.parse(sample_pdf).elements
+
+    def test_lazy(self, sample_pdf):
+        pages = PdfParser.iter_pages(sample_pdf)
+        first = next(pages)
+        assert first.metadata.extra["page"] == "0"
+        assert "Page 0" in first.elements[0].text
+        pages.close()
+
+    def test_iter_elements(self, sample_pdf):
+        elements = list(PdfParser.iter_elements(sample_pdf, pages=[3], max_pages=1))
+        assert elements == PdfParser.parse(sample_pdf, pages=[3]).elements
+
+    def test_invalid_file(self, tmp_path):
+        bad = tmp_path / "bad.pdf"
+        bad.write_text("not a pdf")
+        with pytest.raises(ParseError):
+            next(PdfParser.iter_pages(bad))
+
+
+class TestDictMode:
+    def test_heading_levels_from_font_sizes(self, structured_pdf):
+        doc = PdfParser.parse(structured_pdf, mode="dict")
+        levels = {e.text: e.heading_level for e in doc.elements}
+        assert levels["Chapter 0"] == 1
+        assert levels["Section 3"] == 2
+        assert levels["Body text 2.1 goes here"] == 0
+
+    def test_block_order(self, structured_pdf):
+        doc = PdfParser.parse(structured_pdf, mode="dict", pages=[1])
+        assert [e.text for e in doc.elements[:3]] == [
+            "Chapter 1",
+            "Section 1",
+            "Body text 1.0 goes here",
+        ]
+
+    def test_parallel_matches_serial(self, structured_pdf):
+        serial = PdfParser.parse(structured_pdf, mode="dict")
+        parallel = PdfParser.parse(structured_pdf, mode="dict", workers=2, chunk_size=2)
+        assert parallel.elements == serial.elements
+
+    def test_uniform_size_has_no_headings(self, sample_pdf):
+        doc = PdfParser.parse(sample_pdf, mode="dict")
+        assert doc.elements
+        assert all(e.heading_level == 0 for e in doc.elements)
+
+    def test_invalid_mode(self, sample_pdf):
+        with pytest.raises(ValueError):
+            PdfParser.parse(sample_pdf, mode="html")
+
+
+class TestOcr:
+    def test_content_hash(self, scanned_pdf):
+        with fitz.open(scanned_pdf) as doc:
+            hashes = [pdf_ocr.page_content_hash(doc, i) for i in range(5)]
+        assert hashes[0] == hashes[3]
+        assert hashes[0] != hashes[2]
+
+    def test_off_by_default(self, scanned_pdf, fake_ocr):
+        doc = PdfParser.parse(scanned_pdf)
+        assert [e.text for e in doc.elements] == ["Text page 1", "Text page 4"]
+        assert not fake_ocr
+
+    def test_fills_image_only_pages(self, scanned_pdf, fake_ocr):
+        doc = PdfParser.parse(scanned_pdf, ocr=True, ocr_dpi=150, ocr_lang="eng")
+        assert [e.text for e in doc.elements] == [
+            "Scanned 0",
+            "second block",
+            "Text page 1",
+            "Scanned 2",
+            "second block",
+            "Scanned 0",
+            "second block",
+            "Text page 4",
+        ]
+        # page 3 duplicates page 0 and is recognized once
+        assert fake_ocr == [(0, 150, "eng"), (2, 150, "eng")]
+        assert doc.metadata.extra["ocr_pages"] == "3"
+
+    def test_dict_mode(self, scanned_pdf, fake_ocr):
+        doc = PdfParser.parse(scanned_pdf, mode="dict", ocr=True)
+        assert doc.elements[0].text == "Scanned 0"
+        assert all(e.heading_level == 0 for e in doc.elements)
+
+    def test_cache_hit_skips_ocr(self, scanned_pdf, fake_ocr, tmp_path):
+        cache = pdf_ocr.OcrCache(tmp_path / "cache")
+        with fitz.open(scanned_pdf) as doc:
+            key = pdf_ocr.page_content_hash(doc, 0)
+        name = pdf_ocr.OcrCache.text_name(key, 300, "kor+eng")
+        cache.store(name, b"From cache")
+
+        doc = PdfParser.parse(scanned_pdf, ocr=True, ocr_cache=cache.directory)
+        assert doc.elements[0].text == "From cache"
+        assert fake_ocr == [(2, 300, "kor+eng")]
+
+    def test_serial_renders_from_open_document(
+        self, scanned_pdf, fake_ocr, monkeypatch
+    ):
+        def reopen(*args):
+            raise AssertionError("serial OCR must not reopen the PDF")
+
+        monkeypatch.setattr(pdf_ocr, "_render_from_path", reopen)
+        doc = PdfParser.parse(scanned_pdf, ocr=True)
+        assert doc.elements[0].text == "Scanned 0"
+        assert fake_ocr == [(0, 300, "kor+eng"), (2, 300, "kor+eng")]
+
+    def test_cache_roundtrip(self, tmp_path):
+        cache = pdf_ocr.OcrCache(tmp_path / "cache")
+        assert cache.load("missing.txt") is None
+        cache.store("page.png", b"png")
+        assert cache.load("page.png") == b"png"
+        assert [p.name for p in cache.directory.iterdir()] == ["page.png"]
+
+    def test_missing_dependency(self, scanned_pdf, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pytesseract", None)
+        with pytest.raises(ParseError, match=r"\[ocr\]"):
+            PdfParser.parse(scanned_pdf, ocr=True)
+
+    def test_invalid_dpi(self, scanned_pdf):
+        with pytest.raises(ValueError):
+            PdfParser.parse(scanned_pdf, ocr=True, ocr_dpi=0)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+
 import pytest
 
 from ureca_document_parser.models import Document, Metadata, Paragraph
@@ -52,6 +54,52 @@ class TestFormatRegistry:
         doc = Document()
         assert registry.write(doc, "fake") == "fake output"
 
+    def test_write_to_uses_streaming_writer(self):
+        registry = FormatRegistry()
+
+        class FakeWriter:
+            @staticmethod
+            def format_name() -> str:
+                return "fake"
+
+            @staticmethod
+            def file_extension() -> str:
+                return ".fk"
+
+            @staticmethod
+            def write(doc: Document) -> str:
+                raise AssertionError("write_to should be used")
+
+            @staticmethod
+            def write_to(doc: Document, stream) -> None:
+                stream.write("streamed")
+
+        registry.register_writer(FakeWriter)
+        stream = io.StringIO()
+        registry.write_to(Document(), "fake", stream)
+        assert stream.getvalue() == "streamed"
+
+    def test_write_to_falls_back_to_write(self):
+        registry = FormatRegistry()
+
+        class FakeWriter:
+            @staticmethod
+            def format_name() -> str:
+                return "fake"
+
+            @staticmethod
+            def file_extension() -> str:
+                return ".fk"
+
+            @staticmethod
+            def write(doc: Document) -> str:
+                return "fake output"
+
+        registry.register_writer(FakeWriter)
+        stream = io.StringIO()
+        registry.write_to(Document(), "fake", stream)
+        assert stream.getvalue() == "fake output"
+
     def test_unsupported_extension_raises(self):
         registry = FormatRegistry()
         with pytest.raises(ValueError, match="지원하지 않는 파일 형식"):
@@ -61,6 +109,8 @@ class TestFormatRegistry:
         registry = FormatRegistry()
         with pytest.raises(ValueError, match="지원하지 않는 출력 형식"):
             registry.write(Document(), "nonexistent")
+        with pytest.raises(ValueError, match="지원하지 않는 출력 형식"):
+            registry.write_to(Document(), "nonexistent", io.StringIO())
 
     def test_supported_extensions(self):
         registry = FormatRegistry()
@@ -0,0 +1,34 @@
+"""Tests for ureca_document_parser.styles."""
+
+from __future__ import annotations
+
+import pytest
+
+from ureca_document_parser.styles import heading_level_from_style
+
+
+class TestHeadingLevelFromStyle:
+    @pytest.mark.parametrize(
+        ("name", "level"),
+        [
+            ("Outline 1", 0),
+            ("Outline3", 3),
+            ("개요 2", 2),
+            ("바탕글", 0),
+            ("", 0),
+            ("Title", 1),
+            ("Subtitle", 2),
+            ("부제목", 2),
+            ("제목 1", 1),
+        ],
+    )
+    def test_levels(self, name, level):
+        assert heading_level_from_style(name) == level
+
+    def test_pattern_order_wins_over_position(self):
+        # "title"이 앞에 있어도 먼저 정의된 "outline3" 패턴이 우선
+        assert heading_level_from_style("title outline3") == 3
+
+    def test_overlapping_patterns(self):
+        # "subtitle" 안의 "title"보다 "subtitle" 패턴이 우선
+        assert heading_level_from_style("my subtitle") == 2